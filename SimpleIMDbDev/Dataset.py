@@ -0,0 +1,433 @@
+"""Offline backend answering lookups from IMDb TSV dumps, https://developer.imdb.com/non-commercial-datasets/
+The dumps are ingested once into a SQLite database keyed by the numeric part of the IDs,
+lookups then return the same dict shapes as the `Rest` parser without any network access.
+Only `title.basics`, `title.ratings`, `name.basics` and `title.principals` are used,
+so the `akas` and `release_dates` subselections are not available.
+"""
+
+__all__ = [
+    "connect",
+    "ingest",
+    "getMovie",
+    "updateMovie",
+    "getPerson",
+    "updatePerson",
+    "searchMovie",
+]
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+
+from SimpleIMDbDev.cache import NotFound
+from SimpleIMDbDev.ids import format_id, parse_id
+
+DATASET_FILES = ["title.basics", "title.ratings", "name.basics", "title.principals"]
+SEARCH_LIMIT = 50
+BATCH_SIZE = 50_000
+NULL = "\\N"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    type TEXT,
+    primary_title TEXT,
+    original_title TEXT,
+    is_adult INTEGER,
+    start_year INTEGER,
+    end_year INTEGER,
+    runtime_minutes INTEGER,
+    genres TEXT,
+    aggregate_rating REAL,
+    votes_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS names (
+    id INTEGER PRIMARY KEY,
+    display_name TEXT,
+    birth_year INTEGER,
+    death_year INTEGER,
+    primary_professions TEXT,
+    known_for TEXT
+);
+CREATE TABLE IF NOT EXISTS principals (
+    title_id INTEGER,
+    ordering INTEGER,
+    name_id INTEGER,
+    category TEXT,
+    characters TEXT,
+    PRIMARY KEY (title_id, ordering)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS principals_name ON principals (name_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS title_search USING fts5 (
+    primary_title, original_title, content='titles', content_rowid='id'
+);
+"""
+
+_database = ""
+_local = threading.local()
+
+
+def connect(path: str) -> None:
+    """Sets the database used for lookups, typically created by `ingest`.
+    Each thread opens its own connection on first use.
+
+    Args:
+        path (str): The SQLite database.
+
+    Returns:
+        None: No return
+
+    Raises:
+        TypeError: When the path is not a string.
+        ValueError: When the database does not exist.
+    """
+    global _database
+    if not isinstance(path, str):
+        raise TypeError(f"The path must be a string, {type(path)} given.")
+    if not os.path.isfile(path):
+        raise ValueError(f"The dataset database '{path}' does not exist.")
+    _database = path
+    _local.__dict__.clear()
+
+
+def _connection() -> sqlite3.Connection:
+    if not _database:
+        raise ValueError("No dataset connected, call `Dataset.connect(path)` first.")
+    if getattr(_local, "database", "") != _database:
+        _local.connection = sqlite3.connect(f"file:{_database}?mode=ro", uri=True)
+        _local.connection.row_factory = sqlite3.Row
+        _local.database = _database
+    return _local.connection
+
+
+def _parse_id(id: int | str, prefix: str) -> int:
+    """Gets the numeric part of an ID, `tt###`/`nm###` or `###`."""
+    if not isinstance(id, str) and not isinstance(id, int):
+        raise TypeError(f"ID must be of type str or int, {type(id)} given.")
+    if not id:
+        raise ValueError("A valid ID must be provided.")
+    return parse_id(id, prefix)
+
+
+def _rows(path: str):
+    """Yields the split rows of a TSV dump, skipping the header. `\\N` becomes None."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="\n") as file:
+        next(file, None)
+        for line in file:
+            yield [None if field == NULL else field for field in line.rstrip("\n").split("\t")]
+
+
+def _int(value: str | None) -> int | None:
+    return int(value) if value else None
+
+
+def _insert(connection: sqlite3.Connection, sql: str, rows) -> int:
+    """Insert rows in batches, returns the number inserted."""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            connection.executemany(sql, batch)
+            count += len(batch)
+            batch.clear()
+    connection.executemany(sql, batch)
+    return count + len(batch)
+
+
+def ingest(directory: str, database: str) -> dict:
+    """Ingests IMDb TSV dumps into a SQLite database for `connect`.
+    Files are found by name, `title.basics.tsv` or `title.basics.tsv.gz` and so on, missing ones are skipped.
+    The files are streamed, re-ingesting replaces rows with the same ID.
+
+    Args:
+        directory (str): The folder holding the dumps.
+        database (str): The SQLite database to create or update.
+
+    Returns:
+        dict: The number of rows ingested per dump.
+
+    Raises:
+        TypeError: When an argument is not a string.
+        ValueError: When no dump was found in the directory.
+    """
+    if not isinstance(directory, str) or not isinstance(database, str):
+        raise TypeError("The directory and database must be strings.")
+    paths = {}
+    for name in DATASET_FILES:
+        for extension in [".tsv", ".tsv.gz"]:
+            path = os.path.join(directory, name + extension)
+            if os.path.isfile(path):
+                paths[name] = path
+    if not paths:
+        raise ValueError(f"No IMDb dumps found in '{directory}'.")
+    counts = dict.fromkeys(DATASET_FILES, 0)
+    connection = sqlite3.connect(database)
+    try:
+        connection.executescript(SCHEMA)
+        with connection:
+            if "title.basics" in paths:
+                counts["title.basics"] = _insert(
+                    connection,
+                    """INSERT INTO titles (id, type, primary_title, original_title, is_adult,
+                    start_year, end_year, runtime_minutes, genres) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET type = excluded.type, primary_title = excluded.primary_title,
+                    original_title = excluded.original_title, is_adult = excluded.is_adult,
+                    start_year = excluded.start_year, end_year = excluded.end_year,
+                    runtime_minutes = excluded.runtime_minutes, genres = excluded.genres""",
+                    (
+                        (int(row[0][2:]), row[1], row[2], row[3], _int(row[4]),
+                         _int(row[5]), _int(row[6]), _int(row[7]), row[8])
+                        for row in _rows(paths["title.basics"])
+                    ),
+                )  # fmt: skip
+            if "title.ratings" in paths:
+                counts["title.ratings"] = _insert(
+                    connection,
+                    """INSERT INTO titles (id, aggregate_rating, votes_count) VALUES (?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET aggregate_rating = excluded.aggregate_rating,
+                    votes_count = excluded.votes_count""",
+                    (
+                        (int(row[0][2:]), float(row[1]), int(row[2]))
+                        for row in _rows(paths["title.ratings"])
+                    ),
+                )
+            if "name.basics" in paths:
+                counts["name.basics"] = _insert(
+                    connection,
+                    "INSERT OR REPLACE INTO names VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (int(row[0][2:]), row[1], _int(row[2]), _int(row[3]), row[4], row[5])
+                        for row in _rows(paths["name.basics"])
+                    ),
+                )
+            if "title.principals" in paths:
+                counts["title.principals"] = _insert(
+                    connection,
+                    "INSERT OR REPLACE INTO principals VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (int(row[0][2:]), int(row[1]), int(row[2][2:]), row[3], row[5])
+                        for row in _rows(paths["title.principals"])
+                    ),
+                )
+            connection.execute("INSERT INTO title_search (title_search) VALUES ('rebuild')")
+    finally:
+        connection.close()
+    return counts
+
+
+def _title(row: sqlite3.Row) -> dict:
+    """Builds the `Rest` shaped dict of a title row, missing values are left out like the API does."""
+    title = {"id": format_id(row["id"], "tt")}
+    for field in ["type", "primary_title", "original_title", "start_year", "end_year", "runtime_minutes"]:
+        if row[field] is not None:
+            title[field] = row[field]
+    if row["is_adult"] is not None:
+        title["is_adult"] = bool(row["is_adult"])
+    if row["genres"]:
+        title["genres"] = row["genres"].split(",")
+    if row["aggregate_rating"] is not None:
+        title["rating"] = {
+            "aggregate_rating": row["aggregate_rating"],
+            "votes_count": row["votes_count"],
+        }
+    return title
+
+
+def _credit(row: sqlite3.Row, key: str, value: dict) -> dict:
+    credit = {key: value, "category": row["category"].upper()}
+    if row["characters"]:
+        credit["characters"] = json.loads(row["characters"])
+    return credit
+
+
+def getMovie(id: int | str = "", subselection: str = "") -> dict:
+    """Gets the movie information, subselection is for additional data.
+    To get both you must make two calls, one for the main movie dict and another via update.
+
+    Args:
+        id (int | str): The ID of the movie, tt### or ###.
+        subselection (str, optional): Only `credits` is available in the dataset.
+
+    Returns:
+        dict: The information found in the dataset.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values, or no dataset is connected.
+        NotImplementedError: When the subselection is not part of the dataset.
+        NotFound: When the ID is not in the dataset.
+    """
+    if not isinstance(subselection, str):
+        raise TypeError("The subselection must be a string.")
+    subselection = subselection.lower()
+    if subselection in ["akas", "release_dates"]:
+        raise NotImplementedError(f"The dataset has no '{subselection}'.")
+    if subselection and subselection != "credits":
+        raise ValueError("The subselection must be one of ['credits']")
+    title_id = _parse_id(id, "tt")
+    connection = _connection()
+    row = connection.execute("SELECT * FROM titles WHERE id = ?", (title_id,)).fetchone()
+    if row is None:
+        raise NotFound(f"{format_id(title_id, 'tt')} not found in the dataset.")
+    if not subselection:
+        return _title(row)
+    rows = connection.execute(
+        """SELECT p.*, n.display_name FROM principals p LEFT JOIN names n ON n.id = p.name_id
+        WHERE p.title_id = ? ORDER BY p.ordering""",
+        (title_id,),
+    )
+    credits = []
+    for credit in rows:
+        name = {"id": format_id(credit["name_id"], "nm")}
+        if credit["display_name"]:
+            name["display_name"] = credit["display_name"]
+        credits.append(_credit(credit, "name", name))
+    return {"credits": credits}
+
+
+def updateMovie(movie: dict, subselection: str = "") -> dict:
+    """Updates a movie object (dict) from the dataset.
+
+    Args:
+        movie (dict): The movie object, typically obtained by `getMovie(id)`
+        subselction (str): The data to update, only `credits` is available.
+
+    Returns:
+        dict: The updated movie.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values.
+        NotImplementedError: When the subselection is not part of the dataset.
+        NotFound: When the ID is not in the dataset.
+    """
+    if not isinstance(movie, dict):
+        raise TypeError(f"The movie object must be a dict, {type(movie)} passed.")
+    if not movie.get("id", ""):
+        raise ValueError("The ID of the movie was not found in the object.")
+    movie[subselection] = getMovie(movie["id"], subselection)[subselection]
+    return movie
+
+
+def getPerson(id: int | str = "", subselection: str = "") -> dict:
+    """Gets the person information, subselection is for additional data.
+    To get both you must make two calls, one for the main person dict and another via update.
+
+    Notes: The dataset only has birth and death years, the dates contain only `year`.
+
+    Args:
+        id (int | str): The ID of the person, nm### or ###.
+        subselection (str, optional): Only `known_for` is allowed.
+
+    Returns:
+        dict: The information found in the dataset.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values, or no dataset is connected.
+        NotFound: When the ID is not in the dataset.
+    """
+    if not isinstance(subselection, str):
+        raise TypeError("The subselection must be a string.")
+    subselection = subselection.lower()
+    if subselection and subselection != "known_for":
+        raise ValueError("The subselection must be one of ['known_for']")
+    person_id = _parse_id(id, "nm")
+    connection = _connection()
+    row = connection.execute("SELECT * FROM names WHERE id = ?", (person_id,)).fetchone()
+    if row is None:
+        raise NotFound(f"{format_id(person_id, 'nm')} not found in the dataset.")
+    if subselection:
+        title_ids = [int(title[2:]) for title in (row["known_for"] or "").split(",") if title]
+        known_for = []
+        for title_id in title_ids:
+            title = connection.execute("SELECT * FROM titles WHERE id = ?", (title_id,)).fetchone()
+            if title is None:
+                continue
+            credit = connection.execute(
+                "SELECT * FROM principals WHERE title_id = ? AND name_id = ? ORDER BY ordering",
+                (title_id, person_id),
+            ).fetchone()
+            if credit is None:
+                known_for.append({"title": _title(title)})
+            else:
+                known_for.append(_credit(credit, "title", _title(title)))
+        return {"known_for": known_for}
+    person = {"id": format_id(person_id, "nm")}
+    if row["display_name"]:
+        person["display_name"] = row["display_name"]
+    if row["primary_professions"]:
+        person["primary_professions"] = row["primary_professions"].split(",")
+    if row["birth_year"] is not None:
+        person["birth_date"] = {"year": row["birth_year"]}
+    if row["death_year"] is not None:
+        person["death_date"] = {"year": row["death_year"]}
+    return person
+
+
+def updatePerson(person: dict, subselection: str = "") -> dict:
+    """Updates a person object (dict) from the dataset.
+
+    Args:
+        person (dict): The person object, typically obtained by `getPerson(id)`
+        subselction (str): The data to update, only `known_for` is allowed.
+
+    Returns:
+        dict: The updated person.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID is not in the dataset.
+    """
+    if not isinstance(person, dict):
+        raise TypeError(f"The person object must be a dict, {type(person)} passed.")
+    if not person.get("id", ""):
+        raise ValueError("The ID of the person was not found in the object.")
+    if not subselection:
+        raise ValueError("A subselection is required.")
+    person[subselection] = getPerson(person["id"], subselection)[subselection]
+    return person
+
+
+def searchMovie(query: str, year: int = 0, max_year_difference: int = 2) -> list[dict]:
+    """Search for a movie by its primary or original title, most voted first.
+    Allows for passing a year to filter.
+
+    Args:
+        query (str): Any query to search, typically the title.
+        year (int, optional): A year to filter the results, cannot be negative.
+        max_year_difference (int, optional): To filter the results, a difference of 0 passed means exact.
+            Negative means no filtering is being done.
+            Default of 2.
+
+    Returns:
+        list[dict]: Up to `SEARCH_LIMIT` results.
+
+    Raises:
+        TypeError: When an argument is of the incorrec type.
+        ValueError: When the value of an argument is invalid, or no dataset is connected.
+    """
+    if not isinstance(query, str):
+        raise TypeError(f"The query must be a string, {type(query)} passed.")
+    if not isinstance(year, int) or not isinstance(max_year_difference, int):
+        raise TypeError("The year and max_year_difference must be of type int.")
+    if not query.strip():
+        raise ValueError("The query cannot be blank.")
+    if year < 0:
+        raise ValueError(f"The year cannot be less than 0, {year} given.")
+    # Quote every word so the query is matched as plain text, not FTS syntax.
+    match = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+    sql = """SELECT titles.* FROM title_search JOIN titles ON titles.id = title_search.rowid
+    WHERE title_search MATCH ?"""
+    params: list = [match]
+    if year and max_year_difference >= 0:
+        sql += " AND titles.start_year BETWEEN ? AND ?"
+        params += [year - max_year_difference, year + max_year_difference]
+    sql += " ORDER BY titles.votes_count IS NULL, titles.votes_count DESC LIMIT ?"
+    params.append(SEARCH_LIMIT)
+    return [_title(row) for row in _connection().execute(sql, params)]
@@ -1,10 +1,14 @@
 __all__ = ["getMovie", "getPerson"]
 
-import requests
 from functools import lru_cache
+import json
 import re
 
-from SimpleIMDbDev.constants import BASE_HEADERS
+from SimpleIMDbDev import transport
+from SimpleIMDbDev.cache import CACHE, CacheEntry, NotFound
+from SimpleIMDbDev.constants import base_headers
+from SimpleIMDbDev.ids import format_id, normalize_id
+from SimpleIMDbDev.metrics import METRICS
 
 """This is a work in progress GraohQL implementation provided by data from https://imdbapi.dev/docs/graphql/quickstart
 It does not currently work with TV episodes.
@@ -12,6 +16,8 @@ Can fetch movie by ID and person by ID.
 """
 
 API_ENDPOINT = "https://graph.imdbapi.dev/v1"
+# Error messages and extension codes the API replies with for IDs that do not exist.
+NOT_FOUND_ERRORS = {"NOT_FOUND", "UNSUPPORT_TYPE", "DISPLAY_NAME_REQURIRED"}
 REQUIRED = True
 MAIN_ATTRIBUTE = True
 
@@ -58,7 +64,7 @@ class IMDbGraphQL:
         def __init__(self, **kwargs: dict):
             id = kwargs.get("id", "")
             if isinstance(id, int):
-                id = "tt" + str(id).rjust(7, "0")
+                id = format_id(id, "tt")
             kwargs["id"] = id  # type: ignore
             check_kwargs(self, self.SCHEMA, kwargs)
             self.__dict__ = todict(self)  # type: ignore
@@ -109,7 +115,7 @@ class IMDbGraphQL:
         def __init__(self, **kwargs: dict):
             id = kwargs.get("id", "")
             if isinstance(id, int):
-                id = "nm" + str(id).rjust(7, "0")
+                id = format_id(id, "nm")
             kwargs["id"] = id  # type: ignore
             check_kwargs(self, self.SCHEMA, kwargs)
             self.__dict__ = todict(self)  # type: ignore
@@ -448,18 +454,31 @@ class IMDbGraphQL:
             self.__dict__[key] = value
 
 
-IMDbGraphQLTypes = {
-    "IMDbGraphQL.Title": IMDbGraphQL.Title,
-    "IMDbGraphQL.Name": IMDbGraphQL.Name,
-    "IMDbGraphQL.Rating": IMDbGraphQL.Rating,
-    "IMDbGraphQL.Certificate": IMDbGraphQL.Certificate,
-    "IMDbGraphQL.Language": IMDbGraphQL.Language,
-    "IMDbGraphQL.Country": IMDbGraphQL.Country,
-    "IMDbGraphQL.CriticReview": IMDbGraphQL.CriticReview,
-    "IMDbGraphQL.Credit": IMDbGraphQL.Credit,
-    "IMDbGraphQL.Poster": IMDbGraphQL.Poster,
-    "IMDbGraphQL.Avatar": IMDbGraphQL.Avatar,
-}
+@lru_cache(maxsize=None)
+def _types() -> dict[str, type]:
+    """The registry of the internal types referenced by name in the schemas, built on first use.
+
+    Returns:
+        dict[str, type]: The types keyed by their `IMDbGraphQL.<Class>` name.
+    """
+    return {
+        "IMDbGraphQL.Title": IMDbGraphQL.Title,
+        "IMDbGraphQL.Name": IMDbGraphQL.Name,
+        "IMDbGraphQL.Rating": IMDbGraphQL.Rating,
+        "IMDbGraphQL.Certificate": IMDbGraphQL.Certificate,
+        "IMDbGraphQL.Language": IMDbGraphQL.Language,
+        "IMDbGraphQL.Country": IMDbGraphQL.Country,
+        "IMDbGraphQL.CriticReview": IMDbGraphQL.CriticReview,
+        "IMDbGraphQL.Credit": IMDbGraphQL.Credit,
+        "IMDbGraphQL.Poster": IMDbGraphQL.Poster,
+        "IMDbGraphQL.Avatar": IMDbGraphQL.Avatar,
+    }
+
+
+def __getattr__(name: str):
+    if name == "IMDbGraphQLTypes":
+        return _types()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def todict(obj, classkey=None) -> dict | list:
@@ -532,7 +551,7 @@ def check_kwargs(
         if value is None:
             continue
         if isinstance(field_type, str):
-            field_type = IMDbGraphQLTypes.get(field_type)
+            field_type = _types().get(field_type)
             if not field_type:
                 raise TypeError(
                     f"Field '{field}' was given an invalid type, {field_type}."
@@ -546,9 +565,9 @@ def check_kwargs(
                 raise TypeError(f"Field '{field}' must be itterable.")
             list_type = field_type[1]
             if isinstance(list_type, str) and isinstance(value, list):
-                setattr(obj, field, [IMDbGraphQLTypes[list_type](**v) for v in value])
+                setattr(obj, field, [_types()[list_type](**v) for v in value])
             elif isinstance(list_type, str):
-                setattr(obj, field, IMDbGraphQLTypes[list_type](**value))
+                setattr(obj, field, _types()[list_type](**value))
             elif value and any(not isinstance(v, list_type) for v in value):
                 raise TypeError(
                     f"Field '{field}' must be of type {field_type[1].__name__}."
@@ -580,24 +599,181 @@ def get_attribute_main_query(schema: dict, all: bool = True) -> str:
         field_type, required, main = schema[field_name]
         if not (all or main):
             continue
-        if isinstance(field_type, tuple) and not IMDbGraphQLTypes.get(field_type[1]):
+        if isinstance(field_type, tuple) and not _types().get(field_type[1]):
             query = f"{query}\n{field_name}"
-        elif isinstance(field_type, tuple) and IMDbGraphQLTypes.get(field_type[1]):
-            field_schema = IMDbGraphQLTypes.get(field_type[1]).SCHEMA  # type: ignore
+        elif isinstance(field_type, tuple) and _types().get(field_type[1]):
+            field_schema = _types().get(field_type[1]).SCHEMA  # type: ignore
             query = f"{query}\n{field_name} {{{get_attribute_main_query(field_schema, False)}\n}}\n"
         elif isinstance(field_type, str):
-            field_schema = IMDbGraphQLTypes.get(field_type).SCHEMA  # type: ignore
+            field_schema = _types().get(field_type).SCHEMA  # type: ignore
             query = f"{query}\n{field_name} {{{get_attribute_main_query(field_schema, False)}\n}}\n"
         else:
             query = f"{query}\n{field_name}"
     return query
 
 
-@lru_cache(maxsize=None)
+class GraphQLError(ValueError):
+    """The API replied with errors other than a missing ID, such as schema, rate limit or server errors."""
+
+
+def _is_not_found(error: dict) -> bool:
+    """Whether a GraphQL error says the ID does not exist, by its message or `extensions.code`."""
+    if not isinstance(error, dict):
+        return False
+    values = [error.get("message"), (error.get("extensions") or {}).get("code")]
+    return any(isinstance(value, str) and value.strip().upper() in NOT_FOUND_ERRORS for value in values)
+
+
+def _result(response_json: dict, field: str, response=None) -> dict:
+    """The result of a reply, raising its errors.
+    Only errors saying the ID does not exist raise `NotFound`, which is cached,
+    others such as schema, rate limit or server errors raise `GraphQLError`."""
+    errors = response_json.get("errors", [])
+    if errors and not (response_json.get("data") or {}).get(field) and all(map(_is_not_found, errors)):
+        raise NotFound(errors, response=response)
+    if errors:
+        raise GraphQLError(errors)
+    return response_json["data"][field]
+
+
+def _post(query: str, field: str):
+    endpoint = f"graphql.{field}"
+    response = transport.request(
+        "POST", API_ENDPOINT, endpoint, json={"query": query}, headers=base_headers()
+    )
+    response.raise_for_status()
+    return response
+
+
+def _fetch(query: str, field: str) -> CacheEntry:
+    """Post a query into a cache entry.
+    GraphQL replies carry no validators, an expired entry is always fetched again.
+
+    Args:
+        query (str): The GraphQL query.
+        field (str): The field of `data` holding the result.
+
+    Returns:
+        CacheEntry: The new entry.
+
+    Raises:
+        NotFound: When the API replied that the ID does not exist, with no data for the field.
+        GraphQLError: When the API replied with errors other than a missing ID, a ValueError.
+        HTTPError: Any lookup errors or connection issues.
+    """
+    response = _post(query, field)
+    response_json = transport.decode(response, f"graphql.{field}")
+    return CacheEntry(_result(response_json, field, response))
+
+
+async def _afetch(query: str, field: str) -> CacheEntry:
+    """`_fetch` as a coroutine, over `transport.arequest`."""
+    endpoint = f"graphql.{field}"
+    response = await transport.arequest(
+        "POST", API_ENDPOINT, endpoint, json={"query": query}, headers=base_headers()
+    )
+    response.raise_for_status()
+    response_json = transport.decode(response, endpoint)
+    return CacheEntry(_result(response_json, field, response))
+
+
+def _query_id(id: int | str, prefix: str) -> str:
+    return normalize_id(id, prefix)
+
+
+def _key(field: str, id: int | str) -> str:
+    """The cache key of a title or name lookup.
+
+    Raises:
+        TypeError: When the ID is not a str or int.
+        ValueError: When the ID is invalid.
+    """
+    return f"{API_ENDPOINT}/{field}/{_query_id(id, 'tt' if field == 'title' else 'nm')}"
+
+
+# The query name and object type of each top level field.
+_FIELDS = {"title": ("titleById", "Title"), "name": ("personById", "Name")}
+
+
+def _query(field: str, query_id: str) -> str:
+    """The query for a title or name by ID, on one line."""
+    name, type_name = _FIELDS[field]
+    attributes = get_attribute_main_query(getattr(IMDbGraphQL, type_name).SCHEMA)
+    query = """query {name}
+    {{
+        {field}(id: "{query_id}") {{
+            {attributes}
+        }}
+    }}
+    """.format(
+        name=name, field=field, query_id=query_id, attributes=attributes
+    )
+    return re.sub(" +", " ", query.replace("\n", " ")).strip()
+
+
+def _build(field: str, value: dict) -> dict:
+    """Build the object for a result and flatten it, as `IMDbAPI` returns it. Runs in the process pool."""
+    from SimpleIMDbDev import flatten
+
+    return flatten(getattr(IMDbGraphQL, _FIELDS[field][1])(**value).as_dict())
+
+
+def _build_text(field: str, text: str) -> dict:
+    """Decode a cached result and build its object. Runs in the process pool."""
+    return _build(field, json.loads(text))
+
+
+def _decode_reply(field: str, body: bytes) -> tuple[str, dict]:
+    """Decode a raw reply and build its object. Runs in the process pool.
+
+    Returns:
+        tuple[str, dict]: The result as JSON text for the cache, and the flattened object.
+    """
+    value = _result(json.loads(body), field)
+    return json.dumps(value), _build(field, value)
+
+
+def _pooled(pool, field: str, id: int | str) -> dict:
+    """Look up a title or name, with the decoding and object construction done by a process pool.
+    The request and cache stay in this process, the pool is handed the raw reply or the cached JSON text.
+    Background refreshes of the cache run after the pool may be shut down, they decode in this process.
+
+    Args:
+        pool (concurrent.futures.ProcessPoolExecutor): The pool.
+        field (str): `title` or `name`.
+        id (int | str): The ID.
+
+    Returns:
+        dict: The flattened object, as `IMDbAPI.getMovie`/`getPerson` return it.
+    """
+    query_id = _query_id(id, "tt" if field == "title" else "nm")
+    built = []
+
+    def load(entry: CacheEntry | None) -> CacheEntry:
+        response = _post(_query(field, query_id), field)
+        text, flattened = pool.submit(_decode_reply, field, response.content).result()
+        built.append(flattened)
+        # Kept as text, only decoded if this process reads it from the cache.
+        new_entry = CacheEntry(None)
+        new_entry.raw = text
+        return new_entry
+
+    def refresh(entry: CacheEntry | None) -> CacheEntry:
+        return _fetch(_query(field, query_id), field)
+
+    value = CACHE.get_or_load(_key(field, query_id), load, f"graphql.{field}", refresh, raw=True)
+    if built:
+        return built[0]
+    if isinstance(value, str):
+        return pool.submit(_build_text, field, value).result()
+    return pool.submit(_build, field, value).result()
+
+
 def getMovie(id: int | str = "") -> IMDbGraphQL.Title:
     """Gets the movie information.
 
     Note: TV Episodes do not work.
+    Note: Responses are kept in `cache.CACHE`, a new object is built from them on each call.
 
     Args:
         id (int | str): The ID of the movie, tt### or ###.
@@ -608,38 +784,27 @@ def getMovie(id: int | str = "") -> IMDbGraphQL.Title:
     Raises:
         TypeError: When an agrument is not of the correct type.
         ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID does not exist, cached for `CACHE.negative_ttl`.
         HTTPError: Any lookup errors or connection issues.
     """
-    if not isinstance(id, str) and not isinstance(id, int):
-        raise TypeError(f"ID must be of type str or int, {type(id)} given.")
-    query_id = "tt" + str(id).replace("tt", "").rjust(7, "0")
-    if not re.fullmatch(r"tt\d{7}", query_id):
-        raise ValueError("A valid ID must be provided, form tt#######.")
-    attributes = get_attribute_main_query(IMDbGraphQL.Title.SCHEMA)
-    query = """query titleById
-    {{
-        title(id: "{query_id}") {{
-            {attributes}
-        }}
-    }}
-    """.format(
-        query_id=query_id, attributes=attributes
+    query_id = _query_id(id, "tt")
+
+    def load(entry: CacheEntry | None) -> CacheEntry:
+        return _fetch(_query("title", query_id), "title")
+
+    response_json = CACHE.get_or_load(
+        _key("title", query_id), load, "graphql.title"
     )
-    query = re.sub(" +", " ", query.replace(f"\n", " ")).strip()
-    response = requests.post(API_ENDPOINT, json={"query": query}, headers=BASE_HEADERS)
-    response.raise_for_status()
-    response_json = response.json()
-    if errors := response_json.get("errors", []):
-        raise ValueError(errors)
-    response_json = response_json["data"]["title"]
-    movie = IMDbGraphQL.Title(**response_json)
+    with METRICS.timer("graphql.title", "validate"):
+        movie = IMDbGraphQL.Title(**response_json)
     return movie
 
 
-@lru_cache(maxsize=None)
 def getPerson(id: str | int) -> IMDbGraphQL.Name:
     """Gets the person information.
 
+    Note: Responses are kept in `cache.CACHE`, a new object is built from them on each call.
+
     Args:
         id (int | str): The ID of the person, nm### or ###.
 
@@ -649,29 +814,17 @@ def getPerson(id: str | int) -> IMDbGraphQL.Name:
     Raises:
         TypeError: When an agrument is not of the correct type.
         ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID does not exist, cached for `CACHE.negative_ttl`.
         HTTPError: Any lookup errors or connection issues.
     """
-    if not isinstance(id, str) and not isinstance(id, int):
-        raise TypeError(f"ID must be of type str or int, {type(id)} given.")
-    query_id = "nm" + str(id).replace("nm", "").rjust(7, "0")
-    if not re.fullmatch(r"nm\d{7}", query_id):
-        raise ValueError("A valid ID must be provided, form nm#######.")
-    attributes = get_attribute_main_query(IMDbGraphQL.Name.SCHEMA)
-    query = """query personById
-    {{
-        name(id: "{query_id}") {{
-            {attributes}
-        }}
-    }}
-    """.format(
-        query_id=query_id, attributes=attributes
+    query_id = _query_id(id, "nm")
+
+    def load(entry: CacheEntry | None) -> CacheEntry:
+        return _fetch(_query("name", query_id), "name")
+
+    response_json = CACHE.get_or_load(
+        _key("name", query_id), load, "graphql.name"
     )
-    query = re.sub(" +", " ", query.replace(f"\n", " ")).strip()
-    response = requests.post(API_ENDPOINT, json={"query": query}, headers=BASE_HEADERS)
-    response.raise_for_status()
-    response_json = response.json()
-    if errors := response_json.get("errors", []):
-        raise ValueError(errors)
-    response_json = response.json()["data"]["name"]
-    person = IMDbGraphQL.Name(**response_json)
+    with METRICS.timer("graphql.name", "validate"):
+        person = IMDbGraphQL.Name(**response_json)
     return person
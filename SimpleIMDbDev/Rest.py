@@ -1,33 +1,111 @@
-__all__ = ["getMovie", "getPerson"]
+__all__ = [
+    "getMovie",
+    "getPerson",
+    "getSeasons",
+    "getEpisodes",
+    "streamMovie",
+    "searchMovie",
+    "filterSearchResults",
+    "rankSearchColumns",
+]
 
-import requests
-from functools import lru_cache
-import re
-from requests.exceptions import HTTPError
+from typing import Iterator
+from urllib.parse import urlencode
 
-from SimpleIMDbDev.constants import BASE_HEADERS
+from SimpleIMDbDev import jsonstream, transport
+from SimpleIMDbDev.cache import CACHE, CacheEntry, NotFound
+from SimpleIMDbDev.constants import base_headers
+from SimpleIMDbDev.ids import normalize_id
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 BASE_URL = "https://rest.imdbapi.dev"
 
 
-@lru_cache(maxsize=None)
-def getMovie(id: int | str = "", subselection: str = "") -> dict:
-    """Gets the movie information, subselection is for additional data.
-    To get both you must make two calls, one for the main movie dict and another via update.
+def _fetch(
+    url: str, endpoint: str, entry: CacheEntry | None = None, person_id: str = ""
+) -> CacheEntry:
+    """Fetch a URL into a cache entry, revalidating the given entry if there is one.
+    Used as the loader for `CACHE`, the `ETag`/`Last-Modified` validators are kept on the entry.
 
     Args:
-        id (int | str): The ID of the movie, tt### or ###.
-        subselection (str, optional): Typically called via update, the additional data to grab.
+        url (str): The URL to fetch.
+        endpoint (str): The endpoint label for the metrics.
+        entry (CacheEntry | None, optional): An expired entry to revalidate.
+        person_id (str, optional): For person lookups, a reply of only this ID means not found.
 
     Returns:
-        dict: The information gathered from the query.
+        CacheEntry: The new entry, or the given entry when the API replied `304 Not Modified`.
+
+    Raises:
+        NotFound: When the API replied `404 Not Found` or with an empty person.
+        HTTPError: Any lookup errors or connection issues.
+    """
+    response = transport.request("GET", url, endpoint, headers=_headers(entry))
+    return _entry(response, url, endpoint, entry, person_id)
+
+
+async def _afetch(
+    url: str, endpoint: str, entry: CacheEntry | None = None, person_id: str = ""
+) -> CacheEntry:
+    """`_fetch` as a coroutine, over `transport.arequest`."""
+    response = await transport.arequest("GET", url, endpoint, headers=_headers(entry))
+    return _entry(response, url, endpoint, entry, person_id)
+
+
+def _headers(entry: CacheEntry | None) -> dict[str, str]:
+    """The request headers, with the validators of the entry to revalidate."""
+    if entry is not None and entry.validators():
+        return {**base_headers(), **entry.validators()}
+    return base_headers()
+
+
+def _entry(response, url: str, endpoint: str, entry: CacheEntry | None, person_id: str) -> CacheEntry:
+    """The cache entry of a reply, see `_fetch`."""
+    if entry is not None and response.status_code == 304:
+        return entry
+    if response.status_code == 404:
+        raise NotFound(f"{url} not found.", response=response)
+    response.raise_for_status()
+    response_json = transport.decode(response, endpoint)
+    if person_id and (not response_json or response_json == {"id": person_id}):
+        # As of now it returns a 200 response with only the ID passed back.
+        # Subselections return an empty json
+        response.status_code = 404  # Manually update status code.
+        raise NotFound("PersonID not found.", response=response)
+    return CacheEntry(
+        response_json,
+        etag=response.headers.get("ETag", ""),
+        last_modified=response.headers.get("Last-Modified", ""),
+    )
+
+
+def _key(field: str, id: int | str) -> str:
+    """The cache key of a title or name lookup without subselection.
+
+    Raises:
+        TypeError: When the ID is not a str or int.
+        ValueError: When the ID is invalid.
+    """
+    prefix, path = ("tt", "titles") if field == "title" else ("nm", "names")
+    return f"{BASE_URL}/v2/{path}/{normalize_id(id, prefix)}"
+
+
+# The subselections of titles and names.
+SUBSELECTIONS = {"title": ["akas", "credits", "release_dates"], "name": ["known_for"]}
+
+
+def _url(field: str, id: int | str, subselection: str) -> str:
+    """The URL of a title or name lookup, with an optional subselection.
 
     Raises:
         TypeError: When an agrument is not of the correct type.
         ValueError: When an argument was of the correct type, but invalid values.
-        HTTPError: Any lookup errors or connection issues.
     """
-    allowed_subselection = ["akas", "credits", "release_dates"]
+    allowed_subselection = SUBSELECTIONS[field]
     if not isinstance(id, str) and not isinstance(id, int):
         raise TypeError(f"ID must be of type str or int, {type(id)} given.")
     if not id:
@@ -37,17 +115,139 @@ def getMovie(id: int | str = "", subselection: str = "") -> dict:
     subselection = subselection.lower()
     if subselection and subselection not in allowed_subselection:
         raise ValueError(f"The subselection must be one of {allowed_subselection}")
-    title_id = "tt" + str(id).replace("tt", "").rjust(7, "0")
-    if not re.fullmatch(r"tt\d{7}", title_id):
-        raise ValueError("A valid ID must be provided, form tt#######.")
-    if subselection:
-        url = f"{BASE_URL}/v2/titles/{title_id}/{subselection}"
-    else:
-        url = f"{BASE_URL}/v2/titles/{title_id}"
-    response = requests.get(url, headers=BASE_HEADERS)
-    response.raise_for_status()
-    response_json = response.json()
-    return response_json
+    url = _key(field, id)
+    return f"{url}/{subselection}" if subselection else url
+
+
+def getMovie(id: int | str = "", subselection: str = "") -> dict:
+    """Gets the movie information, subselection is for additional data.
+    To get both you must make two calls, one for the main movie dict and another via update.
+
+    Note: Responses are kept in `cache.CACHE`, expired entries are revalidated with a conditional request.
+
+    Args:
+        id (int | str): The ID of the movie, tt### or ###.
+        subselection (str, optional): Typically called via update, the additional data to grab.
+
+    Returns:
+        dict: The information gathered from the query.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID does not exist, cached for `CACHE.negative_ttl`.
+        HTTPError: Any lookup errors or connection issues.
+    """
+    url = _url("title", id, subselection)
+    return CACHE.get_or_load(
+        url, lambda entry: _fetch(url, "rest.titles", entry), "rest.titles"
+    )
+
+
+def getSeasons(id: int | str) -> list[dict]:
+    """Gets the seasons of a series.
+
+    Note: Responses are kept in `cache.CACHE`, expired entries are revalidated with a conditional request.
+
+    Args:
+        id (int | str): The ID of the series, tt### or ###.
+
+    Returns:
+        list[dict]: The seasons in order, with their `season` name and `episode_count`.
+
+    Raises:
+        TypeError: When the ID is not of the correct type.
+        ValueError: When the ID is invalid.
+        NotFound: When the series does not exist, cached for `CACHE.negative_ttl`.
+        HTTPError: Any lookup errors or connection issues.
+    """
+    url = f"{_key('title', id)}/seasons"
+    response_json = CACHE.get_or_load(
+        url, lambda entry: _fetch(url, "rest.seasons", entry), "rest.seasons"
+    )
+    return response_json.get("seasons", [])
+
+
+def getEpisodes(id: int | str, season: str) -> list[dict]:
+    """Gets the episodes of a season of a series, following every page of the listing.
+
+    Note: Each page is kept in `cache.CACHE`, expired pages are revalidated with a conditional request.
+
+    Args:
+        id (int | str): The ID of the series, tt### or ###.
+        season (str): The season, as named by `getSeasons`.
+
+    Returns:
+        list[dict]: The episodes in listing order, with their `id`, `season` and `episode_number`.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When the ID is invalid or the season blank.
+        NotFound: When the series does not exist, cached for `CACHE.negative_ttl`.
+        HTTPError: Any lookup errors or connection issues.
+    """
+    if not isinstance(season, str):
+        raise TypeError(f"The season must be a string, {type(season)} given.")
+    if not season:
+        raise ValueError("A season must be provided.")
+    base_url = f"{_key('title', id)}/episodes"
+    params = {"season": season}
+    episodes: list[dict] = []
+    while True:
+        url = f"{base_url}?{urlencode(params)}"
+        response_json = CACHE.get_or_load(
+            url, lambda entry, url=url: _fetch(url, "rest.episodes", entry), "rest.episodes"
+        )
+        episodes.extend(response_json.get("episodes", []))
+        token = response_json.get("next_page_token")
+        if not token:
+            return episodes
+        params = {"season": season, "page_token": token}
+
+
+def streamMovie(id: int | str, subselection: str, pages: bool = True) -> Iterator[dict]:
+    """Yields the records of a movie subselection as the body arrives, without holding the whole document.
+    For the credits of long running series, the first record comes after its own bytes rather than the whole body.
+
+    Note: Streamed lookups are not cached, use `getMovie` for repeated lookups.
+
+    Args:
+        id (int | str): The ID of the movie, tt### or ###.
+        subselection (str): `akas`, `credits` or `release_dates`.
+        pages (bool, optional): Follow the `next_page_token` of paged subselections.
+
+    Returns:
+        Iterator[dict]: The records, in order.
+
+    Raises:
+        TypeError: When an agrument is not of the correct type.
+        ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID does not exist.
+        HTTPError: Any lookup errors or connection issues.
+        JSONDecodeError: When the body is not a JSON object.
+    """
+    if not subselection:
+        raise ValueError(f"A subselection must be provided, one of {SUBSELECTIONS['title']}")
+    if not isinstance(pages, bool):
+        raise TypeError(f"Pages must be a boolean, {type(pages)} given.")
+    url = _url("title", id, subselection)
+    return _stream(url, subselection.lower(), pages)
+
+
+def _stream(url: str, key: str, pages: bool) -> Iterator[dict]:
+    params: dict[str, str] = {}
+    while True:
+        page_url = f"{url}?{urlencode(params)}" if params else url
+        with transport.stream("GET", page_url, "rest.titles", headers=base_headers()) as (response, chunks):
+            if response.status_code == 404:
+                raise NotFound(f"{page_url} not found.", response=response)
+            response.raise_for_status()
+            records = jsonstream.items(chunks, key)
+            yield from records
+        token = records.fields.get("next_page_token")
+        if not pages or not token:
+            return
+        params = {"page_token": token}
 
 
 def updateMovie(movie: dict, subselection: str = "") -> dict:
@@ -71,10 +271,11 @@ def updateMovie(movie: dict, subselection: str = "") -> dict:
     if not isinstance(movie, dict):
         raise TypeError(f"The movie object must be a dict, {type(movie)} passed.")
     id = movie.get("id", "")
-    title_id = "tt" + str(id).replace("tt", "").rjust(7, "0")
     if not id:
         raise ValueError("The ID of the movie was not found in the object.")
-    if not re.fullmatch(r"tt\d{7}", title_id):
+    try:
+        title_id = normalize_id(id, "tt")
+    except (TypeError, ValueError):
         raise ValueError(
             f"The format of the ID was incorrect, 'tt#######' expected, '{id}' recieved."
         )
@@ -83,11 +284,12 @@ def updateMovie(movie: dict, subselection: str = "") -> dict:
     return movie
 
 
-@lru_cache(maxsize=None)
 def getPerson(id: int | str = "", subselection: str = "") -> dict:
     """Gets the person information, subselection is for additional data.
     To get both you must make two calls, one for the main person dict and another via update.
 
+    Note: Responses are kept in `cache.CACHE`, expired entries are revalidated with a conditional request.
+
     Args:
         id (int | str): The ID of the person, nm### or ###.
         subselection (str, optional): Typically called via update, the additional data to grab.
@@ -98,34 +300,14 @@ def getPerson(id: int | str = "", subselection: str = "") -> dict:
     Raises:
         TypeError: When an agrument is not of the correct type.
         ValueError: When an argument was of the correct type, but invalid values.
+        NotFound: When the ID does not exist, cached for `CACHE.negative_ttl`.
         HTTPError: Any lookup errors or connection issues.
     """
-    allowed_subselection = ["known_for"]
-    if not isinstance(id, str) and not isinstance(id, int):
-        raise TypeError(f"ID must be of type str or int, {type(id)} given.")
-    if not id:
-        raise ValueError("A valid ID must be provided.")
-    if not isinstance(subselection, str):
-        raise TypeError("The subselection must be a string.")
-    subselection = subselection.lower()
-    if subselection and subselection not in allowed_subselection:
-        raise ValueError(f"The subselection must be one of {allowed_subselection}")
-    person_id = "nm" + str(id).replace("nm", "").rjust(7, "0")
-    if not re.fullmatch(r"nm\d{7}", person_id):
-        raise ValueError("A valid ID must be provided, form nm#######.")
-    if subselection:
-        url = f"{BASE_URL}/v2/names/{person_id}/{subselection}"
-    else:
-        url = f"{BASE_URL}/v2/names/{person_id}"
-    response = requests.get(url, headers=BASE_HEADERS)
-    response.raise_for_status()
-    response_json = response.json()
-    if not response_json or response_json == {"id": person_id}:
-        # As of now it returns a 200 response with only the ID passed back.
-        # Subselections return an empty json
-        response.status_code = 500  # Manually update status code.
-        raise HTTPError("PersonID not found.", response=response)
-    return response_json
+    url = _url("name", id, subselection)
+    person_id = normalize_id(id, "nm")
+    return CACHE.get_or_load(
+        url, lambda entry: _fetch(url, "rest.names", entry, person_id), "rest.names"
+    )
 
 
 def updatePerson(person: dict, subselection: str = "") -> dict:
@@ -149,25 +331,27 @@ def updatePerson(person: dict, subselection: str = "") -> dict:
     if not isinstance(person, dict):
         raise TypeError(f"The movie object must be a dict, {type(person)} passed.")
     id = person.get("id", "")
-    person_id = "nm" + str(id).replace("nm", "").rjust(7, "0")
     if not id:
         raise ValueError("The ID of the person was not found in the object.")
     if not subselection:
         raise ValueError("A subselection is required.")
-    if not re.fullmatch(r"nm\d{7}", person_id):
+    try:
+        person_id = normalize_id(id, "nm")
+    except (TypeError, ValueError):
         raise ValueError(
-            f"The format of the ID was incorrect, 'tt#######' expected, '{id}' recieved."
+            f"The format of the ID was incorrect, 'nm#######' expected, '{id}' recieved."
         )
     subeelection_json = getPerson(person_id, subselection)
     person[subselection] = subeelection_json[subselection]
     return person
 
 
-@lru_cache(maxsize=None)
 def searchMovie(query: str, year: int = 0, max_year_difference: int = 2) -> list[dict]:
     """Search for a movie.
     Allows for passing a year to filter and search.
 
+    Note: Replies are kept in `cache.CACHE`, the results are filtered again on each call into a new list.
+
     Args:
         query (str): Any query to search, typically the title.
         year (int, optional): A year to help filter the results, also passed to the search via `(year)`
@@ -197,20 +381,172 @@ def searchMovie(query: str, year: int = 0, max_year_difference: int = 2) -> list
     if year < 0:
         raise ValueError(f"The year cannot be less than 0, {year} given.")
     search_query = f"{query} ({year})" if year else query
-    url = f"{BASE_URL}/v2/search/titles"
-    params = {"query": search_query}
-    response = requests.get(url, headers=BASE_HEADERS, params=params)
-    response.raise_for_status()
-    response_json = response.json()
+    url = f"{BASE_URL}/v2/search/titles?{urlencode({'query': search_query})}"
+    response_json = CACHE.get_or_load(
+        url, lambda entry: _fetch(url, "rest.search", entry), "rest.search"
+    )
     titles = response_json.get("titles", [])
-    if year and max_year_difference >= 0:
-        # Negative max_difference is no filter, year only used for search query.
-        filtered = [
-            title
-            for title in titles
-            if title.get("start_year") is not None
-            and abs(title.get("start_year") - year) <= max_year_difference
-        ]
+    return filterSearchResults([titles], [year], max_year_difference, rank=False)[0]
+
+
+def _check_filter(
+    candidates: list[list[dict]], years: list[int], max_year_difference: int, rank: bool
+) -> None:
+    if not isinstance(candidates, list) or not all(isinstance(c, list) for c in candidates):
+        raise TypeError("The candidates must be a list of result lists.")
+    if not isinstance(years, list) or not all(isinstance(y, int) for y in years):
+        raise TypeError("The years must be a list of int.")
+    if not isinstance(max_year_difference, int):
+        raise TypeError(f"The max year difference must be an int, {type(max_year_difference)} passed.")
+    if not isinstance(rank, bool):
+        raise TypeError(f"Rank must be a boolean value, {type(rank)} passed.")
+    if len(years) != len(candidates):
+        raise ValueError(f"Expected {len(candidates)} years, {len(years)} given.")
+    if any(year < 0 for year in years):
+        raise ValueError("The years cannot be less than 0.")
+
+
+def _sort_key(title: dict, year: int) -> tuple:
+    rating = title.get("rating") or {}
+    start_year = title.get("start_year")
+    distance = abs(start_year - year) if year and start_year is not None else 0
+    return (
+        distance,
+        -(rating.get("votes_count") or 0),
+        -(rating.get("aggregate_rating") or 0),
+    )
+
+
+def filterSearchResults(
+    candidates: list[list[dict]],
+    years: list[int],
+    max_year_difference: int = 2,
+    rank: bool = True,
+) -> list[list[dict]]:
+    """Filter and rank the search results of many queries at once, held as dicts.
+    Batches held as columns, such as `columnar.to_numpy`, are best passed to `rankSearchColumns`,
+    reading the values out of the dicts into columns first costs more than this loop.
+
+    Args:
+        candidates (list[list[dict]]): The results of each query, such as the `titles` of a search reply.
+        years (list[int]): The year of each query, 0 for no year.
+        max_year_difference (int, optional): To filter the results, a difference of 0 passed means exact.
+            Negative means no filtering is being done.
+            Default of 2.
+        rank (bool, optional): Sort each query's results by year difference,
+            then by votes and rating descending. Otherwise the API order is kept.
+
+    Returns:
+        list[list[dict]]: The kept results of each query, in the order of the candidates.
+
+    Raises:
+        TypeError: When an argument is of the incorrect type.
+        ValueError: When the years do not match the candidates or are negative.
+    """
+    _check_filter(candidates, years, max_year_difference, rank)
+    results = []
+    for titles, year in zip(candidates, years):
+        if year and max_year_difference >= 0:
+            # Negative max_difference is no filter, year only used for search query.
+            titles = [
+                title
+                for title in titles
+                if title.get("start_year") is not None
+                and abs(title.get("start_year") - year) <= max_year_difference
+            ]
+        if rank:
+            titles = sorted(titles, key=lambda title: _sort_key(title, year))
+        results.append(titles)
+    return results
+
+
+def rankSearchColumns(
+    query_index, start_year, votes, rating, years, max_year_difference: int = 2, rank: bool = True
+):
+    """Filter and rank the search results of many queries held as columns, one element per result.
+    The batch search filter, with NumPy array operations when NumPy is installed, a Python loop otherwise.
+    Columnar data such as `columnar.to_numpy` is used as is, `filterSearchResults` builds the columns from dicts.
+
+    Args:
+        query_index (numpy.ndarray | list[int]): The query of each result,
+            results of a query must be contiguous and ascending.
+        start_year (numpy.ndarray | list): The start year of each result, NaN or None when missing.
+        votes (numpy.ndarray | list): The votes of each result, NaN or None when missing.
+        rating (numpy.ndarray | list): The aggregate rating of each result, NaN or None when missing.
+        years (numpy.ndarray | list[int]): The year of each query, 0 for no year.
+        max_year_difference (int, optional): To filter the results, a difference of 0 passed means exact.
+            Negative means no filtering is being done.
+        rank (bool, optional): Sort each query's results by year difference, then by votes and rating descending.
+            Otherwise the API order is kept.
+
+    Returns:
+        numpy.ndarray | list[int]: The indices of the kept results, grouped by query in the order of the queries,
+            a list when NumPy is not installed.
+
+    Raises:
+        TypeError: When the max year difference is not an int or rank not a boolean.
+        ValueError: When the arrays differ in length.
+    """
+    if not isinstance(max_year_difference, int):
+        raise TypeError(f"The max year difference must be an int, {type(max_year_difference)} passed.")
+    if not isinstance(rank, bool):
+        raise TypeError(f"Rank must be a boolean value, {type(rank)} passed.")
+    if not len(query_index) == len(start_year) == len(votes) == len(rating):
+        raise ValueError("The result arrays must have the same length.")
+    if numpy is None:
+        return _rank_python(query_index, start_year, votes, rating, years, max_year_difference, rank)
+    query_index = numpy.asarray(query_index, dtype=numpy.intp)
+    start_year = numpy.asarray(start_year, dtype=numpy.float64)
+    target = numpy.asarray(years, dtype=numpy.float64)[query_index]
+    distance = numpy.abs(start_year - target)
+    if max_year_difference >= 0:
+        # Comparisons with NaN are False, results without a year are dropped when the query has one.
+        order = numpy.flatnonzero((target == 0) | (distance <= max_year_difference))
     else:
-        filtered = titles
-    return filtered
+        order = numpy.arange(len(query_index))
+    if not rank:
+        return order
+    votes, rating = (numpy.asarray(column, dtype=numpy.float64)[order] for column in (votes, rating))
+    distance = distance[order]
+    distance[(target[order] == 0) | numpy.isnan(distance)] = 0
+    # `lexsort` sorts by the last key first, the sort is stable so ties keep the API order.
+    return order[
+        numpy.lexsort(
+            (
+                -numpy.nan_to_num(rating),
+                -numpy.nan_to_num(votes),
+                distance,
+                query_index[order],
+            )
+        )
+    ]
+
+
+def _missing(value) -> bool:
+    # NaN is the only value not equal to itself.
+    return value is None or value != value
+
+
+def _rank_python(query_index, start_year, votes, rating, years, max_year_difference: int, rank: bool) -> list[int]:
+    """`rankSearchColumns` without NumPy."""
+    order = []
+    for index, (query, start) in enumerate(zip(query_index, start_year)):
+        year = years[query]
+        # Negative max_difference is no filter, year only used for search query.
+        if year and max_year_difference >= 0 and (_missing(start) or abs(start - year) > max_year_difference):
+            continue
+        order.append(index)
+    if not rank:
+        return order
+
+    def key(index: int) -> tuple:
+        year = years[query_index[index]]
+        start = start_year[index]
+        return (
+            query_index[index],
+            abs(start - year) if year and not _missing(start) else 0,
+            0 if _missing(votes[index]) else -votes[index],
+            0 if _missing(rating[index]) else -rating[index],
+        )
+
+    return sorted(order, key=key)
@@ -1,6 +1,143 @@
-__all__ = ["IMDbAPI"]
+__all__ = ["IMDbAPI", "NotFound"]
+
+import importlib
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from SimpleIMDbDev import metrics
+from SimpleIMDbDev.metrics import METRICS
+
+if TYPE_CHECKING:
+    from SimpleIMDbDev import profiling
+    from SimpleIMDbDev.cache import NotFound
+
+# Submodules imported on first use, keeping `requests` and the parsers out of the package import.
+_LAZY_MODULES = {
+    "Dataset",
+    "GraphQL",
+    "Rest",
+    "aio",
+    "cache",
+    "cli",
+    "delta",
+    "graph",
+    "ids",
+    "jsonstream",
+    "profiling",
+    "rediscache",
+    "router",
+    "scheduler",
+    "series",
+    "sharedcache",
+    "transport",
+}
+
+
+def _load(name: str):
+    """Import a submodule of the package, `sys.modules` answers after the first call."""
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return _load(name)
+    if name == "NotFound":
+        return _load("cache").NotFound
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _check_workers(workers: int, processes: int = 0) -> None:
+    for name, value in [("Workers", workers), ("Processes", processes)]:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"{name} must be an integer, {type(value)} given.")
+    if workers < 1:
+        raise ValueError("Workers must be at least 1.")
+    if processes < 0:
+        raise ValueError("Processes cannot be negative.")
+
+
+def _bulk(
+    lookup: Callable[[int | str], dict],
+    ids: Iterable[int | str],
+    workers: int,
+    prefetch: Callable[[list[int | str]], object] | None = None,
+) -> Iterator[tuple[int | str, dict | Exception]]:
+    """Run lookups on a thread pool, at most `workers * 2` IDs are taken from the iterable ahead of the results.
 
-from SimpleIMDbDev import GraphQL, Rest
+    Args:
+        lookup (Callable): The single lookup, such as `IMDbAPI.getMovie`.
+        ids (Iterable[int | str]): The IDs, consumed lazily.
+        workers (int): The concurrent lookups.
+        prefetch (Callable | None, optional): Called with each batch of `workers * 2` IDs before they are looked up,
+            such as `IMDbAPI._prefetch` loading their cache entries in one round trip.
+
+    Returns:
+        Iterator[tuple[int | str, dict | Exception]]: The ID with its result or error, in completion order.
+
+    Raises:
+        TypeError: When workers is not an integer.
+        ValueError: When workers is below 1.
+    """
+    _check_workers(workers)
+    ids = iter(ids)
+    if prefetch is not None:
+        ids = _prefetched(ids, workers * 2, prefetch)
+    return _bulk_results(lookup, ids, workers)
+
+
+def _prefetched(
+    ids: Iterator[int | str], size: int, prefetch: Callable[[list[int | str]], object]
+) -> Iterator[int | str]:
+    from itertools import islice
+
+    while batch := list(islice(ids, size)):
+        prefetch(batch)
+        yield from batch
+
+
+def _pooled_bulk(
+    field: str,
+    ids: Iterable[int | str],
+    workers: int,
+    processes: int,
+    prefetch: Callable[[list[int | str]], object] | None = None,
+) -> Iterator[tuple[int | str, dict | Exception]]:
+    """`_bulk` over `GraphQL._pooled`, the process pool lives as long as the iteration."""
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    GraphQL = _load("GraphQL")
+    with ProcessPoolExecutor(processes) as pool:
+        yield from _bulk(partial(GraphQL._pooled, pool, field), ids, workers, prefetch)
+
+
+def _bulk_results(
+    lookup: Callable[[int | str], dict], ids: Iterator[int | str], workers: int
+) -> Iterator[tuple[int | str, dict | Exception]]:
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from contextvars import copy_context
+
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="SimpleIMDbDev-bulk")
+    pending = {}
+    try:
+        # Lookups run in the context of the caller, keeping its `scheduler.priority`.
+        for id in ids:
+            pending[executor.submit(copy_context().run, lookup, id)] = id
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                id = pending.pop(future)
+                try:
+                    yield id, future.result()
+                except Exception as error:
+                    yield id, error
+                for id in ids:
+                    pending[executor.submit(copy_context().run, lookup, id)] = id
+                    break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def flatten(obj: dict) -> dict:
@@ -24,35 +161,91 @@ def flatten(obj: dict) -> dict:
     return final_obj
 
 
+def _marked(result: dict, stale: list) -> dict:
+    """The result as a `cache.StaleResult` when expired entries were served for it."""
+    return _load("cache").StaleResult(result, stale) if stale else result
+
+
+def _select(result: dict, fields: Iterable[str]) -> dict:
+    """The requested fields of a result, all of them when none are requested."""
+    if not fields:
+        return result
+    return {field: result.get(field) for field in fields}
+
+
 class IMDbAPI:
     """Base class for IMDbAPI, using standardized dicts.
     Default is `Rest` interface.
 
-    Note: Underlying API calls are cached using their respective modules.
+    Note: Underlying API calls are cached in the shared `cache.CACHE` used by both parsers.
 
     Notes:
         - Episodes do not work under the `GraphQL` interface.
         - GraphQL has a list of images where Rest has a primary image.
+        - The `Dataset` interface answers from local IMDb dumps, see `Dataset.ingest`.
+            It returns the `Rest` shapes without images, plots, akas or release dates.
+        - The `auto` interface routes each call to `Rest` or `GraphQL`, see `router.Router`.
+            It returns the `Rest` shapes, with None for the fields the answering API does not have.
+        - With a `priority`, the upstream requests of `getMovie`, `getPerson`, `searchMovie` and the calls built
+            on them are sent as that class of `transport.schedule`.
+        - With `transport.breakers`, lookups of an endpoint whose circuit is open raise `transport.CircuitOpen`
+            at once, or return the expired cached result as a `cache.StaleResult`, its `stale` attribute set.
 
     Functions:
         getMovie (int | str): Returns dict of the MovieID
         getPerson (int | str): Returns dict of the PersonID
+        getMovies (Iterable): Yields the dicts of many MovieIDs, fetched concurrently.
+        getPeople (Iterable): Yields the dicts of many PersonIDs, fetched concurrently.
+        getSeries (int | str): Yields the episodes of a series season by season, fetched concurrently.
+        streamMovie (int | str, str): Yields the records of a subselection as they are parsed.
+        crawl (Iterable): Returns a breadth-first crawler of the cast and crew graph.
+        syncMovies (Iterable, DeltaStore): Yields the MovieIDs changed since the last sync, as patches.
+        syncPeople (Iterable, DeltaStore): Yields the PersonIDs changed since the last sync, as patches.
         search (str): Searches for the given title.
-            *Only works under `Rest` interface.*"""
+            *Only works under `Rest` and `Dataset` interfaces.*
+        cacheStats: Returns dict of the response cache statistics.
+        trafficStats: Returns dict of the bytes received upstream, compressed and decoded.
+        routerStats: Returns dict of the health of each API, as seen by the `auto` interface.
+        schedulerStats: Returns dict of the queue depth and wait times of each priority class.
+        circuitStats: Returns dict of the circuit breaker state of each endpoint.
+        warm (str): Loads a JSON Lines snapshot into the response cache.
+        export (str): Writes the response cache to a JSON Lines snapshot.
+        instrument: Enables the metrics and hooks, see `metrics.METRICS`.
+        profile: Context manager reporting time and allocations per internal stage."""
 
     _parsers = {
         "graphql": "GraphQL",
         "rest": "Rest",
+        "dataset": "Dataset",
+        "auto": "auto",
     }
 
-    def __init__(self, parser: str = "Rest"):
+    def __init__(self, parser: str = "Rest", dataset: str = "", priority: str = ""):
+        """
+        Args:
+            parser (str, optional): `Rest`, `GraphQL`, `Dataset` or `auto`.
+            dataset (str, optional): The database for the `Dataset` parser, passed to `Dataset.connect`.
+            priority (str, optional): The scheduler class of the requests, such as `interactive` or `bulk`,
+                see `transport.schedule`. By default the class set with `scheduler.priority`.
+
+        Raises:
+            TypeError: When the parser or priority is not a string.
+            ValueError: When the parser is unknown.
+        """
         if not isinstance(parser, str):
             raise TypeError(
                 f"The 'parser' must be of type str, '{type(parser)}' given."
             )
-        self._parser = self._parsers.get(parser.lower(), "GraphQL")
-
-    def getMovie(self, id: int | str = "", subsection: str = "") -> dict:
+        if not isinstance(priority, str):
+            raise TypeError(f"The 'priority' must be of type str, '{type(priority)}' given.")
+        self._priority = priority
+        if parser.lower() not in self._parsers:
+            raise ValueError(f"Unknown parser '{parser}', use Rest, GraphQL, Dataset or auto.")
+        self._parser = self._parsers[parser.lower()]
+        if dataset:
+            _load("Dataset").connect(dataset)
+
+    def getMovie(self, id: int | str = "", subsection: str = "", fields: Iterable[str] = ()) -> dict:
         """Gets the movie information, subselection is for additional data.
         To get both you must make two calls, one for the main moviee dict and another via update.
 
@@ -62,6 +255,8 @@ class IMDbAPI:
             self (IMDbAPI): The object that defined the parser to use.
             id (int | str): The ID of the movie, tt### or ###.
             subselection (str, optional): Typically called via update, the additional data to grab.
+            fields (Iterable[str], optional): Under `auto`, the fields needed, used for routing and
+                to select the fields returned.
 
         Returns:
             dict: The information gathered from the query.
@@ -70,20 +265,31 @@ class IMDbAPI:
             NotImplementedError: When the requested API call is not implemented for that type.
             TypeError: When an agrument is not of the correct type.
             ValueError: When an argument was of the correct type, but invalid values.
-            HTTPError: Any lookup errors or connection issues.
+            NotFound: When the ID does not exist, repeated lookups are answered from the cache.
+            HTTPError: Any lookup errors or connection issues, under `auto` once every API failed.
         """
-        if subsection != "" and self._parser != "Rest":
+        if subsection != "" and self._parser not in ["Rest", "Dataset", "auto"]:
             raise NotImplementedError("Subselection only possible via rest API.")
-        match self._parser:
-            case "GraphQL":
-                response = GraphQL.getMovie(id).as_dict()
-            case "Rest":
-                response = Rest.getMovie(id, subsection)
-            case _:
-                response = GraphQL.getMovie(id).as_dict()
-        return flatten(response)
-
-    def getPerson(self, id: str | int, subsection: str = "") -> dict:
+        if isinstance(fields, str):
+            raise TypeError("The fields must be an iterable of field names, not a string.")
+        if fields and self._parser != "auto":
+            raise NotImplementedError("Selecting fields is only possible with the 'auto' parser.")
+        with self._prioritized(), _load("cache").served_stale() as stale, METRICS.timer("imdbapi", "total"):
+            match self._parser:
+                case "auto":
+                    return _marked(_select(_load("router").ROUTER.getMovie(id, subsection, fields), fields), stale)
+                case "GraphQL":
+                    response = _load("GraphQL").getMovie(id).as_dict()
+                case "Rest":
+                    response = _load("Rest").getMovie(id, subsection)
+                case "Dataset":
+                    response = _load("Dataset").getMovie(id, subsection)
+                case _:
+                    response = _load("GraphQL").getMovie(id).as_dict()
+            with METRICS.timer("imdbapi", "flatten"):
+                return _marked(flatten(response), stale)
+
+    def getPerson(self, id: str | int, subsection: str = "", fields: Iterable[str] = ()) -> dict:
         """Gets the person information, subselection is for additional data.
         To get both you must make two calls, one for the main person dict and another via update.
 
@@ -93,6 +299,8 @@ class IMDbAPI:
             self (IMDbAPI): The object that defined the parser to use.
             id (int | str): The ID of the person, nm### or ###.
             subselection (str, optional): Typically called via update, the additional data to grab.
+            fields (Iterable[str], optional): Under `auto`, the fields needed, used for routing and
+                to select the fields returned.
 
         Returns:
             dict: The information gathered from the query.
@@ -101,23 +309,35 @@ class IMDbAPI:
             NotImplementedError: When the requested API call is not implemented for that type.
             TypeError: When an agrument is not of the correct type.
             ValueError: When an argument was of the correct type, but invalid values.
-            HTTPError: Any lookup errors or connection issues.
+            NotFound: When the ID does not exist, repeated lookups are answered from the cache.
+            HTTPError: Any lookup errors or connection issues, under `auto` once every API failed.
         """
-        if subsection != "" and self._parser != "Rest":
+        if subsection != "" and self._parser not in ["Rest", "Dataset", "auto"]:
             raise NotImplementedError("Subselection only possible via rest API.")
-        match self._parser:
-            case "GraphQL":
-                response = GraphQL.getPerson(id).as_dict()
-            case "Rest":
-                response = Rest.getPerson(id, subsection)
-            case _:
-                response = GraphQL.getPerson(id).as_dict()
-        return flatten(response)
+        if isinstance(fields, str):
+            raise TypeError("The fields must be an iterable of field names, not a string.")
+        if fields and self._parser != "auto":
+            raise NotImplementedError("Selecting fields is only possible with the 'auto' parser.")
+        with self._prioritized(), _load("cache").served_stale() as stale, METRICS.timer("imdbapi", "total"):
+            match self._parser:
+                case "auto":
+                    return _marked(_select(_load("router").ROUTER.getPerson(id, subsection, fields), fields), stale)
+                case "GraphQL":
+                    response = _load("GraphQL").getPerson(id).as_dict()
+                case "Rest":
+                    response = _load("Rest").getPerson(id, subsection)
+                case "Dataset":
+                    response = _load("Dataset").getPerson(id, subsection)
+                case _:
+                    response = _load("GraphQL").getPerson(id).as_dict()
+            with METRICS.timer("imdbapi", "flatten"):
+                return _marked(flatten(response), stale)
 
     def updateMovie(self, movie: dict, subselection: str = "") -> dict:
         """Updates a movie object (dict).
         The dict is required to have a valid ID, the rest are optional.
         The subselection is only allowed to be one of `akas`, `credits`, or `release_dates`.
+        Under `auto` the lookup is routed, see `router.Router`, subselections always come from `Rest`.
 
         Args:
             self (IMDbAPI): The object that defined the parser to use.
@@ -133,17 +353,23 @@ class IMDbAPI:
             ValueError: When an argument was of the correct type, but invalid values.
             HTTPError: raised from the `getMovie` call on any lookup errors or connection issues.
         """
-        if subselection != "" and self._parser != "Rest":
+        if subselection != "" and self._parser not in ["Rest", "Dataset", "auto"]:
             raise NotImplementedError(
                 "Updating movie subselection only possible via rest API."
             )
-        movie = Rest.updateMovie(movie, subselection)
+        if self._parser == "auto":
+            movie = _load("router").ROUTER.updateMovie(movie, subselection)
+        elif self._parser == "Dataset":
+            movie = _load("Dataset").updateMovie(movie, subselection)
+        else:
+            movie = _load("Rest").updateMovie(movie, subselection)
         return flatten(movie)
 
     def updatePerson(self, person: dict, subselection: str = "") -> dict:
         """Updates a person object (dict).
         The dict is required to have a valid ID, the rest are optional.
         The subselection is only allowed to be `known_for`.
+        Under `auto` the lookup is routed, see `router.Router`, subselections always come from `Rest`.
 
         Args:
             self (IMDbAPI): The object that defined the parser to use.
@@ -159,11 +385,16 @@ class IMDbAPI:
             ValueError: When an argument was of the correct type, but invalid values.
             HTTPError: raised from the `getPerson` call on any lookup errors or connection issues.
         """
-        if subselection != "" and self._parser != "Rest":
+        if subselection != "" and self._parser not in ["Rest", "Dataset", "auto"]:
             raise NotImplementedError(
                 "Updating person subselection only possible via rest API."
             )
-        person = Rest.updatePerson(person, subselection)
+        if self._parser == "auto":
+            person = _load("router").ROUTER.updatePerson(person, subselection)
+        elif self._parser == "Dataset":
+            person = _load("Dataset").updatePerson(person, subselection)
+        else:
+            person = _load("Rest").updatePerson(person, subselection)
         return flatten(person)
 
     def searchMovie(
@@ -172,7 +403,7 @@ class IMDbAPI:
         """Search for a movie.
         Allows for passing a year to filter and search.
 
-        Note: Only the `REST` parser can be used.
+        Note: Only the `REST` and `Dataset` parsers can be used.
 
         Args:
             query (str): Any query to search, typically the title.
@@ -191,6 +422,336 @@ class IMDbAPI:
             ValueError: When the value of an argument is invalid.
             HTTPError: Any API call or connection issues may cause this, none raised manually.
         """
-        if self._parser != "Rest":
+        if self._parser == "Dataset":
+            return _load("Dataset").searchMovie(query, year, max_year_difference)
+        if self._parser not in ["Rest", "auto"]:
             raise NotImplementedError("Only the 'Rest' API supports searching.")
-        return Rest.searchMovie(query, year, max_year_difference)
+        with self._prioritized():
+            return _load("Rest").searchMovie(query, year, max_year_difference)
+
+    def _prioritized(self) -> AbstractContextManager:
+        """Sends the requests made within the block as the priority class of this API, when it has one."""
+        if not self._priority:
+            return nullcontext()
+        return _load("scheduler").priority(self._priority)
+
+    def getMovies(
+        self, ids: Iterable[int | str], workers: int = 8, processes: int = 0
+    ) -> Iterator[tuple[int | str, dict | Exception]]:
+        """Gets many movies concurrently, each as `getMovie` would.
+        The IDs are consumed lazily, so large files or streams can be passed.
+        With a `cache.CACHE.backend`, the entries of each batch of IDs are fetched from it in one round trip.
+        Set an upstream rate limit with `transport.limit`.
+        With `processes`, GraphQL replies are decoded and built into objects by a process pool,
+        the requests and the cache stay in this process.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the movies, tt### or ###.
+            workers (int, optional): The concurrent lookups.
+            processes (int, optional): The size of the process pool, 0 to build the objects on the lookup threads.
+
+        Returns:
+            Iterator[tuple[int | str, dict | Exception]]: The ID with its dict, or the error raised for it,
+                in completion order.
+
+        Raises:
+            NotImplementedError: When processes are requested with a parser other than `GraphQL`.
+            TypeError: When workers or processes are not integers.
+            ValueError: When workers is below 1 or processes negative.
+        """
+        _check_workers(workers, processes)
+        if processes:
+            if self._parser != "GraphQL":
+                raise NotImplementedError("A process pool is only used by the 'GraphQL' API.")
+            return _pooled_bulk("title", ids, workers, processes, self._prefetcher("title"))
+        return _bulk(self.getMovie, ids, workers, self._prefetcher("title"))
+
+    def getPeople(
+        self, ids: Iterable[int | str], workers: int = 8, processes: int = 0
+    ) -> Iterator[tuple[int | str, dict | Exception]]:
+        """Gets many people concurrently, each as `getPerson` would.
+        The IDs are consumed lazily, so large files or streams can be passed.
+        With a `cache.CACHE.backend`, the entries of each batch of IDs are fetched from it in one round trip.
+        Set an upstream rate limit with `transport.limit`.
+        With `processes`, GraphQL replies are decoded and built into objects by a process pool,
+        the requests and the cache stay in this process.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the people, nm### or ###.
+            workers (int, optional): The concurrent lookups.
+            processes (int, optional): The size of the process pool, 0 to build the objects on the lookup threads.
+
+        Returns:
+            Iterator[tuple[int | str, dict | Exception]]: The ID with its dict, or the error raised for it,
+                in completion order.
+
+        Raises:
+            NotImplementedError: When processes are requested with a parser other than `GraphQL`.
+            TypeError: When workers or processes are not integers.
+            ValueError: When workers is below 1 or processes negative.
+        """
+        _check_workers(workers, processes)
+        if processes:
+            if self._parser != "GraphQL":
+                raise NotImplementedError("A process pool is only used by the 'GraphQL' API.")
+            return _pooled_bulk("name", ids, workers, processes, self._prefetcher("name"))
+        return _bulk(self.getPerson, ids, workers, self._prefetcher("name"))
+
+    def getSeries(
+        self, id: int | str, workers: int = 8, details: bool = True
+    ) -> Iterator[tuple[str, list[tuple[str, dict | Exception]]]]:
+        """Gets the episodes of a series, one season at a time.
+        Seasons are yielded in order, the next season is already being fetched while one is yielded.
+        Listings and episodes are cached as `getMovie` results are.
+
+        Note: Only the `Rest` and `auto` parsers can be used, episodes are looked up with `getMovie`.
+
+        Args:
+            id (int | str): The ID of the series, tt### or ###.
+            workers (int, optional): The concurrent lookups.
+            details (bool, optional): Look up each episode, otherwise only the season listings are returned.
+
+        Returns:
+            Iterator[tuple[str, list[tuple[str, dict | Exception]]]]: The season with its episodes, in listing
+                order. Each episode is its ID with its dict, or the error raised for it.
+                Detailed episodes keep the `season` and `episode_number` of the listing.
+
+        Raises:
+            NotImplementedError: When used with the `GraphQL` or `Dataset` parsers.
+            TypeError: When an argument is not of the correct type.
+            ValueError: When workers is below 1 or the ID invalid.
+            NotFound: When the series does not exist.
+            HTTPError: When the seasons or a season listing could not be fetched.
+        """
+        if self._parser not in ["Rest", "auto"]:
+            raise NotImplementedError("Only the 'Rest' API lists the episodes of a series.")
+        _check_workers(workers)
+        if not isinstance(details, bool):
+            raise TypeError(f"Details must be a boolean value, {type(details)} given.")
+        _load("Rest")._key("title", id)
+        return _load("series").crawl(id, self.getMovie if details else None, workers)
+
+    def streamMovie(self, id: int | str, subsection: str) -> Iterator[dict]:
+        """Yields the records of a movie subselection one at a time, see `Rest.streamMovie`.
+        Under `Rest` and `auto` the body is parsed as it arrives, huge credit lists are never held at once.
+
+        Args:
+            id (int | str): The ID of the movie, tt### or ###.
+            subsection (str): `akas`, `credits` or `release_dates`.
+
+        Returns:
+            Iterator[dict]: The records, in order.
+
+        Raises:
+            NotImplementedError: When the parser is `GraphQL`.
+            TypeError: When an agrument is not of the correct type.
+            ValueError: When an argument was of the correct type, but invalid values.
+            NotFound: When the ID does not exist.
+            HTTPError: Any lookup errors or connection issues.
+        """
+        if self._parser == "GraphQL":
+            raise NotImplementedError("Subselection only possible via rest API.")
+        if not isinstance(subsection, str):
+            raise TypeError("The subselection must be a string.")
+        if not subsection:
+            raise ValueError("A subselection must be provided.")
+        if self._parser == "Dataset":
+            return iter(_load("Dataset").getMovie(id, subsection)[subsection.lower()])
+        return _load("Rest").streamMovie(id, subsection)
+
+    def crawl(self, seeds: Iterable[str], max_depth: int = 2, workers: int = 8, bloom: int = 0):
+        """Crawls the graph of titles and people breadth first, see `graph.Crawler`.
+        Nodes are fetched with this API, credits and known for lists with `Rest` unless using `Dataset`.
+
+        Args:
+            seeds (Iterable[str]): The IDs to start from, tt### or nm###.
+            max_depth (int, optional): The links followed from the seeds.
+            workers (int, optional): The concurrent fetches.
+            bloom (int, optional): The expected number of nodes, to remember visited IDs in a Bloom filter.
+
+        Returns:
+            graph.Crawler: Iterate it for the nodes and edges, `save` it to resume later.
+
+        Raises:
+            TypeError: When an argument is not of the correct type.
+            ValueError: When a seed is invalid or a number out of range.
+        """
+        return _load("graph").Crawler(seeds, self, max_depth, workers, bloom)
+
+    def syncMovies(self, ids: Iterable[int | str], store, workers: int = 8):
+        """Gets many movies as `getMovies` would, yielding only those changed since the last sync, see `delta.sync`.
+        Each dict is hashed and compared with the hash stored for its ID, only mismatches are diffed.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the movies, tt### or ###.
+            store (delta.DeltaStore | str): The versions from the last sync, or the path of their database.
+            workers (int, optional): The concurrent lookups.
+
+        Returns:
+            Iterator[delta.Change]: The added, changed, removed and failed movies, with JSON Patch operations.
+
+        Raises:
+            TypeError: When the store is not a DeltaStore or path, or workers not an integer.
+            ValueError: When workers is below 1.
+        """
+        return _load("delta").sync(self.getMovies(ids, workers), store, "tt")
+
+    def syncPeople(self, ids: Iterable[int | str], store, workers: int = 8):
+        """Gets many people as `getPeople` would, yielding only those changed since the last sync, see `delta.sync`.
+        Each dict is hashed and compared with the hash stored for its ID, only mismatches are diffed.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the people, nm### or ###.
+            store (delta.DeltaStore | str): The versions from the last sync, or the path of their database.
+            workers (int, optional): The concurrent lookups.
+
+        Returns:
+            Iterator[delta.Change]: The added, changed, removed and failed people, with JSON Patch operations.
+
+        Raises:
+            TypeError: When the store is not a DeltaStore or path, or workers not an integer.
+            ValueError: When workers is below 1.
+        """
+        return _load("delta").sync(self.getPeople(ids, workers), store, "nm")
+
+    def _prefetcher(self, field: str) -> Callable[[list[int | str]], object] | None:
+        """Loads the cache entries of a batch of IDs from the cache backend, when one is set."""
+        if self._parser not in ["Rest", "GraphQL"] or _load("cache").CACHE.backend is None:
+            return None
+        module = _load(self._parser)
+
+        def prefetch(ids: list[int | str]) -> int:
+            keys = []
+            for id in ids:
+                try:
+                    keys.append(module._key(field, id))
+                except (TypeError, ValueError):
+                    pass
+            return _load("cache").CACHE.prefetch(keys)
+
+        return prefetch
+
+    def routerStats(self) -> dict:
+        """Gets the health of each API as tracked by the `auto` interface, shared by every instance.
+
+        Returns:
+            dict: The calls, failures, latency and error rate averages and degraded state by API.
+        """
+        return _load("router").ROUTER.stats()
+
+    def schedulerStats(self) -> dict:
+        """Gets the state of each priority class of the scheduler set with `transport.schedule`.
+
+        Returns:
+            dict: The requests active and queued, the maximum queue depth and the wait times by class,
+                see `scheduler.Scheduler.stats`. Empty without a scheduler.
+        """
+        scheduler = _load("transport")._SCHEDULER
+        return scheduler.stats() if scheduler is not None else {}
+
+    def circuitStats(self) -> dict:
+        """Gets the circuit breakers set with `transport.breakers`, shared by every parser.
+
+        Returns:
+            dict: The state, failures in a row and request counters by endpoint, see `transport.circuits`.
+        """
+        return _load("transport").circuits()
+
+    def trafficStats(self) -> dict:
+        """Gets the bytes received upstream by every parser, compressed on the wire and decoded.
+
+        Returns:
+            dict: The requests, `wire_bytes` and `decoded_bytes` by endpoint, see `transport.traffic`.
+        """
+        return _load("transport").traffic()
+
+    def cacheStats(self) -> dict:
+        """Gets the statistics of the response cache shared by the parsers.
+
+        Returns:
+            dict: The hit, miss and revalidation counters along with the revalidation hit rate.
+        """
+        return _load("cache").CACHE.stats()
+
+    def warm(self, path: str) -> int:
+        """Loads a JSON Lines snapshot of previous responses into the cache shared by the parsers.
+        The file is streamed, values are decoded and validated on first use.
+
+        Args:
+            path (str): The snapshot, typically written by `export`.
+
+        Returns:
+            int: The number of entries loaded.
+
+        Raises:
+            TypeError: When the path is not a string.
+            ValueError: When a line is not a snapshot record.
+            OSError: When the file cannot be read.
+        """
+        if not isinstance(path, str):
+            raise TypeError(f"The path must be a string, {type(path)} given.")
+        return _load("cache").CACHE.warm(path)
+
+    def export(self, path: str) -> int:
+        """Writes the cache shared by the parsers to a JSON Lines snapshot.
+
+        Args:
+            path (str): The file to write, it is overwritten.
+
+        Returns:
+            int: The number of entries written.
+
+        Raises:
+            TypeError: When the path is not a string.
+            OSError: When the file cannot be written.
+        """
+        if not isinstance(path, str):
+            raise TypeError(f"The path must be a string, {type(path)} given.")
+        return _load("cache").CACHE.export(path)
+
+    def instrument(
+        self,
+        hook: Callable[[str, str, float], None] | None = None,
+        opentelemetry: bool = False,
+    ) -> metrics.Metrics:
+        """Enables the instrumentation of every parser and the transport.
+        Phase latencies and cache/HTTP events are recorded per endpoint,
+        export them with `to_prometheus()` or read them with `snapshot()`.
+
+        Args:
+            hook (Callable, optional): Called as `hook(endpoint, phase, seconds)` for each timed phase and event.
+            opentelemetry (bool, optional): Also record each timed phase as an OpenTelemetry span.
+
+        Returns:
+            metrics.Metrics: The shared registry, `metrics.METRICS`.
+
+        Raises:
+            TypeError: When the hook is not callable.
+            ImportError: When OpenTelemetry was requested but is not installed.
+        """
+        if hook is not None:
+            METRICS.add_hook(hook)
+        METRICS.enable(opentelemetry)
+        return METRICS
+
+    @staticmethod
+    def profile(allocations: bool = True) -> "profiling.Profile":
+        """Profiles the library's internal stages for the duration of a `with` block.
+        Wall time, call counts and allocations are recorded for the HTTP request, decoding,
+        query building, `check_kwargs`, `todict` and `flatten`.
+
+        Examples:
+            with IMDbAPI.profile() as profile:
+                IMDbAPI("GraphQL").getMovie("tt0477051")
+            print(profile.report())
+
+        Args:
+            allocations (bool, optional): Trace allocations with `tracemalloc`, slower but adds memory figures.
+
+        Returns:
+            profiling.Profile: The context manager, its `stats` and `report()` are filled on exit.
+
+        Raises:
+            TypeError: When allocations is not a boolean.
+        """
+        return _load("profiling").Profile(allocations)
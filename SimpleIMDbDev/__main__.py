@@ -0,0 +1,5 @@
+import sys
+
+from SimpleIMDbDev.cli import main
+
+sys.exit(main())
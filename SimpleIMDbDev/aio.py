@@ -0,0 +1,198 @@
+"""Coroutine counterpart of `IMDbAPI` for the `Rest` and `GraphQL` parsers, sharing its response cache.
+Requests go through `transport.arequest`, multiplexed on one connection per host with `transport.http2()`.
+
+Examples:
+    transport.http2()
+    api = AsyncIMDbAPI("Rest")
+    movie = await api.getMovie("tt0477051")
+    async for id, result in api.getMovies(ids, concurrency=64):
+        ...
+"""
+
+__all__ = ["AsyncIMDbAPI"]
+
+import asyncio
+from contextlib import nullcontext
+from typing import AsyncIterator, Iterable
+
+from SimpleIMDbDev import GraphQL, Rest, _check_workers, flatten
+from SimpleIMDbDev.cache import CACHE, CacheEntry, StaleResult, served_stale
+from SimpleIMDbDev.ids import normalize_id
+from SimpleIMDbDev.metrics import METRICS
+from SimpleIMDbDev.scheduler import priority
+
+
+class AsyncIMDbAPI:
+    """`IMDbAPI` for asyncio, returning the same standardized dicts.
+
+    Functions:
+        getMovie (int | str): Returns dict of the MovieID
+        getPerson (int | str): Returns dict of the PersonID
+        getMovies (Iterable): Yields the dicts of many MovieIDs, fetched concurrently.
+        getPeople (Iterable): Yields the dicts of many PersonIDs, fetched concurrently.
+    """
+
+    _parsers = {"graphql": "GraphQL", "rest": "Rest"}
+
+    def __init__(self, parser: str = "Rest", priority: str = ""):
+        """
+        Args:
+            parser (str, optional): `Rest` or `GraphQL`.
+            priority (str, optional): The scheduler class of the requests, see `transport.schedule`.
+
+        Raises:
+            TypeError: When the parser or priority is not a string.
+            ValueError: When the parser is unknown.
+        """
+        if not isinstance(parser, str):
+            raise TypeError(f"The 'parser' must be of type str, '{type(parser)}' given.")
+        if parser.lower() not in self._parsers:
+            raise ValueError(f"Unknown parser '{parser}', use Rest or GraphQL.")
+        if not isinstance(priority, str):
+            raise TypeError(f"The 'priority' must be of type str, '{type(priority)}' given.")
+        self._parser = self._parsers[parser.lower()]
+        self._priority = priority
+
+    async def _rest(self, field: str, id: int | str, subselection: str) -> dict:
+        url = Rest._url(field, id, subselection)
+        endpoint = "rest.titles" if field == "title" else "rest.names"
+        person_id = normalize_id(id, "nm") if field == "name" else ""
+
+        async def load(entry: CacheEntry | None) -> CacheEntry:
+            return await Rest._afetch(url, endpoint, entry, person_id)
+
+        def refresh(entry: CacheEntry | None) -> CacheEntry:
+            return Rest._fetch(url, endpoint, entry, person_id)
+
+        return await CACHE.aget_or_load(url, load, refresh, endpoint)
+
+    async def _graphql(self, field: str, id: int | str) -> dict:
+        query_id = GraphQL._query_id(id, "tt" if field == "title" else "nm")
+        query = GraphQL._query(field, query_id)
+
+        async def load(entry: CacheEntry | None) -> CacheEntry:
+            return await GraphQL._afetch(query, field)
+
+        def refresh(entry: CacheEntry | None) -> CacheEntry:
+            return GraphQL._fetch(query, field)
+
+        value = await CACHE.aget_or_load(GraphQL._key(field, query_id), load, refresh, f"graphql.{field}")
+        type_name = GraphQL._FIELDS[field][1]
+        with METRICS.timer(f"graphql.{field}", "validate"):
+            return getattr(GraphQL.IMDbGraphQL, type_name)(**value).as_dict()
+
+    async def _get(self, field: str, id: int | str, subsection: str) -> dict:
+        if subsection != "" and self._parser != "Rest":
+            raise NotImplementedError("Subselection only possible via rest API.")
+        scheduled = priority(self._priority) if self._priority else nullcontext()
+        with scheduled, served_stale() as stale, METRICS.timer("imdbapi", "total"):
+            if self._parser == "Rest":
+                response = await self._rest(field, id, subsection)
+            else:
+                response = await self._graphql(field, id)
+            with METRICS.timer("imdbapi", "flatten"):
+                return StaleResult(flatten(response), stale) if stale else flatten(response)
+
+    async def getMovie(self, id: int | str = "", subsection: str = "") -> dict:
+        """Gets the movie information, see `IMDbAPI.getMovie`.
+
+        Args:
+            id (int | str): The ID of the movie, tt### or ###.
+            subselection (str, optional): The additional data to grab, `Rest` only.
+
+        Returns:
+            dict: The information gathered from the query.
+
+        Raises:
+            NotImplementedError: When a subselection is requested from `GraphQL`.
+            TypeError: When an agrument is not of the correct type.
+            ValueError: When an argument was of the correct type, but invalid values.
+            NotFound: When the ID does not exist, repeated lookups are answered from the cache.
+            HTTPError: Any lookup errors or connection issues.
+        """
+        return await self._get("title", id, subsection)
+
+    async def getPerson(self, id: int | str = "", subsection: str = "") -> dict:
+        """Gets the person information, see `IMDbAPI.getPerson`.
+
+        Args:
+            id (int | str): The ID of the person, nm### or ###.
+            subselection (str, optional): The additional data to grab, `Rest` only.
+
+        Returns:
+            dict: The information gathered from the query.
+
+        Raises:
+            NotImplementedError: When a subselection is requested from `GraphQL`.
+            TypeError: When an agrument is not of the correct type.
+            ValueError: When an argument was of the correct type, but invalid values.
+            NotFound: When the ID does not exist, repeated lookups are answered from the cache.
+            HTTPError: Any lookup errors or connection issues.
+        """
+        return await self._get("name", id, subsection)
+
+    async def _many(
+        self, field: str, ids: Iterable[int | str], concurrency: int
+    ) -> AsyncIterator[tuple[int | str, dict | Exception]]:
+        """Run lookups as tasks, at most `concurrency` at once, taking the IDs lazily."""
+        ids = iter(ids)
+        pending: dict[asyncio.Task, int | str] = {}
+        try:
+            for id in ids:
+                pending[asyncio.create_task(self._get(field, id, ""))] = id
+                if len(pending) >= concurrency:
+                    break
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    id = pending.pop(task)
+                    try:
+                        yield id, task.result()
+                    except Exception as error:
+                        yield id, error
+                    for id in ids:
+                        pending[asyncio.create_task(self._get(field, id, ""))] = id
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def getMovies(
+        self, ids: Iterable[int | str], concurrency: int = 32
+    ) -> AsyncIterator[tuple[int | str, dict | Exception]]:
+        """Gets many movies concurrently, each as `getMovie` would, see `IMDbAPI.getMovies`.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the movies, tt### or ###, consumed lazily.
+            concurrency (int, optional): The concurrent lookups.
+
+        Returns:
+            AsyncIterator[tuple[int | str, dict | Exception]]: The ID with its dict, or the error raised for it,
+                in completion order.
+
+        Raises:
+            TypeError: When concurrency is not an integer.
+            ValueError: When concurrency is below 1.
+        """
+        _check_workers(concurrency)
+        return self._many("title", ids, concurrency)
+
+    def getPeople(
+        self, ids: Iterable[int | str], concurrency: int = 32
+    ) -> AsyncIterator[tuple[int | str, dict | Exception]]:
+        """Gets many people concurrently, each as `getPerson` would, see `IMDbAPI.getPeople`.
+
+        Args:
+            ids (Iterable[int | str]): The IDs of the people, nm### or ###, consumed lazily.
+            concurrency (int, optional): The concurrent lookups.
+
+        Returns:
+            AsyncIterator[tuple[int | str, dict | Exception]]: The ID with its dict, or the error raised for it,
+                in completion order.
+
+        Raises:
+            TypeError: When concurrency is not an integer.
+            ValueError: When concurrency is below 1.
+        """
+        _check_workers(concurrency)
+        return self._many("name", ids, concurrency)
@@ -0,0 +1,787 @@
+"""Response cache shared by the `Rest` and `GraphQL` fetchers.
+Entries keep the HTTP validators (`ETag`/`Last-Modified`) they were served with,
+so an expired entry can be revalidated with a conditional request instead of re-downloaded.
+With `stale_while_revalidate` set, recently expired entries are served as is
+while a background worker refreshes them.
+Lookups of IDs that do not exist are cached as well, for the shorter `negative_ttl`.
+The contents can be exported to and warmed from JSON Lines snapshots.
+A `CacheBackend` can be set as a second tier shared between processes, such as `sharedcache.SharedMemoryBackend`.
+While the circuit of an endpoint is open, see `transport.breakers`, expired entries are served instead of
+raising `CircuitOpen`, `served_stale` tells which. `timed_loads` tells the time spent upstream.
+"""
+
+__all__ = ["CacheBackend", "CacheEntry", "NotFound", "ResponseCache", "StaleResult", "served_stale", "timed_loads", "CACHE"]
+
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator
+from requests.exceptions import HTTPError
+
+from SimpleIMDbDev.metrics import METRICS
+from SimpleIMDbDev.transport import CircuitOpen
+
+NO_EXPIRY = 0
+
+
+class NotFound(HTTPError, ValueError):
+    """The requested ID does not exist.
+    Subclasses both `HTTPError` (Rest) and `ValueError` (GraphQL) so existing handlers keep working.
+    """
+
+
+# The stale entries served by the current call, see `served_stale`.
+_SERVED: ContextVar[list | None] = ContextVar("SimpleIMDbDev_served_stale", default=None)
+
+
+@contextmanager
+def served_stale() -> Iterator[list[tuple[str, float, Exception]]]:
+    """Collect the expired entries served within the block because their endpoint's circuit was open.
+
+    Examples:
+        with served_stale() as stale:
+            movie = Rest.getMovie("tt0477051")
+        if stale:
+            ...
+
+    Returns:
+        Iterator[list[tuple[str, float, Exception]]]: A context manager giving the list,
+            filled with the key, the age in seconds and the `CircuitOpen` error of each stale entry served.
+    """
+    served: list[tuple[str, float, Exception]] = []
+    token = _SERVED.set(served)
+    try:
+        yield served
+    finally:
+        _SERVED.reset(token)
+
+
+# The seconds spent in the loaders run by the current call, see `timed_loads`.
+_LOADS: ContextVar[list | None] = ContextVar("SimpleIMDbDev_timed_loads", default=None)
+
+
+@contextmanager
+def timed_loads() -> Iterator[list[float]]:
+    """Collect the seconds spent in the loaders `get_or_load` runs within the block, the time spent upstream.
+    Cache hits and background refreshes add nothing.
+
+    Examples:
+        with timed_loads() as loads:
+            movie = Rest.getMovie("tt0477051")
+        if loads:
+            upstream = sum(loads)
+
+    Returns:
+        Iterator[list[float]]: A context manager giving the list, filled with the duration of each load,
+            whether it succeeded or raised.
+    """
+    loads: list[float] = []
+    token = _LOADS.set(loads)
+    try:
+        yield loads
+    finally:
+        _LOADS.reset(token)
+
+
+class StaleResult(dict):
+    """A result built from cached responses past their expiry, served while the upstream circuit was open.
+    It is the result dict, with `stale` set and the `age` in seconds of its oldest response.
+
+    Args:
+        result (dict): The result.
+        served (list[tuple[str, float, Exception]]): The stale entries used, from `served_stale`.
+    """
+
+    stale = True
+
+    def __init__(self, result: dict, served: list[tuple[str, float, Exception]]):
+        super().__init__(result)
+        self.age = max(age for _, age, _ in served)
+        self.error = served[0][2]
+
+
+class CacheEntry:
+    """A single cached response along with its validators.
+
+    Args:
+        value (Any): The decoded response.
+        etag (str, optional): The `ETag` header the response was served with.
+        last_modified (str, optional): The `Last-Modified` header the response was served with.
+    """
+
+    __slots__ = ("value", "etag", "last_modified", "stored", "expires", "hits", "raw")
+
+    def __init__(self, value: Any, etag: str = "", last_modified: str = ""):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored = 0.0
+        self.expires = 0.0
+        self.hits = 0
+        # JSON text of a value loaded by `warm`, decoded on first use.
+        self.raw = ""
+
+    def is_negative(self) -> bool:
+        """Whether the entry records a lookup of an ID that does not exist.
+
+        Returns:
+            bool: True when the cached value is a `NotFound`.
+        """
+        return isinstance(self.value, NotFound)
+
+    def is_fresh(self, now: float) -> bool:
+        """Whether the entry can be served without contacting the API.
+
+        Args:
+            now (float): The current time, `time.time()`.
+
+        Returns:
+            bool: True when the entry has no expiry or has not expired yet.
+        """
+        return self.expires == NO_EXPIRY or now < self.expires
+
+    def validators(self) -> dict:
+        """The conditional request headers for revalidating this entry.
+
+        Returns:
+            dict: `If-None-Match`/`If-Modified-Since` headers, empty if the entry has no validators.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _run(loader: Callable[[CacheEntry | None], CacheEntry], entry: CacheEntry | None) -> CacheEntry:
+    """Run a loader, timing it for `timed_loads`."""
+    loads = _LOADS.get()
+    if loads is None:
+        return loader(entry)
+    start = time.perf_counter()
+    try:
+        return loader(entry)
+    finally:
+        loads.append(time.perf_counter() - start)
+
+
+class CacheBackend:
+    """A second cache tier behind the in-process entries of a `ResponseCache`, shared between processes or hosts.
+    Values are snapshot records as written by `ResponseCache.export`, the backend only stores strings.
+    Backends must be safe to use from several threads.
+    """
+
+    def get(self, key: str) -> str | None:
+        """Gets the record of a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The record, None when missing or expired.
+        """
+        raise NotImplementedError
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        """Gets the records of many keys, backends can override this to batch the lookups.
+
+        Args:
+            keys (list[str]): The cache keys.
+
+        Returns:
+            list[str | None]: The records, in the order of the keys.
+        """
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, record: str, ttl: float) -> None:
+        """Store the record of a key.
+
+        Args:
+            key (str): The cache key.
+            record (str): The record.
+            ttl (float): Seconds to keep it, 0 for no expiry.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every record."""
+        raise NotImplementedError
+
+
+class ResponseCache:
+    """A TTL cache of API responses.
+
+    Notes:
+        - A `ttl` of 0 keeps entries forever, matching the previous `lru_cache` behaviour.
+        - Loaders are called outside of the lock, concurrent misses on one key may both load.
+        - Background refreshes run on a single daemon thread, a full refresh queue drops the refresh,
+            the entry is then loaded on the request path once it is too stale.
+        - A loader raising `NotFound` is cached for `negative_ttl`, the error is raised again on each hit.
+            Negative entries are never served stale nor refreshed in the background.
+        - With a `backend`, misses are looked up there before calling the loader and loaded entries are
+            written to it, negative entries stay local. Backend errors count as misses.
+            `prefetch` loads the entries of many keys from the backend at once, for bulk lookups.
+        - With `stale_if_open`, a loader raising `transport.CircuitOpen` is answered with the expired entry,
+            however old, when there is one. It is recorded in `served_stale`.
+
+    Args:
+        ttl (float, optional): Seconds an entry is served before it is revalidated.
+        stale_while_revalidate (float, optional): Seconds past expiry an entry is still served
+            while it is refreshed in the background, 0 disables it.
+        refresh_ahead (float, optional): Seconds before expiry a hot entry is refreshed in the background,
+            0 disables it.
+        hot_hits (int, optional): Hits within one `ttl` for an entry to count as hot.
+        max_refresh_queue (int, optional): Maximum number of queued background refreshes.
+        negative_ttl (float, optional): Seconds a `NotFound` is cached, 0 disables negative caching.
+        backend (CacheBackend | None, optional): A second tier shared with other processes.
+        stale_if_open (bool, optional): Serve expired entries while the circuit of their endpoint is open.
+    """
+
+    def __init__(
+        self,
+        ttl: float = NO_EXPIRY,
+        stale_while_revalidate: float = 0,
+        refresh_ahead: float = 0,
+        hot_hits: int = 2,
+        max_refresh_queue: int = 64,
+        negative_ttl: float = 60,
+        backend: CacheBackend | None = None,
+        stale_if_open: bool = True,
+    ):
+        for name, value in [
+            ("ttl", ttl),
+            ("stale_while_revalidate", stale_while_revalidate),
+            ("refresh_ahead", refresh_ahead),
+            ("negative_ttl", negative_ttl),
+        ]:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"The {name} must be a number, {type(value)} given.")
+            if value < 0:
+                raise ValueError(f"The {name} cannot be negative, {value} given.")
+        if not isinstance(hot_hits, int) or not isinstance(max_refresh_queue, int):
+            raise TypeError("The hot_hits and max_refresh_queue must be of type int.")
+        if max_refresh_queue < 1:
+            raise ValueError("The max_refresh_queue must be at least 1.")
+        if backend is not None and not isinstance(backend, CacheBackend):
+            raise TypeError(f"The backend must be a CacheBackend, {type(backend)} given.")
+        self.backend = backend
+        self.stale_if_open = stale_if_open
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_ahead = refresh_ahead
+        self.hot_hits = hot_hits
+        self.negative_ttl = negative_ttl
+        self._entries: dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._refresh_queue: queue.Queue = queue.Queue(max_refresh_queue)
+        self._refreshing: set[str] = set()
+        self._worker: threading.Thread | None = None
+        self._stats = dict.fromkeys(
+            [
+                "hits",
+                "negative_hits",
+                "misses",
+                "revalidations",
+                "not_modified",
+                "stale_hits",
+                "refreshes",
+                "refresh_errors",
+                "refresh_dropped",
+                "invalid",
+                "shared_hits",
+                "backend_errors",
+                "prefetched",
+                "stale_fallbacks",
+            ],
+            0,
+        )
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[CacheEntry | None], CacheEntry],
+        endpoint: str = "",
+        refresh: Callable[[CacheEntry | None], CacheEntry] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Get a value from the cache, loading it on a miss or after expiry.
+
+        The loader is given the expired entry, if any, so it can send a conditional request.
+        Returning that same entry means the API answered `304 Not Modified`.
+        Stale and hot entries are handed to the background worker along with `refresh`, the loader by default.
+
+        Args:
+            key (str): The cache key, typically the request URL.
+            loader (Callable): Fetches a new `CacheEntry`, given the expired entry or None.
+            endpoint (str, optional): The endpoint label the outcome is counted under in `METRICS`.
+            refresh (Callable | None, optional): The loader for background refreshes, which run after this call
+                returned, for loaders relying on resources that only live as long as the call.
+            raw (bool, optional): Return the JSON text of entries held as text, such as those loaded by `warm`,
+                instead of decoding them.
+
+        Returns:
+            Any: The cached or freshly loaded value, or its JSON text with `raw`.
+
+        Raises:
+            NotFound: When the loader, or a cached lookup within `negative_ttl`, found no such ID.
+            CircuitOpen: When the circuit of the endpoint is open and there is no expired entry to serve.
+            Any other error raised by the loader, nothing is cached in that case.
+        """
+        stat, entry = self._begin(key, refresh or loader, endpoint, raw)
+        if stat in ["hits", "shared_hits", "stale_hits"]:
+            return _value(entry, raw)  # type: ignore
+        try:
+            new_entry = _run(loader, entry)
+        except NotFound as error:
+            self._remember(key, error)
+            raise
+        except CircuitOpen as error:
+            return _value(self._fallback(key, entry, error, endpoint), raw)
+        return _value(self._finish(key, entry, new_entry, endpoint), raw)
+
+    async def aget_or_load(
+        self,
+        key: str,
+        loader: Callable[[CacheEntry | None], Awaitable[CacheEntry]],
+        refresh: Callable[[CacheEntry | None], CacheEntry],
+        endpoint: str = "",
+    ) -> Any:
+        """`get_or_load` for coroutines, the loader is awaited on a miss or after expiry.
+        Background refreshes run on the worker thread, they use the blocking `refresh` loader.
+        A `backend` lookup on a local miss blocks the event loop for its round trip.
+
+        Args:
+            key (str): The cache key, typically the request URL.
+            loader (Callable): A coroutine function fetching a new `CacheEntry`, given the expired entry or None.
+            refresh (Callable): The blocking loader of the same entry, for background refreshes.
+            endpoint (str, optional): The endpoint label the outcome is counted under in `METRICS`.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+
+        Raises:
+            NotFound: When the loader, or a cached lookup within `negative_ttl`, found no such ID.
+            Any other error raised by the loader, nothing is cached in that case.
+        """
+        stat, entry = self._begin(key, refresh, endpoint)
+        if stat in ["hits", "shared_hits", "stale_hits"]:
+            return entry.value  # type: ignore
+        try:
+            new_entry = await loader(entry)
+        except NotFound as error:
+            self._remember(key, error)
+            raise
+        except CircuitOpen as error:
+            return self._fallback(key, entry, error, endpoint).value
+        return self._finish(key, entry, new_entry, endpoint).value
+
+    def _begin(
+        self, key: str, loader: Callable[[CacheEntry | None], CacheEntry], endpoint: str, raw: bool = False
+    ) -> tuple[str, CacheEntry | None]:
+        """Look up a key locally then in the backend, counting the outcome.
+        Entries held as text are left undecoded with `raw`.
+
+        Raises:
+            NotFound: On a negative hit.
+        """
+        with self._lock:
+            stat, entry = self._lookup(key, loader, time.time(), raw)
+        if stat == "misses" and self.backend is not None:
+            stat, entry = self._from_backend(key, loader, raw)
+        with self._lock:
+            self._stats[stat] += 1
+        if METRICS.enabled:
+            METRICS.count(endpoint, f"cache_{stat}")
+        if stat == "negative_hits":
+            raise NotFound(*entry.value.args)  # type: ignore
+        return stat, entry
+
+    def _remember(self, key: str, error: NotFound) -> None:
+        """Cache a lookup that found nothing, for `negative_ttl`."""
+        if self.negative_ttl:
+            # Only the message is kept, not the response holding the body.
+            self.set(key, CacheEntry(NotFound(*error.args)))
+
+    def _fallback(self, key: str, entry: CacheEntry | None, error: CircuitOpen, endpoint: str) -> CacheEntry:
+        """Serve the expired entry while the circuit is open, raise the error without one."""
+        if entry is None or not self.stale_if_open:
+            raise error
+        age = time.time() - entry.stored
+        with self._lock:
+            self._stats["stale_fallbacks"] += 1
+        if METRICS.enabled:
+            METRICS.count(endpoint, "cache_stale_fallbacks")
+        served = _SERVED.get()
+        if served is not None:
+            served.append((key, age, error))
+        return entry
+
+    def _finish(self, key: str, entry: CacheEntry | None, new_entry: CacheEntry, endpoint: str) -> CacheEntry:
+        """Store a loaded entry, `entry` when the API answered `304 Not Modified`."""
+        with self._lock:
+            if new_entry is entry:
+                self._stats["not_modified"] += 1
+            self._store(key, new_entry, time.time())
+        if METRICS.enabled and new_entry is entry:
+            METRICS.count(endpoint, "cache_not_modified")
+        self._publish(key, new_entry)
+        return new_entry
+
+    def _lookup(
+        self, key: str, loader: Callable[[CacheEntry | None], CacheEntry], now: float, raw: bool = False
+    ) -> tuple[str, CacheEntry | None]:
+        """Find the entry for a key and how it can be used, must be called holding the lock.
+
+        Returns:
+            tuple[str, CacheEntry | None]: The statistic to count and the entry, None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.raw and not raw and not self._decode(key, entry):
+            entry = None
+        if entry is not None and entry.is_negative():
+            if entry.is_fresh(now):
+                return "negative_hits", entry
+            entry = None
+        if entry is None:
+            return "misses", None
+        if entry.is_fresh(now):
+            entry.hits += 1
+            if self._is_hot(entry, now):
+                self._schedule_refresh(key, entry, loader)
+            return "hits", entry
+        if now < entry.expires + self.stale_while_revalidate:
+            self._schedule_refresh(key, entry, loader)
+            return "stale_hits", entry
+        return "revalidations", entry
+
+    def _from_backend(
+        self, key: str, loader: Callable[[CacheEntry | None], CacheEntry], raw: bool = False
+    ) -> tuple[str, CacheEntry | None]:
+        """Look up a local miss in the backend, a found record is stored locally with its original time."""
+        try:
+            record = self.backend.get(key)  # type: ignore
+        except Exception:
+            with self._lock:
+                self._stats["backend_errors"] += 1
+            return "misses", None
+        if record is None:
+            return "misses", None
+        try:
+            _, entry, stored = _parse_record(record)
+        except ValueError:
+            return "misses", None
+        with self._lock:
+            if key not in self._entries:
+                self._store(key, entry, stored)
+            stat, entry = self._lookup(key, loader, time.time(), raw)
+        return ("shared_hits" if stat == "hits" else stat), entry
+
+    def _publish(self, key: str, entry: CacheEntry) -> None:
+        """Write a loaded entry to the backend."""
+        if self.backend is None or entry.is_negative():
+            return
+        ttl = self.ttl + self.stale_while_revalidate if self.ttl else NO_EXPIRY
+        try:
+            self.backend.set(key, _record(key, entry), ttl)
+        except Exception:
+            with self._lock:
+                self._stats["backend_errors"] += 1
+
+    def _is_hot(self, entry: CacheEntry, now: float) -> bool:
+        """A hot entry is one hit often enough that it should be refreshed before it expires."""
+        return bool(
+            self.refresh_ahead
+            and entry.expires != NO_EXPIRY
+            and entry.hits >= self.hot_hits
+            and now >= entry.expires - self.refresh_ahead
+        )
+
+    def _schedule_refresh(
+        self, key: str, entry: CacheEntry, loader: Callable[[CacheEntry | None], CacheEntry]
+    ) -> None:
+        """Queue a background refresh, must be called holding the lock."""
+        if key in self._refreshing:
+            return
+        try:
+            self._refresh_queue.put_nowait((key, entry, loader))
+        except queue.Full:
+            self._stats["refresh_dropped"] += 1
+            return
+        self._refreshing.add(key)
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._refresh_worker, name="SimpleIMDbDev-refresh", daemon=True
+            )
+            self._worker.start()
+
+    def _refresh_worker(self) -> None:
+        while True:
+            key, entry, loader = self._refresh_queue.get()
+            with self._lock:
+                self._stats["refreshes"] += 1
+                self._stats["revalidations"] += 1
+            try:
+                new_entry = loader(entry)
+            except NotFound as error:
+                # The ID was removed upstream, stop serving the old entry.
+                with self._lock:
+                    if self._entries.get(key) is entry and self.negative_ttl:
+                        self._store(key, CacheEntry(NotFound(*error.args)), time.time())
+                    elif self._entries.get(key) is entry:
+                        del self._entries[key]
+            except Exception:
+                # Keep serving the stale entry, it is retried on the next stale hit.
+                with self._lock:
+                    self._stats["refresh_errors"] += 1
+            else:
+                with self._lock:
+                    if new_entry is entry:
+                        self._stats["not_modified"] += 1
+                    if self._entries.get(key) is entry:
+                        self._store(key, new_entry, time.time())
+                self._publish(key, new_entry)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+                self._refresh_queue.task_done()
+
+    def wait_for_refreshes(self) -> None:
+        """Block until every queued background refresh has finished.
+
+        Returns:
+            None: No return
+        """
+        self._refresh_queue.join()
+
+    def prefetch(self, keys: list[str]) -> int:
+        """Load the records of many keys from the backend in one batch, ahead of their lookups.
+        Keys already held are skipped, backend errors are counted and ignored.
+
+        Args:
+            keys (list[str]): The cache keys.
+
+        Returns:
+            int: The number of entries loaded from the backend.
+        """
+        if self.backend is None:
+            return 0
+        with self._lock:
+            missing = [key for key in dict.fromkeys(keys) if key not in self._entries]
+        if not missing:
+            return 0
+        try:
+            records = self.backend.get_many(missing)
+        except Exception:
+            with self._lock:
+                self._stats["backend_errors"] += 1
+            return 0
+        loaded = 0
+        for key, record in zip(missing, records):
+            if record is None:
+                continue
+            try:
+                _, entry, stored = _parse_record(record)
+            except ValueError:
+                continue
+            with self._lock:
+                if key not in self._entries:
+                    self._store(key, entry, stored)
+                    loaded += 1
+        with self._lock:
+            self._stats["prefetched"] += loaded
+        return loaded
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry directly, stamping its expiry from the cache `ttl`.
+
+        Args:
+            key (str): The cache key.
+            entry (CacheEntry): The entry to store.
+
+        Returns:
+            None: No return
+        """
+        with self._lock:
+            self._store(key, entry, time.time())
+
+    def _store(self, key: str, entry: CacheEntry, now: float) -> None:
+        ttl = self.negative_ttl if entry.is_negative() else self.ttl
+        entry.hits = 0
+        entry.stored = now
+        entry.expires = now + ttl if ttl else NO_EXPIRY
+        self._entries[key] = entry
+
+    def _decode(self, key: str, entry: CacheEntry) -> bool:
+        """Decode an entry loaded by `warm`, dropping it when invalid.
+        Must be called holding the lock."""
+        try:
+            value = json.loads(entry.raw)
+        except ValueError:
+            value = None
+        if not isinstance(value, dict):
+            self._stats["invalid"] += 1
+            del self._entries[key]
+            return False
+        entry.value = value
+        entry.raw = ""
+        return True
+
+    def export(self, path: str) -> int:
+        """Write the cache to a JSON Lines snapshot, one entry per line.
+        Negative entries are left out, entries not yet decoded since `warm` are written as is.
+
+        Args:
+            path (str): The file to write.
+
+        Returns:
+            int: The number of entries written.
+        """
+        with self._lock:
+            entries = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if not entry.is_negative()
+            ]
+        with open(path, "w", encoding="utf-8") as file:
+            for key, entry in entries:
+                file.write(_record(key, entry) + "\n")
+        return len(entries)
+
+    def warm(self, path: str) -> int:
+        """Load a JSON Lines snapshot written by `export` into the cache.
+        The file is streamed and values are only decoded and validated when first used,
+        invalid values are then dropped as a miss. Keys already in the cache are kept.
+
+        Notes:
+            - Entries keep the time they were stored, so old snapshots warm with expired entries.
+                Those still carry their validators and are revalidated with a conditional request.
+
+        Args:
+            path (str): The snapshot to read.
+
+        Returns:
+            int: The number of entries loaded.
+
+        Raises:
+            ValueError: When a line is not a snapshot record.
+        """
+        loaded = 0
+        with open(path, encoding="utf-8") as file:
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    key, entry, stored = _parse_record(line.rstrip())
+                except ValueError as error:
+                    raise ValueError(f"Invalid snapshot record on line {number}: {error}")
+                with self._lock:
+                    if key not in self._entries:
+                        self._store(key, entry, stored)
+                        loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics.
+
+        Returns:
+            None: No return
+        """
+        with self._lock:
+            self._entries.clear()
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+    def stats(self) -> dict:
+        """Gets the cache statistics.
+
+        Returns:
+            dict: The hit, miss, revalidation, background refresh and invalid snapshot entry counters,
+                along with `revalidation_hit_rate`, the share of revalidations answered by `304 Not Modified`.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        revalidations = stats["revalidations"]
+        stats["revalidation_hit_rate"] = (
+            stats["not_modified"] / revalidations if revalidations else 0.0
+        )
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+
+def _value(entry: CacheEntry, raw: bool) -> Any:
+    """The value of an entry, or its JSON text when it is held as text and `raw` is set."""
+    return (entry.raw or entry.value) if raw else entry.value
+
+
+def _record(key: str, entry: CacheEntry) -> str:
+    """The snapshot record of an entry, on one line."""
+    header = json.dumps(
+        {
+            "key": key,
+            "stored": entry.stored,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+    )
+    value = entry.raw or json.dumps(entry.value)
+    # The value is kept last so `warm` can split it off without decoding it.
+    return f'{header[:-1]}, "value": {value}}}'
+
+
+def _parse_record(line: str) -> tuple[str, CacheEntry, float]:
+    """Parse a snapshot record into an undecoded entry.
+
+    Returns:
+        tuple[str, CacheEntry, float]: The key, the entry and the time it was stored.
+
+    Raises:
+        ValueError: When the line is not a snapshot record.
+    """
+    try:
+        record, value = _split_record(line)
+        entry = CacheEntry(
+            None,
+            etag=record.get("etag", ""),
+            last_modified=record.get("last_modified", ""),
+        )
+        entry.raw = value
+        return record["key"], entry, float(record.get("stored") or time.time())
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        raise ValueError(error)
+
+
+def _split_record(line: str) -> tuple[dict, str]:
+    """Split a snapshot line into its record and the undecoded JSON text of its value.
+    Lines written by `ResponseCache.export` keep the value last, only the small header is decoded.
+
+    Args:
+        line (str): A line of a snapshot.
+
+    Returns:
+        tuple[dict, str]: The record without its value, and the value as JSON text.
+
+    Raises:
+        ValueError: When the line is not valid JSON.
+        KeyError: When the line has no value.
+    """
+    head, separator, value = line.partition(', "value": ')
+    if separator and value.endswith("}"):
+        try:
+            return json.loads(head + "}"), value[:-1]
+        except ValueError:
+            pass
+    record = json.loads(line)
+    return record, json.dumps(record["value"])
+
+
+CACHE = ResponseCache()
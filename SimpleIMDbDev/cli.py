@@ -0,0 +1,404 @@
+"""Command line interface, run with `simpleimdbdev` or `python -m SimpleIMDbDev`.
+IDs and queries are read one per line from files or stdin, results are written as JSON Lines, CSV or Parquet.
+"""
+
+__all__ = ["main"]
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Callable, Iterable, Iterator, TextIO
+
+from SimpleIMDbDev import IMDbAPI
+
+FORMATS = ["jsonl", "csv", "parquet"]
+PARQUET_BATCH_SIZE = 1000
+
+try:
+    from tqdm import tqdm as _tqdm
+except ImportError:
+    _tqdm = None
+
+
+def _read_lines(inputs: list[str]) -> Iterator[str]:
+    """Stream the non empty lines of the inputs, `-` or no input reads stdin. Lines starting with `#` are skipped."""
+    for path in inputs or ["-"]:
+        handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for line in handle:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+
+
+def _read_records(path: str) -> Iterator[dict]:
+    """Stream the rows of a JSON Lines or CSV file, by extension, `-` reads JSON Lines from stdin."""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        if path.endswith(".csv"):
+            yield from csv.DictReader(handle)
+            return
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+class _JSONLinesWriter:
+    def __init__(self, handle: TextIO):
+        self.handle = handle
+
+    def write(self, row: dict) -> None:
+        self.handle.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+    def close(self) -> None:
+        self.handle.flush()
+
+
+class _CSVWriter:
+    """Columns are taken from the first row, nested values are written as JSON."""
+
+    def __init__(self, handle: TextIO):
+        self.handle = handle
+        self.writer: csv.DictWriter | None = None
+
+    def write(self, row: dict) -> None:
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.handle, list(row), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerow(
+            {
+                key: json.dumps(value, ensure_ascii=False, default=str)
+                if isinstance(value, (dict, list))
+                else value
+                for key, value in row.items()
+            }
+        )
+
+    def close(self) -> None:
+        self.handle.flush()
+
+
+class _ParquetWriter:
+    """Rows are written in batches, the schema is inferred from the first batch."""
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires the `pyarrow` package.")
+        self.pyarrow = pyarrow
+        self.path = path
+        self.writer = None
+        self.rows: list[dict] = []
+
+    def write(self, row: dict) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self.rows:
+            return
+        schema = self.writer.schema if self.writer is not None else None
+        table = self.pyarrow.Table.from_pylist(self.rows, schema=schema)
+        if self.writer is None:
+            self.writer = self.pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+        self.rows = []
+
+    def close(self) -> None:
+        self._flush()
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _open_writer(args: argparse.Namespace, api: IMDbAPI):
+    """The writer for the `--format`, inferred from the `--output` extension when not given.
+    Titles from `get movie` are written to Parquet with the typed columns of `columnar.title_schema`."""
+    output_format = args.format
+    if not output_format:
+        extension = os.path.splitext(args.output)[1].lstrip(".")
+        output_format = extension if extension in FORMATS else "jsonl"
+    if output_format == "parquet":
+        if args.output == "-":
+            raise ValueError("Parquet output requires an --output file.")
+        if args.command == "get" and args.kind == "movie":
+            from SimpleIMDbDev.columnar import ColumnarWriter
+
+            return ColumnarWriter(args.output, parser=api._parser)
+        return _ParquetWriter(args.output)
+    handle = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    if output_format == "csv":
+        return _CSVWriter(handle)
+    return _JSONLinesWriter(handle)
+
+
+class _Progress:
+    """Counts the results for the progress bar and the final throughput line."""
+
+    def __init__(self, enabled: bool):
+        self.ok = 0
+        self.failed = 0
+        self.start = time.perf_counter()
+        self.bar = None
+        self._printed = 0.0
+        self.enabled = enabled and sys.stderr.isatty()
+        if self.enabled and _tqdm is not None:
+            self.bar = _tqdm(unit="lookup", file=sys.stderr)
+
+    def update(self, ok: bool) -> None:
+        if ok:
+            self.ok += 1
+        else:
+            self.failed += 1
+        if self.bar is not None:
+            self.bar.update()
+        elif self.enabled and time.perf_counter() - self._printed > 0.5:
+            self._printed = time.perf_counter()
+            print(f"\r{self._line()}", end="", file=sys.stderr)
+
+    def _line(self) -> str:
+        elapsed = time.perf_counter() - self.start
+        rate = (self.ok + self.failed) / elapsed if elapsed else 0.0
+        return f"{self.ok} ok, {self.failed} failed in {elapsed:.1f}s ({rate:.1f}/s)"
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+        elif self.enabled:
+            print(file=sys.stderr)
+        print(self._line(), file=sys.stderr)
+
+
+def _setup(args: argparse.Namespace) -> IMDbAPI:
+    """The API for a lookup command, with the rate limit and persistent cache applied."""
+    from SimpleIMDbDev import transport
+
+    transport.limit(args.rate)
+    api = IMDbAPI(args.parser, args.dataset)
+    if args.cache and os.path.exists(args.cache):
+        api.warm(args.cache)
+    return api
+
+
+def _run(
+    args: argparse.Namespace,
+    api: IMDbAPI,
+    results: Iterable[tuple[object, dict | list[dict] | Exception]],
+    label: Callable[[object], object] = str,
+) -> int:
+    """Write the results with progress, then save the persistent cache. The exit code is 1 when a lookup failed."""
+    writer = _open_writer(args, api)
+    progress = _Progress(not args.quiet)
+    try:
+        for key, result in results:
+            if isinstance(result, Exception):
+                print(f"{label(key)}: {result}", file=sys.stderr)
+                progress.update(False)
+                continue
+            for row in result if isinstance(result, list) else [result]:
+                writer.write(row)
+            progress.update(True)
+    finally:
+        writer.close()
+        progress.close()
+        if args.cache:
+            api.export(args.cache)
+    return 1 if progress.failed else 0
+
+
+def _get(args: argparse.Namespace) -> int:
+    """Look up the IDs read from the inputs."""
+    api = _setup(args)
+    ids = _read_lines(args.inputs)
+    lookup = api.getMovies if args.kind == "movie" else api.getPeople
+    results = lookup(ids, args.workers, args.processes)
+    return _run(args, api, results)
+
+
+def _search(args: argparse.Namespace) -> int:
+    """Search the queries read from the inputs, one row per result tagged with its `query`."""
+    from SimpleIMDbDev import _bulk
+
+    api = _setup(args)
+
+    def search(line: str) -> list[dict]:
+        query, _, year = line.partition("\t")
+        results = api.searchMovie(query, int(year or args.year), args.max_year_difference)
+        return [{"query": line, **result} for result in results]
+
+    return _run(args, api, _bulk(search, _read_lines(args.inputs), args.workers))
+
+
+def _enrich(args: argparse.Namespace) -> int:
+    """Merge the lookup of each row's ID column into the row, with the lookup's fields prefixed."""
+    from SimpleIMDbDev import _bulk
+
+    api = _setup(args)
+    lookup = api.getMovie if args.kind == "movie" else api.getPerson
+
+    def enrich(row: dict) -> dict:
+        result = lookup(row[args.column])
+        return {**row, **{f"{args.prefix}{key}": value for key, value in result.items()}}
+
+    results = _bulk(enrich, _read_records(args.input), args.workers)
+    return _run(args, api, results, label=lambda row: row.get(args.column))
+
+
+def _cache_warm(args: argparse.Namespace) -> int:
+    """Load snapshots into the cache, optionally writing the merged result."""
+    api = IMDbAPI(args.parser, args.dataset)
+    start = time.perf_counter()
+    for snapshot in args.snapshots:
+        loaded = api.warm(snapshot)
+        print(f"Loaded {loaded} entries from {snapshot}.", file=sys.stderr)
+    print(
+        f"Cache warm with {api.cacheStats()['entries']} entries"
+        f" in {time.perf_counter() - start:.3f}s.",
+        file=sys.stderr,
+    )
+    if args.export:
+        written = api.export(args.export)
+        print(f"Wrote {written} entries to {args.export}.", file=sys.stderr)
+    return 0
+
+
+def _cache_export(args: argparse.Namespace) -> int:
+    """Fetch the given IDs and write the cache to a snapshot."""
+    api = IMDbAPI(args.parser, args.dataset)
+    for snapshot in args.warm:
+        api.warm(snapshot)
+    for id in args.movie:
+        api.getMovie(id)
+    for id in args.person:
+        api.getPerson(id)
+    written = api.export(args.output)
+    print(f"Wrote {written} entries to {args.output}.", file=sys.stderr)
+    return 0
+
+
+def _dataset_ingest(args: argparse.Namespace) -> int:
+    """Ingest IMDb TSV dumps for the `Dataset` parser."""
+    from SimpleIMDbDev import Dataset
+
+    start = time.perf_counter()
+    counts = Dataset.ingest(args.directory, args.database)
+    for name, count in counts.items():
+        print(f"{name}: {count} rows", file=sys.stderr)
+    print(f"Ingested in {time.perf_counter() - start:.1f}s.", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command line interface.
+
+    Returns:
+        argparse.ArgumentParser: The parser, each subcommand sets `func`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="simpleimdbdev", description="Fetch data from imdbapi.dev"
+    )
+    parser.add_argument(
+        "--parser", default="Rest", help="The API to use, Rest, GraphQL, Dataset or auto."
+    )
+    parser.add_argument(
+        "--dataset", default="", help="The database for the Dataset parser."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache = commands.add_parser("cache", help="Manage response cache snapshots.")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    warm = cache_commands.add_parser(
+        "warm", help="Load JSON Lines snapshots into the cache."
+    )
+    warm.add_argument("snapshots", nargs="+", help="Snapshots to load.")
+    warm.add_argument("--export", default="", help="Write the merged cache here.")
+    warm.set_defaults(func=_cache_warm)
+    export = cache_commands.add_parser(
+        "export", help="Fetch IDs and write the cache to a JSON Lines snapshot."
+    )
+    export.add_argument("output", help="The snapshot to write.")
+    export.add_argument("--movie", action="append", default=[], help="A movie ID.")
+    export.add_argument("--person", action="append", default=[], help="A person ID.")
+    export.add_argument(
+        "--warm", action="append", default=[], help="A snapshot to start from."
+    )
+    export.set_defaults(func=_cache_export)
+
+    lookup = argparse.ArgumentParser(add_help=False)
+    lookup.add_argument(
+        "-o", "--output", default="-", help="The file to write, stdout by default."
+    )
+    lookup.add_argument(
+        "--format", choices=FORMATS, default="", help="Inferred from the output extension, JSON Lines otherwise."
+    )
+    lookup.add_argument("--workers", type=int, default=8, help="The concurrent lookups.")
+    lookup.add_argument(
+        "--rate", type=float, default=0, help="The upstream requests per second, 0 for no limit."
+    )
+    lookup.add_argument(
+        "--cache", default="", help="A snapshot loaded before and saved after the run."
+    )
+    lookup.add_argument("-q", "--quiet", action="store_true", help="Hide the progress.")
+
+    get = commands.add_parser(
+        "get", parents=[lookup], help="Look up IDs read one per line."
+    )
+    get.add_argument("kind", choices=["movie", "person"], help="The type of the IDs.")
+    get.add_argument("inputs", nargs="*", help="Files of IDs, stdin when none or `-`.")
+    get.add_argument(
+        "--processes", type=int, default=0, help="Build GraphQL objects on this many processes."
+    )
+    get.set_defaults(func=_get)
+
+    search = commands.add_parser(
+        "search", parents=[lookup], help="Search queries read one per line, `query<TAB>year` filters by year."
+    )
+    search.add_argument("inputs", nargs="*", help="Files of queries, stdin when none or `-`.")
+    search.add_argument("--year", type=int, default=0, help="The year for queries without one.")
+    search.add_argument(
+        "--max-year-difference", type=int, default=2, help="The year window, negative for no filtering."
+    )
+    search.set_defaults(func=_search)
+
+    enrich = commands.add_parser(
+        "enrich", parents=[lookup], help="Add the lookup of an ID column to each row of a JSON Lines or CSV file."
+    )
+    enrich.add_argument("input", help="The JSON Lines or CSV (by extension) file, `-` for JSON Lines on stdin.")
+    enrich.add_argument("--kind", choices=["movie", "person"], default="movie", help="The type of the IDs.")
+    enrich.add_argument("--column", default="id", help="The column holding the IDs.")
+    enrich.add_argument("--prefix", default="imdb_", help="Prepended to the added fields.")
+    enrich.set_defaults(func=_enrich)
+
+    dataset = commands.add_parser("dataset", help="Manage the offline dataset.")
+    dataset_commands = dataset.add_subparsers(dest="dataset_command", required=True)
+    ingest = dataset_commands.add_parser(
+        "ingest", help="Ingest IMDb TSV dumps into a SQLite database."
+    )
+    ingest.add_argument("directory", help="The folder holding the dumps.")
+    ingest.add_argument("database", help="The SQLite database to create or update.")
+    ingest.set_defaults(func=_dataset_ingest)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv (list[str] | None, optional): The arguments, `sys.argv[1:]` when not given.
+
+    Returns:
+        int: The exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
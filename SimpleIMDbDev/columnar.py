@@ -0,0 +1,263 @@
+"""Columnar export of `IMDbAPI` title results into Arrow record batches, Parquet files and NumPy arrays.
+Values are appended straight into per column buffers and converted once per batch,
+no DataFrame pivot or intermediate row objects are involved.
+
+Requires the optional `pyarrow` package, NumPy for `to_numpy`.
+
+Examples:
+    with ColumnarWriter("titles.parquet") as writer:
+        for id, title in IMDbAPI().getMovies(ids):
+            writer.write(title)
+"""
+
+__all__ = ["ColumnarWriter", "title_schema", "to_table", "to_numpy", "REST_TITLE"]
+
+from typing import Any, Iterable
+
+from SimpleIMDbDev.GraphQL import IMDbGraphQL, _types
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+BATCH_SIZE = 10_000
+# Low cardinality fields, stored dictionary encoded wherever they appear.
+CATEGORICAL = {"type", "genres", "category", "country_code", "language_code"}
+# The numeric columns returned by `to_numpy`, nested fields are joined with a dot.
+NUMERIC = ["start_year", "end_year", "runtime_minutes", "rating.aggregate_rating", "rating.votes_count"]
+
+# The `Rest` title shape, including the `akas` and `credits` subselections, in the `IMDbGraphQL` SCHEMA notation.
+# Nested shapes are dicts of field types.
+_IMAGE = {"url": str, "width": int, "height": int}
+REST_TITLE = {
+    "id": str,
+    "type": str,
+    "is_adult": bool,
+    "primary_title": str,
+    "original_title": str,
+    "primary_image": _IMAGE,
+    "genres": (list, str),
+    "rating": {"aggregate_rating": float, "votes_count": int},
+    "start_year": int,
+    "end_year": int,
+    "runtime_minutes": int,
+    "plot": str,
+    "akas": (list, {"country_code": str, "language_code": str, "text": str, "attributes": (list, str)}),
+    "credits": (
+        list,
+        {
+            "name": {"id": str, "display_name": str, "primary_image": _IMAGE},
+            "category": str,
+            "characters": (list, str),
+        },
+    ),
+}
+
+
+def _require() -> None:
+    if pyarrow is None:
+        raise ImportError("Columnar export requires the `pyarrow` package.")
+
+
+def _shape(schema: dict, nested: bool = False) -> dict:
+    """Convert an `IMDbGraphQL` SCHEMA to the nested shape notation of `REST_TITLE`.
+    Nested types keep only their main attributes, as in the queries, which also ends the Title/Name recursion.
+    """
+    shape = {}
+    for field, (field_type, _, main) in schema.items():
+        if nested and not main:
+            continue
+        if isinstance(field_type, str):
+            shape[field] = _shape(_types()[field_type].SCHEMA, True)
+        elif isinstance(field_type, tuple) and isinstance(field_type[1], str):
+            shape[field] = (list, _shape(_types()[field_type[1]].SCHEMA, True))
+        else:
+            shape[field] = field_type
+    return shape
+
+
+def _arrow_type(field: str, field_type: Any):
+    if isinstance(field_type, dict):
+        return pyarrow.struct([(name, _arrow_type(name, value)) for name, value in field_type.items()])
+    if isinstance(field_type, tuple):
+        return pyarrow.list_(_arrow_type(field, field_type[1]))
+    if field_type is str:
+        if field in CATEGORICAL:
+            return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        return pyarrow.string()
+    if field_type is bool:
+        return pyarrow.bool_()
+    if field_type is int:
+        return pyarrow.int64()
+    if field_type is float:
+        return pyarrow.float64()
+    raise TypeError(f"Field '{field}' has no columnar type, {field_type} given.")
+
+
+def title_schema(parser: str = "GraphQL"):
+    """The Arrow schema of the titles returned by a parser.
+
+    Args:
+        parser (str, optional): `GraphQL`, or `Rest`, `Dataset` and `auto` which share the `REST_TITLE` shape.
+
+    Returns:
+        pyarrow.Schema: The typed columns, lists for nested lists and structs for nested objects.
+
+    Raises:
+        ImportError: When `pyarrow` is not installed.
+        ValueError: When the parser is unknown.
+    """
+    _require()
+    match parser.lower():
+        case "graphql":
+            shape = _shape(IMDbGraphQL.Title.SCHEMA)
+        case "rest" | "dataset" | "auto":
+            shape = REST_TITLE
+        case _:
+            raise ValueError(f"Unknown parser '{parser}', use GraphQL, Rest, Dataset or auto.")
+    return pyarrow.schema([(field, _arrow_type(field, value)) for field, value in shape.items()])
+
+
+class ColumnarWriter:
+    """Collects title dicts into typed Arrow record batches, optionally writing them to Parquet as they fill.
+    Fields outside the schema are ignored, missing fields are null.
+
+    Args:
+        path (str, optional): The Parquet file to write, batches are kept in `batches` when not given.
+        parser (str, optional): The parser that produced the titles, see `title_schema`.
+        batch_size (int, optional): The rows per record batch and Parquet row group.
+    """
+
+    def __init__(self, path: str = "", parser: str = "GraphQL", batch_size: int = BATCH_SIZE):
+        _require()
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"The batch size must be a positive integer, {batch_size} given.")
+        self.schema = title_schema(parser)
+        self.path = path
+        self.batch_size = batch_size
+        self.batches: list = []
+        self.rows = 0
+        self._columns: list[list] = [[] for _ in self.schema.names]
+        self._pending = 0
+        # The Arrow schema is not stored, nested dictionaries that change between row groups cannot be read back.
+        # The strings are still dictionary encoded in the file, `read_dictionary` restores the Arrow type.
+        self._writer = (
+            pyarrow.parquet.ParquetWriter(path, self.schema, store_schema=False) if path else None
+        )
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, title: dict) -> None:
+        """Append one title, such as the result of `IMDbAPI.getMovie`.
+
+        Args:
+            title (dict): The title.
+
+        Raises:
+            TypeError: When the title is not a dict.
+        """
+        if not isinstance(title, dict):
+            raise TypeError(f"The title must be a dict, {type(title)} given.")
+        get = title.get
+        for column, name in zip(self._columns, self.schema.names):
+            column.append(get(name))
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def extend(self, titles: Iterable[dict]) -> int:
+        """Append many titles.
+
+        Args:
+            titles (Iterable[dict]): The titles.
+
+        Returns:
+            int: The number of titles appended.
+        """
+        count = 0
+        for title in titles:
+            self.write(title)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """Convert the buffered titles to a record batch, written to the Parquet file when there is one."""
+        if not self._pending:
+            return
+        arrays = [
+            pyarrow.array(column, type=field.type) for column, field in zip(self._columns, self.schema)
+        ]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+        else:
+            self.batches.append(batch)
+        self.rows += self._pending
+        self._columns = [[] for _ in self.schema.names]
+        self._pending = 0
+
+    def table(self):
+        """The batches kept in memory as a table.
+
+        Returns:
+            pyarrow.Table: The titles written so far, without a path.
+        """
+        self.flush()
+        return pyarrow.Table.from_batches(self.batches, schema=self.schema)
+
+    def close(self) -> None:
+        """Flush the remaining titles and close the Parquet file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def to_table(titles: Iterable[dict], parser: str = "GraphQL"):
+    """Convert titles to an Arrow table.
+
+    Args:
+        titles (Iterable[dict]): The titles, such as the results of `IMDbAPI.getMovie`.
+        parser (str, optional): The parser that produced the titles, see `title_schema`.
+
+    Returns:
+        pyarrow.Table: The typed table.
+
+    Raises:
+        ImportError: When `pyarrow` is not installed.
+    """
+    writer = ColumnarWriter(parser=parser)
+    writer.extend(titles)
+    return writer.table()
+
+
+def to_numpy(table, columns: list[str] = NUMERIC) -> dict[str, Any]:
+    """The numeric columns of a table as NumPy arrays, missing values are `nan`.
+
+    Args:
+        table (pyarrow.Table): A table from `to_table` or `ColumnarWriter.table`.
+        columns (list[str], optional): The columns, nested fields joined with a dot such as `rating.votes_count`.
+
+    Returns:
+        dict[str, numpy.ndarray]: The float arrays by column.
+
+    Raises:
+        ImportError: When `pyarrow` or NumPy are not installed.
+        KeyError: When a column is not in the table.
+    """
+    _require()
+    arrays = {}
+    for name in columns:
+        path = name.split(".")
+        column = table.column(path[0])
+        for field in path[1:]:
+            column = pyarrow.compute.struct_field(column, field)
+        arrays[name] = column.cast(pyarrow.float64()).to_numpy()
+    return arrays
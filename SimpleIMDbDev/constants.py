@@ -1,7 +1,25 @@
-from importlib.metadata import version
+from functools import lru_cache
 
 BASE_MODULE_NAME = __name__.split(".")[0]
-BASE_HEADERS = {
-    "User-Agent": f"{BASE_MODULE_NAME} ({version(BASE_MODULE_NAME)})",
-    "Accept": "application/json",
-}
+
+
+@lru_cache(maxsize=None)
+def base_headers() -> dict[str, str]:
+    """The headers sent with every request, resolved on first use.
+    Looking up the installed version scans the installed distributions, which is slow in large environments.
+
+    Returns:
+        dict[str, str]: The `User-Agent` and `Accept` headers.
+    """
+    from importlib.metadata import version
+
+    return {
+        "User-Agent": f"{BASE_MODULE_NAME} ({version(BASE_MODULE_NAME)})",
+        "Accept": "application/json",
+    }
+
+
+def __getattr__(name: str):
+    if name == "BASE_HEADERS":
+        return base_headers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
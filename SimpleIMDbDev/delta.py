@@ -0,0 +1,222 @@
+"""Delta sync, emitting only the records that changed since the previous run, as field-level patches.
+The previous version of each record is kept in a `DeltaStore`, with a content hash compared first,
+so unchanged records cost one hash and one indexed lookup. Changed ones are diffed structurally.
+
+Patches are JSON Patch (RFC 6902) operations, `{"op": "replace", "path": "/rating/votes_count", "value": 84390}`.
+
+Examples:
+    with DeltaStore("titles.sqlite") as store:
+        for change in IMDbAPI("Rest").syncMovies(ids, store):
+            write(change.id, change.patch)
+"""
+
+__all__ = ["Change", "DeltaStore", "content_hash", "diff", "sync"]
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from SimpleIMDbDev.cache import NotFound
+
+# Writes to the store are committed in batches of this many records.
+COMMIT_EVERY = 500
+
+
+class Change(NamedTuple):
+    """A record that differs from its stored version.
+
+    `kind` is `added` (not stored before), `changed`, `removed` (stored, now not found)
+    or `error` (the lookup failed, the stored version is kept).
+    `patch` holds JSON Patch operations, empty for `removed` and `error`: RFC 6902 cannot remove the whole document.
+    """
+
+    id: str
+    kind: str
+    patch: list[dict]
+    record: dict | None
+    error: Exception | None = None
+
+
+def content_hash(record: Any) -> str:
+    """A hash of a record's content, independent of the key order.
+
+    Args:
+        record (Any): A JSON serializable value.
+
+    Returns:
+        str: The hex digest.
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _pointer(path: str, key: Any) -> str:
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[dict]:
+    """The JSON Patch turning one value into another.
+    Dicts are compared key by key and lists of the same length item by item, other values are replaced whole.
+
+    Args:
+        old (Any): The previous value.
+        new (Any): The current value.
+        path (str, optional): The JSON Pointer of the values, for nested calls.
+
+    Returns:
+        list[dict]: The operations, empty when the values are equal.
+    """
+    if old == new and type(old) is type(new):
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch = []
+        for key, value in old.items():
+            if key not in new:
+                patch.append({"op": "remove", "path": _pointer(path, key)})
+            else:
+                patch.extend(diff(value, new[key], _pointer(path, key)))
+        for key, value in new.items():
+            if key not in old:
+                patch.append({"op": "add", "path": _pointer(path, key), "value": value})
+        return patch
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        patch = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            patch.extend(diff(old_item, new_item, _pointer(path, index)))
+        return patch
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class DeltaStore:
+    """The last synced version of each record, in a SQLite database.
+
+    Args:
+        path (str, optional): The database file, created if needed. `:memory:` keeps it in memory.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if not isinstance(path, str):
+            raise TypeError(f"The path must be a string, {type(path)} given.")
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS records (id TEXT PRIMARY KEY, hash TEXT NOT NULL, record TEXT NOT NULL)"
+        )
+        self._pending = 0
+        self.stats = {"unchanged": 0, "added": 0, "changed": 0, "removed": 0, "errors": 0}
+
+    def __enter__(self) -> "DeltaStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def hash(self, id: str) -> str | None:
+        """The content hash of a stored record, None when it is not stored."""
+        row = self._connection.execute("SELECT hash FROM records WHERE id = ?", (id,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, id: str) -> dict | None:
+        """A stored record, None when it is not stored."""
+        row = self._connection.execute("SELECT record FROM records WHERE id = ?", (id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, id: str, hash: str, record: dict) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO records (id, hash, record) VALUES (?, ?, ?)", (id, hash, json.dumps(record))
+        )
+        self._written()
+
+    def delete(self, id: str) -> None:
+        self._connection.execute("DELETE FROM records WHERE id = ?", (id,))
+        self._written()
+
+    def _written(self) -> None:
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self.commit()
+
+    def commit(self) -> None:
+        """Write the pending changes to disk."""
+        self._connection.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        self.commit()
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def __contains__(self, id: str) -> bool:
+        return self.hash(id) is not None
+
+
+def sync(
+    results: Iterable[tuple[int | str, dict | Exception]], store: "DeltaStore | str", prefix: str
+) -> Iterator[Change]:
+    """Compare lookup results with their stored versions, yielding and storing the changes.
+    The store is committed once the results are exhausted, and closed when it was opened from a path.
+
+    Args:
+        results (Iterable[tuple[int | str, dict | Exception]]): IDs with their records or errors,
+            as `IMDbAPI.getMovies` yields them.
+        store (DeltaStore | str): The previous versions, or the path of their database.
+        prefix (str): `tt` or `nm`, to store the IDs in their canonical form.
+
+    Returns:
+        Iterator[Change]: The records that were added, changed, removed or failed, unchanged ones are skipped.
+
+    Raises:
+        TypeError: When the store is not a DeltaStore or path.
+    """
+    if not isinstance(store, (DeltaStore, str)):
+        raise TypeError(f"The store must be a DeltaStore or a path, {type(store)} given.")
+    return _sync(results, store, prefix)
+
+
+def _sync(results: Iterable[tuple[int | str, dict | Exception]], store: "DeltaStore | str", prefix: str):
+    from SimpleIMDbDev.ids import normalize_id
+
+    owned = isinstance(store, str)
+    if owned:
+        store = DeltaStore(store)
+    try:
+        for id, result in results:
+            try:
+                key = normalize_id(id, prefix)
+            except (TypeError, ValueError) as error:
+                store.stats["errors"] += 1
+                yield Change(str(id), "error", [], None, error)
+                continue
+            if isinstance(result, NotFound):
+                if key in store:
+                    store.delete(key)
+                    store.stats["removed"] += 1
+                    yield Change(key, "removed", [], None)
+                continue
+            if isinstance(result, Exception):
+                store.stats["errors"] += 1
+                yield Change(key, "error", [], None, result)
+                continue
+            digest = content_hash(result)
+            stored = store.hash(key)
+            if stored == digest:
+                store.stats["unchanged"] += 1
+                continue
+            if stored is None:
+                store.put(key, digest, result)
+                store.stats["added"] += 1
+                yield Change(key, "added", [{"op": "add", "path": "", "value": result}], result)
+                continue
+            patch = diff(store.get(key), result)
+            store.put(key, digest, result)
+            store.stats["changed"] += 1
+            yield Change(key, "changed", patch, result)
+    finally:
+        if owned:
+            store.close()
+        else:
+            store.commit()
@@ -0,0 +1,279 @@
+"""Breadth-first crawling of the cast and crew graph, titles to their credited people to the titles they are known for.
+
+Examples:
+    crawler = IMDbAPI("Rest").crawl(["tt0477051"], max_depth=2)
+    for item in crawler:
+        if isinstance(item, Edge):
+            ...
+    crawler.save("crawl.json")  # Resume later with `Crawler.load`.
+"""
+
+__all__ = ["BloomFilter", "Crawler", "Edge", "Node"]
+
+import base64
+import hashlib
+import json
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple
+
+from SimpleIMDbDev import ids
+
+if TYPE_CHECKING:
+    from SimpleIMDbDev import IMDbAPI
+
+
+class Node(NamedTuple):
+    """A title or person, with its `getMovie`/`getPerson` dict or the error raised for it."""
+
+    id: str
+    depth: int
+    data: dict | Exception
+
+
+class Edge(NamedTuple):
+    """A credit, `credit` from a title to a person or `known_for` from a person to a title.
+    The data holds the `category` and `characters` of the credit."""
+
+    source: str
+    target: str
+    kind: str
+    data: dict
+
+
+def _normalize(id: int | str) -> str:
+    if not isinstance(id, str):
+        raise TypeError(f"Seed IDs must be strings starting with tt or nm, {type(id)} given.")
+    if id[:2] not in ids.PREFIXES:
+        raise ValueError(f"Seed IDs must be of the form tt####### or nm#######, '{id}' given.")
+    return ids.normalize_id(id, id[:2])
+
+
+class BloomFilter:
+    """A fixed size probabilistic set of integers, for crawls too large to remember every ID exactly.
+    Membership tests can be wrong, a node is then skipped, at about `error_rate` once `capacity` items are in.
+
+    Args:
+        capacity (int): The number of items expected.
+        error_rate (float, optional): The false positive rate at capacity.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if not isinstance(capacity, int) or not isinstance(error_rate, float):
+            raise TypeError("The capacity must be an int and the error_rate a float.")
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("The capacity must be positive and the error_rate between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: int) -> Iterator[int]:
+        digest = hashlib.blake2b(value.to_bytes(8, "little"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def add(self, value: int) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class Crawler:
+    """A breadth-first crawl from seed titles and people, fetching up to `workers` nodes at once.
+    Iterating the crawler runs it, yielding each `Node` as it is fetched, followed by its `Edge`s.
+
+    Notes:
+        - A title links to its credited people, a person to the titles they are known for.
+        - Fetches are started in breadth-first order, nodes are yielded as they complete,
+            so the first nodes of a depth can come before the last ones of the previous depth.
+        - Nodes at `max_depth` are leaves, their links are not fetched.
+        - Credits and known for lists come from the `Rest` subselections, their first page only.
+        - An edge is yielded from each side it was seen from, `credit` and `known_for` edges can mirror each other.
+        - Every ID is visited once. The visited set holds packed integers, or a `BloomFilter` with `bloom`.
+        - `save` can be called between items. Nodes still being fetched or yielded are fetched again on resume,
+            their node and edges may then be yielded twice.
+
+    Args:
+        seeds (Iterable[str]): The IDs to start from, tt### or nm###.
+        api (IMDbAPI | None, optional): The API used to fetch nodes, a `Rest` one by default.
+        max_depth (int, optional): The links followed from the seeds, 0 only fetches the seeds.
+        workers (int, optional): The concurrent fetches.
+        bloom (int, optional): The expected number of nodes, to use a `BloomFilter` sized for it.
+    """
+
+    def __init__(
+        self,
+        seeds: Iterable[str] = (),
+        api: "IMDbAPI | None" = None,
+        max_depth: int = 2,
+        workers: int = 8,
+        bloom: int = 0,
+    ):
+        from SimpleIMDbDev import IMDbAPI, _check_workers
+
+        _check_workers(workers)
+        if not isinstance(max_depth, int) or not isinstance(bloom, int):
+            raise TypeError("The max_depth and bloom must be of type int.")
+        if max_depth < 0 or bloom < 0:
+            raise ValueError("The max_depth and bloom cannot be negative.")
+        if isinstance(seeds, str):
+            raise TypeError("The seeds must be an iterable of IDs, not a string.")
+        self.api = api if api is not None else IMDbAPI("Rest")
+        # Subselections are only served by Rest and Dataset, the fallback keeps the priority class of the API.
+        self._links_api = self.api
+        if self.api._parser not in ["Rest", "Dataset"]:
+            self._links_api = IMDbAPI("Rest", priority=self.api._priority)
+        self.max_depth = max_depth
+        self.workers = workers
+        self.visited: set[int] | BloomFilter = BloomFilter(bloom) if bloom else set()
+        self.frontier: deque[tuple[str, int]] = deque()
+        self.stats = {"nodes": 0, "edges": 0, "errors": 0}
+        self._pending: dict[str, int] = {}
+        for seed in seeds:
+            self._enqueue(_normalize(seed), 0)
+
+    def _enqueue(self, id: str, depth: int) -> None:
+        packed = ids.pack(id)
+        if packed in self.visited:
+            return
+        self.visited.add(packed)
+        self.frontier.append((id, depth))
+
+    def _fetch(self, id: str, depth: int) -> tuple[dict | Exception, list[Edge]]:
+        title = id.startswith("tt")
+        try:
+            data = self.api.getMovie(id) if title else self.api.getPerson(id)
+        except Exception as error:
+            return error, []
+        if depth >= self.max_depth:
+            return data, []
+        try:
+            if title:
+                links = self._links_api.getMovie(id, "credits").get("credits") or []
+            else:
+                links = self._links_api.getPerson(id, "known_for").get("known_for") or []
+        except Exception:
+            links = []
+        edges = []
+        for link in links:
+            other = (link.get("name") if title else link.get("title")) or {}
+            if not other.get("id"):
+                continue
+            credit = {"category": link.get("category"), "characters": link.get("characters")}
+            edges.append(Edge(id, other["id"], "credit" if title else "known_for", credit))
+        return data, edges
+
+    def __iter__(self) -> Iterator[Node | Edge]:
+        return self.run()
+
+    def run(self) -> Iterator[Node | Edge]:
+        """Run the crawl until the frontier is empty.
+
+        Returns:
+            Iterator[Node | Edge]: Each node once fetched, followed by its edges.
+        """
+        pool = ThreadPoolExecutor(self.workers, thread_name_prefix="SimpleIMDbDev-graph")
+        futures: dict = {}
+        try:
+            while self.frontier or futures:
+                while self.frontier and len(futures) < self.workers * 2:
+                    id, depth = self.frontier.popleft()
+                    self._pending[id] = depth
+                    futures[pool.submit(copy_context().run, self._fetch, id, depth)] = (id, depth)
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    id, depth = futures.pop(future)
+                    data, edges = future.result()
+                    for edge in edges:
+                        try:
+                            self._enqueue(_normalize(edge.target), depth + 1)
+                        except (TypeError, ValueError):
+                            pass
+                    self.stats["nodes"] += 1
+                    self.stats["errors"] += isinstance(data, Exception)
+                    self.stats["edges"] += len(edges)
+                    yield Node(id, depth, data)
+                    yield from edges
+                    del self._pending[id]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            # Fetches cancelled or never yielded are retried on the next run.
+            for id, depth in reversed(list(self._pending.items())):
+                self.frontier.appendleft((id, depth))
+            self._pending.clear()
+
+    def state(self) -> dict:
+        """The state of the crawl, to resume it later.
+
+        Returns:
+            dict: The settings, frontier, visited set and statistics, JSON serializable.
+        """
+        frontier = list(self._pending.items()) + list(self.frontier)
+        if isinstance(self.visited, BloomFilter):
+            visited: Any = {
+                "capacity": self.visited.capacity,
+                "error_rate": self.visited.error_rate,
+                "count": self.visited.count,
+                "bits": base64.b64encode(self.visited.bits).decode(),
+            }
+        else:
+            visited = sorted(self.visited)
+        return {
+            "version": 1,
+            "max_depth": self.max_depth,
+            "frontier": [[id, depth] for id, depth in frontier],
+            "visited": visited,
+            "stats": dict(self.stats),
+        }
+
+    def save(self, path: str) -> None:
+        """Write the `state` to a JSON file.
+
+        Args:
+            path (str): The checkpoint file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.state(), file)
+
+    @classmethod
+    def load(cls, path: str, api: "IMDbAPI | None" = None, workers: int = 8) -> "Crawler":
+        """Resume a crawl from a checkpoint written by `save`.
+
+        Args:
+            path (str): The checkpoint file.
+            api (IMDbAPI | None, optional): The API used to fetch nodes, a `Rest` one by default.
+            workers (int, optional): The concurrent fetches.
+
+        Returns:
+            Crawler: The crawler, iterate it to continue.
+
+        Raises:
+            ValueError: When the file is not a crawl checkpoint.
+        """
+        with open(path, encoding="utf-8") as file:
+            state = json.load(file)
+        if not isinstance(state, dict) or state.get("version") != 1:
+            raise ValueError(f"The file '{path}' is not a crawl checkpoint.")
+        crawler = cls(api=api, max_depth=state["max_depth"], workers=workers)
+        visited = state["visited"]
+        if isinstance(visited, dict):
+            crawler.visited = BloomFilter(visited["capacity"], visited["error_rate"])
+            crawler.visited.bits = bytearray(base64.b64decode(visited["bits"]))
+            crawler.visited.count = visited["count"]
+        else:
+            crawler.visited = set(visited)
+        crawler.frontier = deque((id, depth) for id, depth in state["frontier"])
+        crawler.stats.update(state["stats"])
+        return crawler
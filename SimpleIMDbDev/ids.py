@@ -0,0 +1,223 @@
+"""Parsing of IMDb IDs, `tt###` for titles and `nm###` for names, shared by every parser.
+
+IDs are at least 7 digits, zero padded. Longer IDs such as `tt10000000` have no padding,
+`tt04770510` is not a valid ID.
+`pack` stores an ID of either kind in one integer, the lowest bit set for names.
+`pack_many` parses whole columns at once, with NumPy when it is installed.
+"""
+
+__all__ = ["parse_id", "format_id", "normalize_id", "pack", "unpack", "pack_many", "unpack_many"]
+
+from array import array
+from typing import Iterable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+PREFIXES = ["tt", "nm"]
+WIDTH = 7
+# Digits a packed ID can have, within an unsigned 64 bit integer.
+MAX_DIGITS = 18
+
+
+def _check_prefix(prefix: str) -> None:
+    if prefix not in PREFIXES:
+        raise ValueError(f"The prefix must be one of {PREFIXES}, '{prefix}' given.")
+
+
+def parse_id(id: int | str, prefix: str) -> int:
+    """Gets the number of an ID.
+
+    Args:
+        id (int | str): The ID, `tt###`/`nm###` or only its number.
+        prefix (str): `tt` or `nm`.
+
+    Returns:
+        int: The number.
+
+    Raises:
+        TypeError: When the ID is not a str or int.
+        ValueError: When the ID is invalid.
+    """
+    if not isinstance(id, str) and not isinstance(id, int):
+        raise TypeError(f"ID must be of type str or int, {type(id)} given.")
+    digits = str(id)
+    if digits.startswith(prefix):
+        digits = digits[2:]
+    if (
+        not digits.isascii()
+        or not digits.isdigit()
+        or len(digits) > MAX_DIGITS
+        or (len(digits) > WIDTH and digits[0] == "0")
+    ):
+        raise ValueError(f"A valid ID must be provided, form {prefix}#######.")
+    return int(digits)
+
+
+def format_id(number: int, prefix: str) -> str:
+    """The ID of a number, zero padded to 7 digits.
+
+    Args:
+        number (int): The number.
+        prefix (str): `tt` or `nm`.
+
+    Returns:
+        str: The ID.
+    """
+    return prefix + str(number).rjust(WIDTH, "0")
+
+
+def normalize_id(id: int | str, prefix: str) -> str:
+    """The canonical form of an ID, `477051`, `tt477051` and `tt0477051` are all `tt0477051`.
+
+    Args:
+        id (int | str): The ID, `tt###`/`nm###` or only its number.
+        prefix (str): `tt` or `nm`.
+
+    Returns:
+        str: The ID.
+
+    Raises:
+        TypeError: When the ID is not a str or int.
+        ValueError: When the ID is invalid.
+    """
+    return format_id(parse_id(id, prefix), prefix)
+
+
+def pack(id: str) -> int:
+    """An ID of either kind as one integer, the lowest bit tells names from titles.
+
+    Args:
+        id (str): The ID, `tt###` or `nm###`.
+
+    Returns:
+        int: The packed ID.
+
+    Raises:
+        TypeError: When the ID is not a str.
+        ValueError: When the ID is invalid.
+    """
+    if not isinstance(id, str):
+        raise TypeError(f"ID must be of type str, {type(id)} given.")
+    prefix = id[:2]
+    _check_prefix(prefix)
+    return parse_id(id, prefix) * 2 + (prefix == "nm")
+
+
+def unpack(value: int) -> str:
+    """The ID of a packed integer.
+
+    Args:
+        value (int): The packed ID.
+
+    Returns:
+        str: The ID.
+    """
+    return format_id(value >> 1, "nm" if value & 1 else "tt")
+
+
+def _packed_array(values: list[int]) -> array:
+    """An unsigned array of the values, 32 bit unless an ID is too large for it."""
+    try:
+        return array("I", values)
+    except OverflowError:
+        return array("Q", values)
+
+
+def pack_many(ids: Iterable[str | int], prefix: str = ""):
+    """Parse a column of IDs into packed integers, see `pack`.
+
+    Args:
+        ids (Iterable[str | int]): The IDs, `tt###`/`nm###` or only numbers when a prefix is given.
+        prefix (str, optional): The kind of every ID, `tt` or `nm`, IDs of the other kind are invalid.
+            Without it, every ID must be prefixed.
+
+    Returns:
+        array.array | numpy.ndarray: Unsigned packed IDs, a NumPy array when NumPy is installed.
+            32 bit unless an ID needs more.
+
+    Raises:
+        TypeError: When an ID is not a str or int.
+        ValueError: When an ID is invalid, naming the first one.
+    """
+    if prefix:
+        _check_prefix(prefix)
+    if not isinstance(ids, (list, tuple)):
+        ids = list(ids)
+    if numpy is not None and ids and all(isinstance(id, str) for id in ids):
+        return _pack_numpy(ids, prefix)
+    packed = []
+    for id in ids:
+        if prefix:
+            packed.append(parse_id(id, prefix) * 2 + (prefix == "nm"))
+        elif isinstance(id, str):
+            packed.append(pack(id))
+        else:
+            raise ValueError(f"A valid ID must be provided, form tt####### or nm#######, {id} given.")
+    if numpy is not None:
+        return _compact(numpy.array(packed, dtype=numpy.uint64))
+    return _packed_array(packed)
+
+
+def _pack_numpy(ids: list[str], prefix: str):
+    """`pack_many` on a byte matrix of the IDs, one row per ID."""
+    try:
+        raw = numpy.array(ids, dtype="S")
+    except UnicodeEncodeError:
+        raw = None
+    if raw is None or raw.dtype.itemsize > MAX_DIGITS + 2:
+        # Non ASCII or overly long values, found by the scalar path.
+        for id in ids:
+            parse_id(id, prefix or id[:2])
+        raise ValueError("A valid ID must be provided, form tt####### or nm#######.")
+    matrix = raw.view(numpy.uint8).reshape(len(ids), raw.dtype.itemsize)
+    width = matrix.shape[1]
+    lengths = (matrix != 0).sum(axis=1)
+    is_tt = (matrix[:, 0] == ord("t")) & (matrix[:, 1] == ord("t")) if width > 1 else numpy.zeros(len(ids), bool)
+    is_nm = (matrix[:, 0] == ord("n")) & (matrix[:, 1] == ord("m")) if width > 1 else numpy.zeros(len(ids), bool)
+    prefixed = is_tt | is_nm
+    start = numpy.where(prefixed, 2, 0)
+    columns = numpy.arange(width)
+    in_digits = (columns >= start[:, None]) & (columns < lengths[:, None])
+    digits = matrix.astype(numpy.int64) - ord("0")
+    count = lengths - start
+    first = digits[numpy.arange(len(ids)), numpy.minimum(start, width - 1)]
+    valid = (
+        numpy.all(~in_digits | ((digits >= 0) & (digits <= 9)), axis=1)
+        & (count >= 1)
+        & (count <= MAX_DIGITS)
+        & ((count <= WIDTH) | (first != 0))
+    )
+    if prefix:
+        valid &= ~(is_nm if prefix == "tt" else is_tt)
+        names = numpy.full(len(ids), prefix == "nm")
+    else:
+        valid &= prefixed
+        names = is_nm
+    if not valid.all():
+        bad = ids[int(numpy.argmin(valid))]
+        raise ValueError(f"A valid ID must be provided, form {prefix or 'tt'}#######, '{bad}' given.")
+    powers = numpy.uint64(10) ** numpy.where(in_digits, lengths[:, None] - 1 - columns, 0).astype(numpy.uint64)
+    numbers = (numpy.where(in_digits, digits, 0).astype(numpy.uint64) * powers).sum(axis=1, dtype=numpy.uint64)
+    return _compact(numbers * numpy.uint64(2) + names.astype(numpy.uint64))
+
+
+def _compact(values):
+    """32 bit unless an ID is too large for it."""
+    if not len(values) or int(values.max()) < 2**32:
+        return values.astype(numpy.uint32)
+    return values
+
+
+def unpack_many(values: Iterable[int]) -> list[str]:
+    """The IDs of packed integers.
+
+    Args:
+        values (Iterable[int]): Packed IDs, such as from `pack_many`.
+
+    Returns:
+        list[str]: The IDs.
+    """
+    return [f"{'nm' if value & 1 else 'tt'}{value >> 1:07d}" for value in map(int, values)]
@@ -0,0 +1,143 @@
+"""Incremental parsing of a JSON object holding one large array, such as the `credits` of a title.
+Each element of the array is decoded with `json` as soon as its last byte arrives,
+the text buffered is bounded by about one element and one chunk.
+
+Examples:
+    stream = jsonstream.items(chunks, "credits")
+    for credit in stream:
+        ...
+    stream.fields["next_page_token"]
+"""
+
+__all__ = ["ItemStream", "items"]
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+# Whitespace allowed between JSON tokens.
+WHITESPACE = " \t\n\r"
+# Consumed text is dropped from the buffer once this much has built up.
+COMPACT_AT = 64 * 1024
+_DECODER = json.JSONDecoder()
+
+
+class ItemStream:
+    """The elements of the array under `key`, with the other top level values kept in `fields` once iterated.
+
+    Args:
+        chunks (Iterable[bytes]): The UTF-8 body, in chunks of any size.
+        key (str): The top level key of the array.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str):
+        if not isinstance(key, str):
+            raise TypeError(f"The key must be a string, {type(key)} given.")
+        self.key = key
+        self.fields: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+
+    def __iter__(self) -> Iterator[Any]:
+        return _Reader(self._chunks).items(self.key, self.fields)
+
+
+def items(chunks: Iterable[bytes], key: str) -> ItemStream:
+    """Parse the elements of the array under `key` as the chunks arrive, see `ItemStream`.
+
+    Args:
+        chunks (Iterable[bytes]): The UTF-8 body, in chunks of any size.
+        key (str): The top level key of the array.
+
+    Returns:
+        ItemStream: Iterate it for the elements, the other top level values are then in `fields`.
+
+    Raises:
+        TypeError: When the key is not a string.
+    """
+    return ItemStream(chunks, key)
+
+
+class _Reader:
+    """A text buffer over the chunks, values are decoded with `json` once complete."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.position = 0
+        self.done = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, False at the end of the body."""
+        if self.done:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.text += self._decoder.decode(b"", final=True)
+            self.done = True
+            return False
+        if self.position >= COMPACT_AT:
+            self.text = self.text[self.position :]
+            self.position = 0
+        self.text += self._decoder.decode(chunk)
+        return True
+
+    def _error(self, expected: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f"Expecting {expected}", self.text, self.position)
+
+    def peek(self) -> str:
+        """The next character after whitespace, empty at the end of the body."""
+        while True:
+            while self.position < len(self.text) and self.text[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise self._error(" or ".join(repr(c) for c in characters))
+        self.position += 1
+        return character
+
+    def value(self) -> Any:
+        """Decode the next value, reading more of the body until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending the buffer may continue in the next chunk.
+            if end == len(self.text) and not self.done and self._fill():
+                continue
+            self.position = end
+            return value
+
+    def items(self, key: str, fields: dict) -> Iterator[Any]:
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            name = self.value()
+            if not isinstance(name, str):
+                raise self._error("a property name")
+            self.expect(":")
+            if name == key and self.peek() == "[":
+                self.position += 1
+                if self.peek() == "]":
+                    self.position += 1
+                else:
+                    while True:
+                        yield self.value()
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                fields[name] = self.value()
+            if self.expect(",}") == "}":
+                return
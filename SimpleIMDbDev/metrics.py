@@ -0,0 +1,277 @@
+"""Instrumentation of the hot path: latency histograms per endpoint and phase, event counters and hooks.
+Disabled by default, the call sites then only pay for an attribute check.
+
+Endpoints are `rest.titles`, `rest.names`, `rest.search`, `graphql.title`, `graphql.name` and `imdbapi`.
+Phases are `headers` (DNS, connect and server time until the headers arrived), `transfer` (reading the body),
+`decode` (JSON), `validate` (`check_kwargs` through the GraphQL object construction),
+`flatten` and `total` (a whole `IMDbAPI` call).
+"""
+
+__all__ = ["Metrics", "METRICS"]
+
+import bisect
+import threading
+import time
+from typing import Callable
+
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_PREFIX = "simpleimdbdev"
+
+
+class _NoTimer:
+    """Shared no-op timer handed out while the metrics are disabled."""
+
+    def __enter__(self) -> "_NoTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_TIMER = _NoTimer()
+
+
+class _Timer:
+    """Times a block into a phase histogram, optionally inside an OpenTelemetry span."""
+
+    __slots__ = ("metrics", "endpoint", "phase", "start", "span")
+
+    def __init__(self, metrics: "Metrics", endpoint: str, phase: str):
+        self.metrics = metrics
+        self.endpoint = endpoint
+        self.phase = phase
+        self.span = None
+
+    def __enter__(self) -> "_Timer":
+        if self.metrics._tracer is not None:
+            self.span = self.metrics._tracer.start_as_current_span(
+                f"{self.endpoint} {self.phase}",
+                attributes={"endpoint": self.endpoint, "phase": self.phase},
+            )
+            self.span.__enter__()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.metrics.observe(self.endpoint, self.phase, time.perf_counter() - self.start)
+        if self.span is not None:
+            self.span.__exit__(*exc_info)
+
+
+class Histogram:
+    """A cumulative latency histogram over the fixed `BUCKETS`."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(BUCKETS, seconds)
+        if index < len(BUCKETS):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> list[int]:
+        """The count of observations at or below each bucket."""
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class Metrics:
+    """Registry of the library's counters, latency histograms and hooks.
+
+    Examples:
+        METRICS.enable()
+        METRICS.add_hook(lambda endpoint, phase, seconds: print(endpoint, phase, seconds))
+        print(METRICS.to_prometheus())
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._hooks: list[Callable[[str, str, float], None]] = []
+        self._counters: dict[tuple[str, str], int] = {}
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+        self._tracer = None
+
+    def enable(self, opentelemetry: bool = False) -> None:
+        """Start recording.
+
+        Args:
+            opentelemetry (bool, optional): Also record each timed phase as an OpenTelemetry span.
+
+        Returns:
+            None: No return
+
+        Raises:
+            ImportError: When OpenTelemetry was requested but is not installed.
+        """
+        self._tracer = None
+        if opentelemetry:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError("OpenTelemetry spans require the `opentelemetry-api` package.")
+            self._tracer = trace.get_tracer("SimpleIMDbDev")
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording, the recorded values are kept.
+
+        Returns:
+            None: No return
+        """
+        self.enabled = False
+        self._tracer = None
+
+    def reset(self) -> None:
+        """Forget every recorded value, the hooks are kept.
+
+        Returns:
+            None: No return
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def add_hook(self, hook: Callable[[str, str, float], None]) -> None:
+        """Call `hook(endpoint, phase, seconds)` for every timed phase and `hook(endpoint, event, 0.0)` for events.
+        Hooks run on the calling thread and should be fast.
+
+        Args:
+            hook (Callable): The callback.
+
+        Returns:
+            None: No return
+
+        Raises:
+            TypeError: When the hook is not callable.
+        """
+        if not callable(hook):
+            raise TypeError(f"The hook must be callable, {type(hook)} given.")
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, str, float], None]) -> None:
+        """Remove a hook added by `add_hook`.
+
+        Args:
+            hook (Callable): The callback.
+
+        Returns:
+            None: No return
+        """
+        self._hooks.remove(hook)
+
+    def timer(self, endpoint: str, phase: str) -> _Timer | _NoTimer:
+        """Time a block, `with METRICS.timer("rest.titles", "decode"):`.
+
+        Args:
+            endpoint (str): The endpoint label.
+            phase (str): The phase label.
+
+        Returns:
+            _Timer | _NoTimer: A context manager, a shared no-op while disabled.
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return _Timer(self, endpoint, phase)
+
+    def observe(self, endpoint: str, phase: str, seconds: float) -> None:
+        """Record a phase duration.
+
+        Args:
+            endpoint (str): The endpoint label.
+            phase (str): The phase label.
+            seconds (float): The duration.
+
+        Returns:
+            None: No return
+        """
+        if not self.enabled:
+            return
+        key = (endpoint, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+        for hook in self._hooks:
+            hook(endpoint, phase, seconds)
+
+    def count(self, endpoint: str, event: str, value: int = 1) -> None:
+        """Increment an event counter, such as `cache_hit`, `status_200` or `wire_bytes`.
+
+        Args:
+            endpoint (str): The endpoint label.
+            event (str): The event name.
+            value (int, optional): The increment.
+
+        Returns:
+            None: No return
+        """
+        if not self.enabled:
+            return
+        key = (endpoint, event)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        for hook in self._hooks:
+            hook(endpoint, event, 0.0)
+
+    def snapshot(self) -> dict:
+        """Gets the recorded values.
+
+        Returns:
+            dict: `counters` as `{endpoint: {event: count}}` and
+                `histograms` as `{endpoint: {phase: {"count", "sum", "buckets"}}}`.
+        """
+        counters: dict = {}
+        histograms: dict = {}
+        with self._lock:
+            for (endpoint, event), count in self._counters.items():
+                counters.setdefault(endpoint, {})[event] = count
+            for (endpoint, phase), histogram in self._histograms.items():
+                histograms.setdefault(endpoint, {})[phase] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "buckets": dict(zip(BUCKETS, histogram.cumulative())),
+                }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Gets the recorded values in the Prometheus text exposition format.
+
+        Returns:
+            str: The `simpleimdbdev_phase_seconds` histograms and `simpleimdbdev_events_total` counters.
+        """
+        lines = [
+            f"# HELP {PROMETHEUS_PREFIX}_phase_seconds Time spent per endpoint and phase.",
+            f"# TYPE {PROMETHEUS_PREFIX}_phase_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            for (endpoint, phase), histogram in histograms:
+                labels = f'endpoint="{endpoint}",phase="{phase}"'
+                for bound, count in zip(BUCKETS, histogram.cumulative()):
+                    lines.append(f'{PROMETHEUS_PREFIX}_phase_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{PROMETHEUS_PREFIX}_phase_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{PROMETHEUS_PREFIX}_phase_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{PROMETHEUS_PREFIX}_phase_seconds_count{{{labels}}} {histogram.count}")
+        lines.append(
+            f"# HELP {PROMETHEUS_PREFIX}_events_total Events per endpoint, cache outcomes, HTTP statuses and bytes received."
+        )
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_events_total counter")
+        for (endpoint, event), count in counters:
+            lines.append(f'{PROMETHEUS_PREFIX}_events_total{{endpoint="{endpoint}",event="{event}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
@@ -0,0 +1,160 @@
+"""Opt-in profiling of the library's internal stages, for attaching numbers to bug reports.
+
+Examples:
+    with IMDbAPI.profile() as profile:
+        IMDbAPI("GraphQL").getMovie("tt0477051")
+    print(profile.report())
+"""
+
+__all__ = ["Profile"]
+
+import functools
+import importlib
+import threading
+import time
+import tracemalloc
+
+# (module, attribute) of every profiled stage, looked up through the module at call time,
+# so recursive calls such as `check_kwargs` building nested objects are seen as well.
+STAGES = [
+    ("SimpleIMDbDev.transport", "request"),
+    ("SimpleIMDbDev.transport", "decode"),
+    ("SimpleIMDbDev.GraphQL", "get_attribute_main_query"),
+    ("SimpleIMDbDev.GraphQL", "check_kwargs"),
+    ("SimpleIMDbDev.GraphQL", "todict"),
+    ("SimpleIMDbDev", "flatten"),
+]
+
+
+class Profile:
+    """Context manager recording wall time and allocations per internal stage.
+    The stage functions are only wrapped while the context is active, there is no cost otherwise.
+
+    Notes:
+        - Recursive calls are counted, time and memory are only measured for the outermost call.
+        - Memory is the net size of the blocks still allocated when the outermost call returns,
+            `top_allocations` lists the package's allocation sites with their block counts.
+        - Profiles are process wide and do not nest.
+
+    Args:
+        allocations (bool, optional): Trace allocations with `tracemalloc`, slower but adds memory figures.
+    """
+
+    _active = False
+
+    def __init__(self, allocations: bool = True):
+        if not isinstance(allocations, bool):
+            raise TypeError(f"Allocations must be a boolean value, {type(allocations)} given.")
+        self.allocations = allocations
+        self.stats: dict[str, dict] = {}
+        self.wall = 0.0
+        self._originals: list[tuple[object, str, object]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_diff: list = []
+
+    def __enter__(self) -> "Profile":
+        if Profile._active:
+            raise RuntimeError("A profile is already active.")
+        Profile._active = True
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.allocations:
+            self._start_snapshot = tracemalloc.take_snapshot()
+        for module_name, attribute in STAGES:
+            module = importlib.import_module(module_name)
+            original = getattr(module, attribute)
+            self._originals.append((module, attribute, original))
+            setattr(module, attribute, self._wrap(f"{module_name}.{attribute}", original))
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall = time.perf_counter() - self._start
+        for module, attribute, original in reversed(self._originals):
+            setattr(module, attribute, original)
+        self._originals.clear()
+        if self.allocations:
+            package = tracemalloc.Filter(True, "*SimpleIMDbDev*")
+            snapshot = tracemalloc.take_snapshot().filter_traces([package])
+            start = self._start_snapshot.filter_traces([package])  # type: ignore
+            self._snapshot_diff = snapshot.compare_to(start, "lineno")
+            self._start_snapshot = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        Profile._active = False
+
+    def _wrap(self, name: str, function):
+        stats = self.stats.setdefault(name, {"calls": 0, "wall": 0.0, "memory": 0})
+        local = self._local
+        lock = self._lock
+        allocations = self.allocations
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            depth = getattr(local, name, 0)
+            if depth:
+                with lock:
+                    stats["calls"] += 1
+                setattr(local, name, depth + 1)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    setattr(local, name, depth)
+            memory = tracemalloc.get_traced_memory()[0] if allocations else 0
+            start = time.perf_counter()
+            setattr(local, name, 1)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                setattr(local, name, 0)
+                wall = time.perf_counter() - start
+                if allocations:
+                    memory = tracemalloc.get_traced_memory()[0] - memory
+                with lock:
+                    stats["calls"] += 1
+                    stats["wall"] += wall
+                    stats["memory"] += memory
+
+        return wrapper
+
+    def top_allocations(self, limit: int = 10) -> list[tuple[str, int, int]]:
+        """The package's source lines that allocated the most during the profile.
+
+        Args:
+            limit (int, optional): The number of lines.
+
+        Returns:
+            list[tuple[str, int, int]]: `(file:line, size in bytes, block count)`, largest first.
+        """
+        return [
+            (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+            for stat in self._snapshot_diff[:limit]
+        ]
+
+    def report(self) -> str:
+        """A plain text summary, stages sorted by wall time.
+
+        Returns:
+            str: The report.
+        """
+        lines = [
+            f"Profiled {self.wall * 1000:.2f} ms",
+            f"{'stage':<45} {'calls':>8} {'wall ms':>10} {'share':>7} {'memory KiB':>11}",
+        ]
+        for name, stats in sorted(self.stats.items(), key=lambda item: -item[1]["wall"]):
+            share = stats["wall"] / self.wall if self.wall else 0.0
+            memory = f"{stats['memory'] / 1024:.1f}" if self.allocations else "-"
+            lines.append(
+                f"{name:<45} {stats['calls']:>8} {stats['wall'] * 1000:>10.3f} {share:>7.1%} {memory:>11}"
+            )
+        if self.allocations:
+            lines.append("")
+            lines.append("Top allocations:")
+            for line, size, count in self.top_allocations():
+                lines.append(f"  {line:<60} {size / 1024:>9.1f} KiB {count:>7} blocks")
+        return "\n".join(lines)
@@ -0,0 +1,351 @@
+"""A `CacheBackend` on a server speaking the Redis protocol, shared by every process and host pointed at it.
+The client is built on plain sockets, no Redis package is needed.
+`StandInServer` is a small in-memory server speaking the same protocol, for tests and benchmarks.
+
+Examples:
+    CACHE.backend = RedisBackend("cache.internal", 6379)
+
+    with StandInServer() as server:
+        CACHE.backend = RedisBackend(port=server.port)
+"""
+
+__all__ = ["RedisBackend", "RedisError", "StandInServer"]
+
+import fnmatch
+import queue
+import socket
+import socketserver
+import threading
+import time
+
+from SimpleIMDbDev.cache import CacheBackend
+
+PREFIX = "simpleimdbdev:"
+# The keys sent in one MGET, the commands of a bulk lookup are pipelined.
+MGET_BATCH = 256
+
+
+class RedisError(Exception):
+    """An error reply from the server."""
+
+
+def _command(*parts: str | bytes | int) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    encoded = [part if isinstance(part, bytes) else str(part).encode() for part in parts]
+    return b"".join(
+        [f"*{len(encoded)}\r\n".encode()]
+        + [b"$%d\r\n%s\r\n" % (len(part), part) for part in encoded]
+    )
+
+
+def _read_reply(file) -> bytes | int | list | str | None:
+    """Read one RESP reply, bulk strings are returned as bytes and simple strings as str."""
+    line = file.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("The connection to the cache server was closed.")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = file.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("The connection to the cache server was closed.")
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [_read_reply(file) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from the cache server, {line!r}.")
+
+
+class _Connection:
+    def __init__(self, host: str, port: int, timeout: float):
+        self.socket = socket.create_connection((host, port), timeout)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.file = self.socket.makefile("rb")
+
+    def execute(self, commands: list[bytes]) -> list:
+        """Send the commands in one write and read their replies, error replies are returned as `RedisError`."""
+        self.socket.sendall(b"".join(commands))
+        replies = []
+        for _ in commands:
+            try:
+                replies.append(_read_reply(self.file))
+            except RedisError as error:
+                replies.append(error)
+        return replies
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+
+class RedisBackend(CacheBackend):
+    """A cache tier on a Redis protocol server, used behind the in-process entries of a `ResponseCache`.
+
+    Notes:
+        - `get_many` pipelines MGET commands of `MGET_BATCH` keys, a bulk lookup costs one round trip.
+        - Records expire on the server after the ttl passed by the cache.
+        - Connections are pooled, a connection that failed is dropped.
+        - `clear` only removes the keys under `prefix`.
+
+    Args:
+        host (str, optional): The server host.
+        port (int, optional): The server port.
+        prefix (str, optional): Prepended to every key, to share a server with other data.
+        timeout (float, optional): Seconds to wait for connections and replies.
+        max_connections (int, optional): The idle connections kept in the pool.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        prefix: str = PREFIX,
+        timeout: float = 1.0,
+        max_connections: int = 8,
+    ):
+        if not isinstance(host, str) or not isinstance(prefix, str):
+            raise TypeError("The host and prefix must be of type str.")
+        if not isinstance(port, int) or not isinstance(max_connections, int):
+            raise TypeError("The port and max_connections must be of type int.")
+        if not isinstance(timeout, (int, float)):
+            raise TypeError(f"The timeout must be a number, {type(timeout)} given.")
+        if timeout <= 0 or max_connections < 1:
+            raise ValueError("The timeout and max_connections must be positive.")
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self.timeout = timeout
+        self._pool: queue.LifoQueue = queue.LifoQueue(max_connections)
+
+    def _execute(self, commands: list[bytes]) -> list:
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            connection = _Connection(self.host, self.port, self.timeout)
+        try:
+            replies = connection.execute(commands)
+        except BaseException:
+            connection.close()
+            raise
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+        return replies
+
+    @staticmethod
+    def _checked(reply):
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    def get(self, key: str) -> str | None:
+        reply = self._checked(self._execute([_command("GET", self.prefix + key)])[0])
+        return reply.decode() if reply is not None else None
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        if not keys:
+            return []
+        commands = [
+            _command("MGET", *[self.prefix + key for key in keys[start : start + MGET_BATCH]])
+            for start in range(0, len(keys), MGET_BATCH)
+        ]
+        records = []
+        for reply in self._execute(commands):
+            records.extend(value.decode() if value is not None else None for value in self._checked(reply))
+        return records
+
+    def set(self, key: str, record: str, ttl: float) -> None:
+        if ttl:
+            command = _command("SET", self.prefix + key, record.encode(), "PX", max(int(ttl * 1000), 1))
+        else:
+            command = _command("SET", self.prefix + key, record.encode())
+        self._checked(self._execute([command])[0])
+
+    def clear(self) -> None:
+        cursor = "0"
+        while True:
+            cursor, keys = self._checked(
+                self._execute([_command("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000)])[0]
+            )
+            cursor = cursor.decode()
+            if keys:
+                self._checked(self._execute([_command("DEL", *keys)])[0])
+            if cursor == "0":
+                break
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class _Reader:
+    """Buffered socket reads, telling whether a pipelined batch has been fully read."""
+
+    def __init__(self, connection: socket.socket):
+        self.connection = connection
+        self.buffer = bytearray()
+
+    def _fill(self) -> bool:
+        data = self.connection.recv(65536)
+        self.buffer += data
+        return bool(data)
+
+    def readline(self) -> bytes:
+        while (end := self.buffer.find(b"\n")) < 0:
+            if not self._fill():
+                return b""
+        line = bytes(self.buffer[: end + 1])
+        del self.buffer[: end + 1]
+        return line
+
+    def read(self, size: int) -> bytes:
+        while len(self.buffer) < size and self._fill():
+            pass
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "_Server"
+
+    def handle(self) -> None:
+        stand_in = self.server.stand_in
+        reader = _Reader(self.request)
+        replies = []
+        while True:
+            try:
+                command = _read_reply(reader)
+            except (ConnectionError, OSError, ValueError, RedisError):
+                return
+            if not isinstance(command, list) or not command:
+                return
+            try:
+                replies.append(stand_in._run([command[0].decode()] + command[1:]))
+            except RedisError as error:
+                replies.append(error)
+            if not reader.buffer:
+                # The end of a pipelined batch, the latency is paid once per round trip.
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                self.request.sendall(b"".join(_encode_reply(reply) for reply in replies))
+                replies.clear()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    stand_in: "StandInServer"
+
+
+def _encode_reply(reply) -> bytes:
+    if isinstance(reply, RedisError):
+        return f"-{reply}\r\n".encode()
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, str):
+        return f"+{reply}\r\n".encode()
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return f"*{len(reply)}\r\n".encode() + b"".join(_encode_reply(item) for item in reply)
+
+
+class StandInServer:
+    """An in-memory server for the subset of the Redis protocol used by `RedisBackend`,
+    PING, GET, MGET, SET with EX or PX, DEL, SCAN, DBSIZE and FLUSHDB.
+
+    Args:
+        host (str, optional): The address to listen on.
+        port (int, optional): The port, 0 picks a free one.
+        latency (float, optional): Seconds added to each command, to simulate a remote server.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0):
+        self.latency = latency
+        self.commands = 0
+        self._data: dict[bytes, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler, bind_and_activate=True)
+        self._server.stand_in = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _get(self, key: bytes) -> bytes | None:
+        value = self._data.get(key)
+        if value is None:
+            return None
+        if value[1] and value[1] < time.time():
+            del self._data[key]
+            return None
+        return value[0]
+
+    def _run(self, command: list):
+        name, args = command[0].upper(), command[1:]
+        with self._lock:
+            self.commands += 1
+            match name, len(args):
+                case "PING", 0:
+                    return "PONG"
+                case "GET", 1:
+                    return self._get(args[0])
+                case "MGET", count if count:
+                    return [self._get(key) for key in args]
+                case "SET", 2 | 4:
+                    expires = 0.0
+                    if len(args) == 4:
+                        unit = args[2].decode().upper()
+                        if unit not in ["EX", "PX"]:
+                            raise RedisError("ERR syntax error")
+                        expires = time.time() + int(args[3]) / (1 if unit == "EX" else 1000)
+                    self._data[args[0]] = (args[1], expires)
+                    return "OK"
+                case "DEL", count if count:
+                    return sum(self._data.pop(key, None) is not None for key in args)
+                case "SCAN", _:
+                    # Every matching key is returned at once, with the final cursor.
+                    pattern = "*"
+                    for option, value in zip(args[1::2], args[2::2]):
+                        if option.decode().upper() == "MATCH":
+                            pattern = value.decode()
+                    keys = [key for key in list(self._data) if self._get(key) is not None]
+                    return [b"0", [key for key in keys if fnmatch.fnmatchcase(key.decode(), pattern)]]
+                case "DBSIZE", 0:
+                    return len(self._data)
+                case "FLUSHDB", 0:
+                    self._data.clear()
+                    return "OK"
+        raise RedisError(f"ERR unknown command or wrong number of arguments for '{name}'")
@@ -0,0 +1,301 @@
+"""Routing of `IMDbAPI("auto")` calls between the `Rest` and `GraphQL` APIs.
+Each call goes to the healthiest API able to answer it, falling over to the other one on upstream failures.
+Results are normalised to the `Rest` shapes, whichever API answered.
+
+Examples:
+    api = IMDbAPI("auto")
+    api.getMovie("tt0477051", fields=["rating"])
+    ROUTER.stats()
+"""
+
+__all__ = ["Router", "ROUTER", "normalize", "TITLE_FIELDS", "NAME_FIELDS"]
+
+import threading
+import time
+from typing import Callable, Iterable
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+from SimpleIMDbDev import GraphQL, Rest
+from SimpleIMDbDev.cache import timed_loads
+
+# The normalised shapes, fields an API does not provide are None.
+TITLE_FIELDS = [
+    "id",
+    "type",
+    "is_adult",
+    "primary_title",
+    "original_title",
+    "primary_image",
+    "genres",
+    "rating",
+    "start_year",
+    "end_year",
+    "runtime_minutes",
+    "plot",
+]
+NAME_FIELDS = [
+    "id",
+    "display_name",
+    "primary_image",
+    "alternative_names",
+    "primary_professions",
+    "biography",
+    "birth_name",
+    "birth_date",
+    "birth_location",
+    "death_date",
+    "death_location",
+]
+# The normalised fields each API fills, a call asking for other fields is routed elsewhere.
+PROVIDES = {
+    ("title", "Rest"): set(TITLE_FIELDS),
+    ("title", "GraphQL"): set(TITLE_FIELDS),
+    ("name", "Rest"): set(NAME_FIELDS),
+    ("name", "GraphQL"): set(NAME_FIELDS) - {"primary_professions", "biography", "birth_name"},
+}
+# The order among equally healthy APIs.
+PREFERENCE = ["Rest", "GraphQL"]
+# Weight of the newest sample in the latency and error rate averages.
+ALPHA = 0.2
+# Consecutive upstream failures after which an API is only tried last, for `COOLDOWN` seconds.
+FAILURES = 3
+COOLDOWN = 30.0
+
+
+def _image(images: list | None) -> dict | None:
+    return dict(images[0]) if images else None
+
+
+def _date(year: int | None) -> dict | None:
+    return {"year": year} if year else None
+
+
+def normalize(kind: str, api: str, result: dict) -> dict:
+    """Convert a title or name from either API to the `Rest` shape.
+
+    Args:
+        kind (str): `title` or `name`.
+        api (str): `Rest` or `GraphQL`, the API that answered.
+        result (dict): The flattened result.
+
+    Returns:
+        dict: The result with exactly the `TITLE_FIELDS` or `NAME_FIELDS` keys.
+    """
+    if api == "GraphQL":
+        result = dict(result)
+        if kind == "title":
+            result["primary_image"] = _image(result.get("posters"))
+        else:
+            result["primary_image"] = _image(result.get("avatars"))
+            result["alternative_names"] = result.get("alternate_names")
+            result["birth_date"] = _date(result.get("birth_year"))
+            result["death_date"] = _date(result.get("death_year"))
+    fields = TITLE_FIELDS if kind == "title" else NAME_FIELDS
+    return {field: result.get(field) for field in fields}
+
+
+def _upstream_failure(error: Exception) -> bool:
+    """Whether an error says the API is degraded, rather than something about the request."""
+    if isinstance(error, (ConnectionError, Timeout, GraphQL.GraphQLError)):
+        return True
+    if isinstance(error, HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+        return not status or status >= 500 or status == 429
+    return False
+
+
+class Router:
+    """Chooses the API of each call from what it asks for and the live health of each API.
+
+    Notes:
+        - Subselections, searches and fields only `Rest` provides always go to `Rest`.
+        - Otherwise the API with the lowest latency average, weighted by its error rate, is tried first.
+            An API without samples yet is tried first once, so both get measured.
+        - Only calls that went upstream are sampled, timed over their requests. Cache hits say nothing
+            about the health of an API and are not counted.
+        - Connection errors, timeouts, `5xx` and `429` replies and GraphQL errors other than a missing ID
+            count as failures and the call is retried on the other API.
+            `NotFound` and invalid arguments are raised as is.
+        - After `FAILURES` failures in a row, an API is tried last for `COOLDOWN` seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._health = {api: self._new_health() for api in PREFERENCE}
+
+    @staticmethod
+    def _new_health() -> dict:
+        return {"calls": 0, "failures": 0, "latency": 0.0, "error_rate": 0.0, "streak": 0, "degraded_until": 0.0}
+
+    def route(self, kind: str, subselection: str = "", fields: Iterable[str] = ()) -> list[str]:
+        """The APIs to try for a lookup, in order.
+
+        Args:
+            kind (str): `title` or `name`.
+            subselection (str, optional): The `Rest` subselection asked for.
+            fields (Iterable[str], optional): The normalised fields needed, all when empty.
+
+        Returns:
+            list[str]: The API names, the first is tried first.
+        """
+        needed = set(fields)
+        able = [
+            api
+            for api in PREFERENCE
+            if not (subselection and api != "Rest") and needed <= PROVIDES[(kind, api)]
+        ]
+        if not able:
+            able = ["Rest"]
+        now = time.time()
+        with self._lock:
+            health = {api: dict(self._health[api]) for api in able}
+
+        def score(api: str) -> tuple:
+            stats = health[api]
+            return (
+                stats["degraded_until"] > now,
+                stats["latency"] * (1 + 10 * stats["error_rate"]) if stats["calls"] else 0.0,
+                PREFERENCE.index(api),
+            )
+
+        return sorted(able, key=score)
+
+    def record(self, api: str, elapsed: float, failed: bool) -> None:
+        """Add a call to the health of an API.
+
+        Args:
+            api (str): The API called.
+            elapsed (float): The seconds the call took.
+            failed (bool): Whether it failed upstream.
+        """
+        with self._lock:
+            stats = self._health[api]
+            if stats["calls"]:
+                stats["latency"] += ALPHA * (elapsed - stats["latency"])
+                stats["error_rate"] += ALPHA * (failed - stats["error_rate"])
+            else:
+                stats["latency"], stats["error_rate"] = elapsed, float(failed)
+            stats["calls"] += 1
+            if failed:
+                stats["failures"] += 1
+                stats["streak"] += 1
+                if stats["streak"] >= FAILURES:
+                    stats["degraded_until"] = time.time() + COOLDOWN
+            else:
+                stats["streak"] = 0
+                stats["degraded_until"] = 0.0
+
+    def call(self, kind: str, lookups: dict[str, Callable[[], dict]], subselection: str = "", fields: Iterable[str] = ()):
+        """Run a lookup on the routed APIs until one answers.
+
+        Args:
+            kind (str): `title` or `name`.
+            lookups (dict[str, Callable]): The lookup of each API, returning a flattened result.
+            subselection (str, optional): The `Rest` subselection asked for, returned without normalising.
+            fields (Iterable[str], optional): The normalised fields needed.
+
+        Returns:
+            dict: The normalised result.
+
+        Raises:
+            The error of the last API tried, when every API failed upstream.
+            Any other error of the first API tried.
+        """
+        error: Exception | None = None
+        for api in self.route(kind, subselection, fields):
+            with timed_loads() as loads:
+                try:
+                    result = lookups[api]()
+                except Exception as exception:
+                    failed = _upstream_failure(exception)
+                    if loads:
+                        self.record(api, sum(loads), failed)
+                    if not failed:
+                        raise
+                    error = exception
+                    continue
+            if loads:
+                self.record(api, sum(loads), False)
+            return result if subselection else normalize(kind, api, result)
+        raise error  # type: ignore
+
+    def getMovie(self, id: int | str, subselection: str = "", fields: Iterable[str] = ()) -> dict:
+        """Gets a movie from the routed APIs, see `IMDbAPI.getMovie`."""
+        from SimpleIMDbDev import flatten
+
+        return self.call(
+            "title",
+            {
+                "Rest": lambda: flatten(Rest.getMovie(id, subselection)),
+                "GraphQL": lambda: flatten(GraphQL.getMovie(id).as_dict()),
+            },
+            subselection,
+            fields,
+        )
+
+    def getPerson(self, id: int | str, subselection: str = "", fields: Iterable[str] = ()) -> dict:
+        """Gets a person from the routed APIs, see `IMDbAPI.getPerson`."""
+        from SimpleIMDbDev import flatten
+
+        return self.call(
+            "name",
+            {
+                "Rest": lambda: flatten(Rest.getPerson(id, subselection)),
+                "GraphQL": lambda: flatten(GraphQL.getPerson(id).as_dict()),
+            },
+            subselection,
+            fields,
+        )
+
+    def updateMovie(self, movie: dict, subselection: str = "") -> dict:
+        """Updates a movie from the routed APIs, see `IMDbAPI.updateMovie`.
+        Without a subselection the normalised fields are merged into the movie."""
+        return self._update("title", movie, subselection)
+
+    def updatePerson(self, person: dict, subselection: str = "") -> dict:
+        """Updates a person from the routed APIs, see `IMDbAPI.updatePerson`.
+        Without a subselection the normalised fields are merged into the person."""
+        return self._update("name", person, subselection)
+
+    def _update(self, kind: str, record: dict, subselection: str) -> dict:
+        name = "movie" if kind == "title" else "person"
+        if not isinstance(record, dict):
+            raise TypeError(f"The {name} object must be a dict, {type(record)} passed.")
+        if not record.get("id"):
+            raise ValueError(f"The ID of the {name} was not found in the object.")
+        lookup = self.getMovie if kind == "title" else self.getPerson
+        result = lookup(record["id"], subselection)
+        if subselection:
+            record[subselection] = result[subselection]
+        else:
+            record.update(result)
+        return record
+
+    def stats(self) -> dict[str, dict]:
+        """The health of each API.
+
+        Returns:
+            dict[str, dict]: The calls, upstream failures, latency average in seconds, error rate average
+                and whether the API is currently degraded, by API.
+        """
+        now = time.time()
+        with self._lock:
+            return {
+                api: {
+                    "calls": stats["calls"],
+                    "failures": stats["failures"],
+                    "latency": stats["latency"],
+                    "error_rate": stats["error_rate"],
+                    "degraded": stats["degraded_until"] > now,
+                }
+                for api, stats in self._health.items()
+            }
+
+    def reset(self) -> None:
+        """Forget the health of every API."""
+        with self._lock:
+            self._health = {api: self._new_health() for api in PREFERENCE}
+
+
+ROUTER = Router()
@@ -0,0 +1,279 @@
+"""Admission of upstream requests by priority class, sharing one concurrency and rate budget.
+Every request sent by `transport` waits for a slot, slots are handed out by weighted fair queuing:
+a class with twice the weight of another gets twice its share of the budget while both are waiting.
+Preemptible classes, `bulk` by default, are held back while another class has requests waiting,
+and leave `reserve` slots free so a spike of interactive lookups does not wait for them to finish.
+Requests in flight are never interrupted.
+
+The class of a request is taken from `PRIORITY`, set with `priority` or `IMDbAPI(priority=...)`.
+
+Examples:
+    transport.schedule(concurrency=16, rate=20)
+    ui = IMDbAPI("Rest", priority="interactive")
+    backfill = IMDbAPI("Rest", priority="bulk")
+"""
+
+__all__ = ["Scheduler", "priority", "PRIORITY", "WEIGHTS"]
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Iterator
+
+from SimpleIMDbDev.metrics import METRICS
+from SimpleIMDbDev.transport import RateLimiter
+
+# Default classes with their weights.
+WEIGHTS = {"interactive": 16, "default": 4, "bulk": 1}
+# The class of the requests sent from the current thread or task.
+PRIORITY: ContextVar[str] = ContextVar("SimpleIMDbDev_priority", default="default")
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Send the requests made within the block as the given class.
+
+    Args:
+        name (str): The class, such as `interactive` or `bulk`.
+
+    Raises:
+        TypeError: When the name is not a string.
+    """
+    if not isinstance(name, str):
+        raise TypeError(f"The priority must be a string, {type(name)} given.")
+    token = PRIORITY.set(name)
+    try:
+        yield
+    finally:
+        PRIORITY.reset(token)
+
+
+class _Waiter:
+    __slots__ = ("name", "tag", "enqueued", "grant", "granted")
+
+    def __init__(self, name: str, tag: float, grant: Callable[[], None]):
+        self.name = name
+        self.tag = tag
+        self.enqueued = time.monotonic()
+        self.grant = grant
+        self.granted = False
+
+
+class Scheduler:
+    """Weighted fair queuing of requests over a shared concurrency and rate budget.
+
+    Args:
+        concurrency (int, optional): The requests in flight at once, over every class.
+        rate (float, optional): The requests started per second, 0 for no limit.
+        burst (int, optional): The requests that may be started at once after an idle period.
+        weights (dict[str, int] | None, optional): The classes with their weights, `WEIGHTS` by default.
+        preemptible (tuple[str, ...], optional): The classes yielding to the others.
+        reserve (int, optional): The slots preemptible classes leave free for the others, at most `concurrency - 1`.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rate: float = 0,
+        burst: int = 1,
+        weights: dict[str, int] | None = None,
+        preemptible: tuple[str, ...] = ("bulk",),
+        reserve: int = 1,
+    ):
+        weights = dict(WEIGHTS if weights is None else weights)
+        if not isinstance(concurrency, int) or not isinstance(reserve, int):
+            raise TypeError("The concurrency and reserve must be integers.")
+        if isinstance(preemptible, str):
+            raise TypeError("The preemptible classes must be an iterable of names, not a string.")
+        if not all(isinstance(name, str) and isinstance(weight, int) for name, weight in weights.items()):
+            raise TypeError("The weights must map class names to integers.")
+        if concurrency < 1 or reserve < 0:
+            raise ValueError("The concurrency must be at least 1 and the reserve cannot be negative.")
+        if not weights or min(weights.values()) < 1:
+            raise ValueError("At least one class is needed, the weights must be at least 1.")
+        unknown = [name for name in preemptible if name not in weights]
+        if unknown:
+            raise ValueError(f"Unknown preemptible classes {unknown}, the classes are {list(weights)}.")
+        self.concurrency = concurrency
+        # Preemptible classes keep at least one slot.
+        self.reserve = min(reserve, concurrency - 1) if any(name not in preemptible for name in weights) else 0
+        self.weights = weights
+        self.preemptible = set(preemptible)
+        self._limiter = RateLimiter(rate, burst) if rate else None
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Waiter]] = {name: deque() for name in weights}
+        self._finish = dict.fromkeys(weights, 0.0)
+        self._virtual = 0.0
+        self._active = dict.fromkeys(weights, 0)
+        self._timer: threading.Timer | None = None
+        self._stats = {
+            name: {"requests": 0, "max_queued": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0, "preempted": 0}
+            for name in weights
+        }
+
+    def _class(self, name: str | None) -> str:
+        name = PRIORITY.get() if name is None else name
+        if name not in self.weights:
+            raise ValueError(f"Unknown priority '{name}', the classes are {list(self.weights)}.")
+        return name
+
+    def _enqueue(self, name: str, grant: Callable[[], None]) -> _Waiter:
+        with self._lock:
+            # Virtual finish time, a class gets slots in proportion to its weight while it stays queued.
+            tag = max(self._virtual, self._finish[name]) + 1 / self.weights[name]
+            self._finish[name] = tag
+            waiter = _Waiter(name, tag, grant)
+            queue = self._queues[name]
+            queue.append(waiter)
+            stats = self._stats[name]
+            stats["max_queued"] = max(stats["max_queued"], len(queue))
+            self._dispatch()
+        return waiter
+
+    def _next(self) -> _Waiter | None:
+        """The waiter to admit next, the lowest tag among the classes allowed a slot."""
+        in_flight = sum(self._active.values())
+        urgent = any(queue for name, queue in self._queues.items() if name not in self.preemptible)
+        best = None
+        for name, queue in self._queues.items():
+            if not queue:
+                continue
+            if name in self.preemptible and (urgent or in_flight >= self.concurrency - self.reserve):
+                continue
+            if best is None or queue[0].tag < best.tag:
+                best = queue[0]
+        return best
+
+    def _dispatch(self) -> None:
+        """Admit waiters while the budget allows, called with the lock held."""
+        while sum(self._active.values()) < self.concurrency:
+            waiter = self._next()
+            if waiter is None:
+                break
+            if self._limiter is not None:
+                wait = self._limiter._take()
+                if wait:
+                    if self._timer is None:
+                        self._timer = threading.Timer(wait, self._wake)
+                        self._timer.daemon = True
+                        self._timer.start()
+                    break
+            self._queues[waiter.name].popleft()
+            self._virtual = waiter.tag
+            self._active[waiter.name] += 1
+            waited = time.monotonic() - waiter.enqueued
+            stats = self._stats[waiter.name]
+            stats["requests"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+            METRICS.observe(f"scheduler.{waiter.name}", "wait", waited)
+            waiter.granted = True
+            waiter.grant()
+            for name in self.preemptible:
+                if name != waiter.name and self._queues[name]:
+                    self._stats[name]["preempted"] += 1
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Drop a waiter that stopped waiting, releasing its slot when it was granted meanwhile."""
+        with self._lock:
+            if not waiter.granted:
+                self._queues[waiter.name].remove(waiter)
+                return
+        self.release(waiter.name)
+
+    def acquire(self, name: str | None = None) -> str:
+        """Wait for a slot.
+
+        Args:
+            name (str | None, optional): The class, `PRIORITY` by default.
+
+        Returns:
+            str: The class, to pass to `release`.
+
+        Raises:
+            ValueError: When the class is unknown.
+        """
+        name = self._class(name)
+        event = threading.Event()
+        waiter = self._enqueue(name, event.set)
+        try:
+            event.wait()
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        return name
+
+    async def aacquire(self, name: str | None = None) -> str:
+        """Wait for a slot without blocking the event loop, see `acquire`."""
+        name = self._class(name)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._enqueue(name, grant)
+        try:
+            await future
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        return name
+
+    def release(self, name: str) -> None:
+        """Give back the slot of a finished request.
+
+        Args:
+            name (str): The class returned by `acquire`.
+        """
+        with self._lock:
+            self._active[name] -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, name: str | None = None) -> Iterator[None]:
+        """Hold a slot for the duration of the block, see `acquire`."""
+        name = self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    @asynccontextmanager
+    async def aslot(self, name: str | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, see `aacquire`."""
+        name = await self.aacquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    def stats(self) -> dict[str, dict]:
+        """The state and history of each class.
+
+        Returns:
+            dict[str, dict]: By class, the `weight`, requests `active` and `queued` now, `max_queued`,
+                the `requests` admitted, their total, average and maximum wait in seconds,
+                and for preemptible classes how often another class was admitted while they waited, `preempted`.
+        """
+        with self._lock:
+            stats = {}
+            for name, history in self._stats.items():
+                requests = history["requests"]
+                stats[name] = {
+                    "weight": self.weights[name],
+                    "preemptible": name in self.preemptible,
+                    "active": self._active[name],
+                    "queued": len(self._queues[name]),
+                    **history,
+                    "average_wait_seconds": history["wait_seconds"] / requests if requests else 0.0,
+                }
+            return stats
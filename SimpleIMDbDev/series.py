@@ -0,0 +1,76 @@
+"""Traversal of a series, season by season, with the episode lookups running on a bounded thread pool.
+Used by `IMDbAPI.getSeries`.
+"""
+
+__all__ = ["crawl"]
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Iterator
+
+from SimpleIMDbDev import Rest
+
+# Episode fields of the listing kept on the detailed episodes, the title lookup does not have them.
+LISTING_FIELDS = ["season", "episode_number"]
+
+
+def _episode(lookup: Callable[[str], dict], listing: dict) -> dict:
+    details = lookup(listing["id"])
+    return {**details, **{field: listing.get(field) for field in LISTING_FIELDS}}
+
+
+def _submit(
+    pool: ThreadPoolExecutor, id: int | str, season: str, lookup: Callable[[str], dict] | None
+) -> Future:
+    """Submit the listing of a season, then the lookup of each of its episodes once it is known.
+    Both run in a copy of the caller's context, keeping its priority class."""
+
+    def listing() -> list[tuple[str, Future | dict]]:
+        episodes = Rest.getEpisodes(id, season)
+        if lookup is None:
+            return [(episode["id"], episode) for episode in episodes]
+        return [
+            (episode["id"], pool.submit(copy_context().run, _episode, lookup, episode)) for episode in episodes
+        ]
+
+    return pool.submit(copy_context().run, listing)
+
+
+def crawl(
+    id: int | str, lookup: Callable[[str], dict] | None, workers: int, ahead: int = 1
+) -> Iterator[tuple[str, list[tuple[str, dict | Exception]]]]:
+    """Yield the episodes of a series one season at a time, in season order.
+    While a season is collected, the listings and lookups of the next `ahead` seasons are already running.
+
+    Args:
+        id (int | str): The ID of the series.
+        lookup (Callable | None): Gets the details of an episode by ID, None to only list the episodes.
+        workers (int): The size of the thread pool.
+        ahead (int, optional): The seasons fetched ahead of the one being collected.
+
+    Returns:
+        Iterator[tuple[str, list[tuple[str, dict | Exception]]]]: The season name with its episodes,
+            each with its details or the error raised for it, in listing order.
+
+    Raises:
+        NotFound: When the series does not exist.
+        HTTPError: When the seasons or a season listing could not be fetched.
+    """
+    seasons = [season["season"] for season in Rest.getSeasons(id)]
+    pool = ThreadPoolExecutor(workers, thread_name_prefix="SimpleIMDbDev-series")
+    try:
+        pending = [_submit(pool, id, season, lookup) for season in seasons[: ahead + 1]]
+        for index, season in enumerate(seasons):
+            if index + ahead + 1 < len(seasons):
+                pending.append(_submit(pool, id, seasons[index + ahead + 1], lookup))
+            episodes = []
+            for episode_id, result in pending.pop(0).result():
+                if isinstance(result, Future):
+                    try:
+                        result = result.result()
+                    except Exception as error:
+                        result = error
+                episodes.append((episode_id, result))
+            yield season, episodes
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
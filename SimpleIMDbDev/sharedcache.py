@@ -0,0 +1,209 @@
+"""A `CacheBackend` shared by the processes of one host, such as the workers of a pre-forking server.
+Entries live in an mmap-backed file, a fixed hash table of slots pointing into an append-only arena.
+
+Writers hold an exclusive `fcntl.flock` on the file, reads take no lock.
+A reader checks the table generation before and after copying a record and verifies its checksum and key,
+a record torn by a concurrent write or reset is treated as a miss.
+
+Examples:
+    CACHE.backend = SharedMemoryBackend("/dev/shm/simpleimdbdev.cache")
+"""
+
+__all__ = ["SharedMemoryBackend"]
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+from SimpleIMDbDev.cache import CacheBackend
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BUCKETS = 65_536
+ARENA_SIZE = 256 * 1024 * 1024
+# The slots probed for a key, linear from its hash.
+MAX_PROBE = 16
+
+_MAGIC = b"SIMDBSHM"
+_VERSION = 1
+# magic, version, buckets, arena_size, generation, arena_used
+_HEADER = struct.Struct("<8sIIQQQ")
+_GENERATION = 24
+_USED = 32
+_HEADER_SIZE = 64
+# key hash, record offset, record length, expiry time
+_SLOT = struct.Struct("<QQQd")
+# key length, crc32 of the key and value
+_RECORD = struct.Struct("<II")
+
+
+def _hash(key: str) -> int:
+    """A nonzero 64 bit hash of a key, 0 marks an empty slot."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryBackend(CacheBackend):
+    """A cache tier in a memory mapped file, every process opening the same path shares the entries.
+
+    Notes:
+        - The file is created with the given size on first use, later opens use the size in its header.
+        - When the arena is full the whole table is reset, entries are then fetched again.
+        - Records past their ttl are misses, their slots are reused by later writes.
+        - Keys landing on `MAX_PROBE` taken slots replace the first expired one, or the first one.
+
+    Args:
+        path (str): The file, on a tmpfs such as `/dev/shm` to keep it in memory.
+        buckets (int, optional): The number of slots in the hash table.
+        arena_size (int, optional): The bytes available for records.
+
+    Raises:
+        ImportError: When `fcntl` is not available on the platform.
+    """
+
+    def __init__(self, path: str, buckets: int = BUCKETS, arena_size: int = ARENA_SIZE):
+        if fcntl is None:
+            raise ImportError("The shared memory backend requires `fcntl`, it is not available on this platform.")
+        if not isinstance(path, str) or not path:
+            raise TypeError(f"The path must be a non-empty string, {path!r} given.")
+        for name, value in [("buckets", buckets), ("arena_size", arena_size)]:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"The {name} must be of type int, {type(value)} given.")
+            if value < 1:
+                raise ValueError(f"The {name} must be positive, {value} given.")
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock = threading.Lock()
+        with self._locked():
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size and header[:8] == _MAGIC:
+                _, version, buckets, arena_size, _, _ = _HEADER.unpack(header)
+                if version != _VERSION:
+                    os.close(self._fd)
+                    raise ValueError(f"The file '{path}' has version {version}, {_VERSION} expected.")
+            else:
+                os.ftruncate(self._fd, _HEADER_SIZE + buckets * _SLOT.size + arena_size)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, _VERSION, buckets, arena_size, 0, 0), 0)
+        self.buckets = buckets
+        self.arena_size = arena_size
+        self._arena = _HEADER_SIZE + buckets * _SLOT.size
+        self._map = mmap.mmap(self._fd, self._arena + arena_size)
+
+    def _locked(self):
+        return _FileLock(self._fd, self._lock)
+
+    def _generation(self) -> int:
+        return struct.unpack_from("<Q", self._map, _GENERATION)[0]
+
+    def _slot(self, index: int) -> tuple[int, int, int, float]:
+        return _SLOT.unpack_from(self._map, _HEADER_SIZE + index * _SLOT.size)
+
+    def _probe(self, hashed: int):
+        start = hashed % self.buckets
+        for step in range(min(MAX_PROBE, self.buckets)):
+            yield (start + step) % self.buckets
+
+    def get(self, key: str) -> str | None:
+        hashed = _hash(key)
+        encoded = key.encode()
+        for _ in range(3):
+            generation = self._generation()
+            if generation & 1:
+                # A reset is in progress.
+                continue
+            found = self._read(hashed, encoded)
+            if self._generation() == generation:
+                return found
+        return None
+
+    def _read(self, hashed: int, encoded: bytes) -> str | None:
+        now = time.time()
+        for index in self._probe(hashed):
+            slot_hash, offset, length, expires = self._slot(index)
+            if slot_hash == 0:
+                return None
+            if slot_hash != hashed:
+                continue
+            if expires and expires < now:
+                return None
+            if offset + length > self.arena_size or length < _RECORD.size:
+                return None
+            start = self._arena + offset
+            data = self._map[start : start + length]
+            key_length, crc = _RECORD.unpack_from(data)
+            body = data[_RECORD.size :]
+            if zlib.crc32(body) != crc or body[:key_length] != encoded:
+                continue
+            return body[key_length:].decode()
+        return None
+
+    def set(self, key: str, record: str, ttl: float) -> None:
+        encoded = key.encode()
+        body = encoded + record.encode()
+        data = _RECORD.pack(len(encoded), zlib.crc32(body)) + body
+        if len(data) > self.arena_size:
+            return
+        hashed = _hash(key)
+        expires = time.time() + ttl if ttl else 0.0
+        with self._locked():
+            used = struct.unpack_from("<Q", self._map, _USED)[0]
+            if used + len(data) > self.arena_size:
+                self._reset()
+                used = 0
+            start = self._arena + used
+            self._map[start : start + len(data)] = data
+            struct.pack_into("<Q", self._map, _USED, used + len(data))
+            _SLOT.pack_into(
+                self._map, _HEADER_SIZE + self._find(hashed) * _SLOT.size, hashed, used, len(data), expires
+            )
+
+    def _find(self, hashed: int) -> int:
+        """The slot to write a key to, its own, an empty or expired one, else the first probed."""
+        now = time.time()
+        reusable = None
+        for index in self._probe(hashed):
+            slot_hash, _, _, expires = self._slot(index)
+            if slot_hash in (0, hashed):
+                return index
+            if reusable is None and expires and expires < now:
+                reusable = index
+        return reusable if reusable is not None else hashed % self.buckets
+
+    def _reset(self) -> None:
+        """Empty the table, the generation is odd while it is cleared so readers retry."""
+        generation = self._generation()
+        struct.pack_into("<Q", self._map, _GENERATION, generation + 1)
+        self._map[_HEADER_SIZE : self._arena] = bytes(self._arena - _HEADER_SIZE)
+        struct.pack_into("<Q", self._map, _USED, 0)
+        struct.pack_into("<Q", self._map, _GENERATION, generation + 2)
+
+    def clear(self) -> None:
+        with self._locked():
+            self._reset()
+
+    def close(self) -> None:
+        """Unmap the file, it is kept for the other processes."""
+        self._map.close()
+        os.close(self._fd)
+
+
+class _FileLock:
+    """The exclusive file lock, with a thread lock as `flock` does not exclude threads sharing the descriptor."""
+
+    def __init__(self, fd: int, lock: threading.Lock):
+        self._fd = fd
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)  # type: ignore
+
+    def __exit__(self, *exc_info) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_UN)  # type: ignore
+        self._lock.release()
@@ -0,0 +1,824 @@
+"""HTTP transport shared by the `Rest` and `GraphQL` modules.
+Requests go through one pooled `requests.Session`, and are timed per phase when `METRICS` is enabled.
+Bodies are negotiated compressed, `gzip` and `deflate` always, `br` and `zstd` when `brotli` and `zstandard`
+are installed, and decompressed chunk by chunk as they arrive. The bytes received and decoded are counted
+per endpoint, see `traffic`.
+With `http2()`, requests go through an `httpx` client instead, every request to a host multiplexed on one
+HTTP/2 connection. Responses are then converted to `requests.Response`, errors to the `requests` exceptions.
+`arequest` is the coroutine counterpart of `request`, used by `aio.AsyncIMDbAPI`,
+and `stream` hands out the body in chunks for bodies too large to hold.
+With `schedule()`, every request first waits for a slot of the `scheduler.Scheduler`, by priority class.
+With `breakers()`, an endpoint failing upstream is no longer called for a while, its requests raise `CircuitOpen`
+at once and the cache answers them with the expired entries it holds, see `cache.StaleResult`.
+"""
+
+__all__ = [
+    "request",
+    "arequest",
+    "stream",
+    "decode",
+    "limit",
+    "schedule",
+    "breakers",
+    "circuits",
+    "compress",
+    "http2",
+    "traffic",
+    "reset_traffic",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "RateLimiter",
+    "SESSION",
+]
+
+import asyncio
+import threading
+import time
+import zlib
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+import requests
+from requests.exceptions import ChunkedEncodingError, ConnectionError, ContentDecodingError, Timeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from SimpleIMDbDev.metrics import METRICS
+
+if TYPE_CHECKING:
+    from SimpleIMDbDev.scheduler import Scheduler
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+SESSION = requests.Session()
+# Size of the reads from the socket.
+CHUNK_SIZE = 64 * 1024
+
+
+def _zlib(wbits: int) -> Callable[[bytes], bytes]:
+    decompressor = zlib.decompressobj(wbits)
+    return decompressor.decompress
+
+
+# Streaming decompressors by content coding, in order of preference.
+DECODERS: dict[str, Callable[[], Callable[[bytes], bytes]]] = {}
+if zstandard is not None:
+    DECODERS["zstd"] = lambda: zstandard.ZstdDecompressor().decompressobj().decompress
+if brotli is not None:
+    DECODERS["br"] = lambda: brotli.Decompressor().process
+DECODERS["gzip"] = lambda: _zlib(16 + zlib.MAX_WBITS)
+DECODERS["deflate"] = lambda: _zlib(zlib.MAX_WBITS)
+
+_DECODE_ERRORS: tuple = (zlib.error,)
+if brotli is not None:
+    _DECODE_ERRORS += (brotli.error,)
+if zstandard is not None:
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
+_ENCODINGS = list(DECODERS)
+SESSION.headers["Accept-Encoding"] = ", ".join(_ENCODINGS)
+
+
+class RateLimiter:
+    """Token bucket shared by every thread sending requests.
+
+    Args:
+        rate (float): The requests per second.
+        burst (int, optional): The requests that may be sent at once after an idle period.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if not isinstance(rate, (int, float)) or not isinstance(burst, int):
+            raise TypeError("The rate must be a number and the burst an integer.")
+        if rate <= 0 or burst < 1:
+            raise ValueError("The rate must be positive and the burst at least 1.")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returns the seconds to wait until it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _take(self) -> float:
+        """Take a token if one is available, returns 0 when taken, otherwise the seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Wait for a token."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+_LIMITER: RateLimiter | None = None
+
+
+class CircuitOpen(ConnectionError):
+    """A request refused without being sent, the circuit of its endpoint is open.
+
+    Args:
+        endpoint (str): The endpoint label.
+        retry_after (float): The seconds until a request is tried again.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"The circuit of '{endpoint}' is open, retrying in {retry_after:.1f} seconds.")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """The health of one endpoint, refusing its requests while it is failing.
+
+    Notes:
+        - `closed`: requests are sent, `failures` upstream failures in a row open the circuit.
+        - `open`: requests raise `CircuitOpen` without being sent, for `cooldown` seconds.
+        - `half_open`: up to `probes` requests are sent at once, others are refused.
+            A success closes the circuit, a failure opens it again.
+        - Connection errors, timeouts, `5xx` and `429` replies are failures, other replies successes.
+
+    Args:
+        failures (int, optional): The failures in a row opening the circuit.
+        cooldown (float, optional): The seconds the circuit stays open.
+        probes (int, optional): The concurrent requests sent while half open.
+    """
+
+    def __init__(self, failures: int = 5, cooldown: float = 30.0, probes: int = 1):
+        if not isinstance(failures, int) or not isinstance(probes, int) or not isinstance(cooldown, (int, float)):
+            raise TypeError("The failures and probes must be integers and the cooldown a number.")
+        if failures < 1 or probes < 1 or cooldown < 0:
+            raise ValueError("The failures and probes must be at least 1 and the cooldown cannot be negative.")
+        self.failures = failures
+        self.cooldown = float(cooldown)
+        self.probes = probes
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._streak = 0
+        self._opened_at = 0.0
+        self._probing = 0
+        self._stats = {"requests": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        """`closed`, `open` or `half_open`."""
+        with self._lock:
+            if self._state == "open" and time.monotonic() >= self._opened_at + self.cooldown:
+                self._state = "half_open"
+            return self._state
+
+    def allow(self, endpoint: str = "") -> bool:
+        """Let a request through, or refuse it.
+
+        Args:
+            endpoint (str, optional): The endpoint label, for the error.
+
+        Returns:
+            bool: Whether the request is a probe of a half open circuit, to pass to `record`.
+
+        Raises:
+            CircuitOpen: When the circuit is open, or half open with every probe in flight.
+        """
+        state = self.state
+        with self._lock:
+            if state == "closed":
+                self._stats["requests"] += 1
+                return False
+            if state == "half_open" and self._probing < self.probes:
+                self._probing += 1
+                self._stats["requests"] += 1
+                return True
+            self._stats["rejected"] += 1
+            retry_after = max(0.0, self._opened_at + self.cooldown - time.monotonic())
+        METRICS.count(endpoint, "circuit_rejected")
+        raise CircuitOpen(endpoint, retry_after)
+
+    def record(self, failed: bool | None, probe: bool = False) -> None:
+        """Record the outcome of a request let through by `allow`.
+
+        Args:
+            failed (bool | None): Whether the upstream failed, None when the request ended
+                without an answer from it, such as an invalid argument.
+            probe (bool, optional): The value returned by `allow`.
+        """
+        with self._lock:
+            if probe:
+                self._probing -= 1
+            if failed is None:
+                return
+            if not failed:
+                self._streak = 0
+                if probe:
+                    self._state = "closed"
+                return
+            self._stats["failures"] += 1
+            self._streak += 1
+            if probe or (self._state == "closed" and self._streak >= self.failures):
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._stats["opened"] += 1
+
+    def stats(self) -> dict:
+        """The state, the failures in a row, and the requests sent, failed and refused.
+
+        Returns:
+            dict: The `state`, `streak`, `requests`, `failures`, `rejected` and `opened` counters.
+        """
+        state = self.state
+        with self._lock:
+            return {"state": state, "streak": self._streak, **self._stats}
+
+
+# Settings of the circuit breakers, None without them.
+_BREAKER_SETTINGS: tuple[int, float, int] | None = None
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def breakers(failures: int = 5, cooldown: float = 30.0, probes: int = 1) -> None:
+    """Give every endpoint a `CircuitBreaker`, so an endpoint failing upstream fails fast instead.
+    Expired cache entries are served while a circuit is open, marked stale, see `cache.StaleResult`.
+
+    Args:
+        failures (int, optional): The upstream failures in a row opening a circuit, 0 removes the breakers.
+        cooldown (float, optional): The seconds a circuit stays open before a probe is sent.
+        probes (int, optional): The concurrent requests sent while a circuit is half open.
+
+    Returns:
+        None: No return
+
+    Raises:
+        TypeError: When an argument is not a number.
+        ValueError: When an argument is out of range.
+    """
+    global _BREAKER_SETTINGS
+    with _BREAKERS_LOCK:
+        _BREAKERS.clear()
+        if isinstance(failures, int) and failures == 0:
+            _BREAKER_SETTINGS = None
+            return
+        CircuitBreaker(failures, cooldown, probes)
+        _BREAKER_SETTINGS = (failures, cooldown, probes)
+
+
+def circuits() -> dict[str, dict]:
+    """The circuit breakers by endpoint, see `CircuitBreaker.stats`.
+
+    Returns:
+        dict[str, dict]: The state and counters of each endpoint requested since `breakers` was called.
+    """
+    with _BREAKERS_LOCK:
+        current = dict(_BREAKERS)
+    return {endpoint: breaker.stats() for endpoint, breaker in sorted(current.items())}
+
+
+def _breaker(endpoint: str) -> CircuitBreaker | None:
+    settings = _BREAKER_SETTINGS
+    if settings is None:
+        return None
+    breaker = _BREAKERS.get(endpoint)
+    if breaker is None:
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.setdefault(endpoint, CircuitBreaker(*settings))
+    return breaker
+
+
+def _ignore(status: int) -> None:
+    pass
+
+
+@contextmanager
+def _circuit(endpoint: str) -> Iterator[Callable[[int], None]]:
+    """Let a request through the circuit of its endpoint, the block reports the reply status to the callable given.
+    Connection errors and timeouts raised in the block count as failures.
+
+    Raises:
+        CircuitOpen: When the circuit is open.
+    """
+    breaker = _breaker(endpoint)
+    if breaker is None:
+        yield _ignore
+        return
+    probe = breaker.allow(endpoint)
+    failed = None
+
+    def status(code: int) -> None:
+        nonlocal failed
+        failed = code >= 500 or code == 429
+
+    try:
+        yield status
+    except (ConnectionError, Timeout, ChunkedEncodingError) as error:
+        if not isinstance(error, CircuitOpen):
+            failed = True
+        raise
+    finally:
+        breaker.record(failed, probe)
+
+
+def limit(rate: float = 0, burst: int = 1) -> None:
+    """Limit the requests sent upstream by every parser, cache hits are not limited.
+
+    Args:
+        rate (float, optional): The requests per second, 0 removes the limit.
+        burst (int, optional): The requests that may be sent at once after an idle period.
+
+    Returns:
+        None: No return
+
+    Raises:
+        TypeError: When the rate or burst are not numbers.
+        ValueError: When the rate is negative or the burst below 1.
+    """
+    global _LIMITER
+    if isinstance(rate, (int, float)) and rate == 0:
+        _LIMITER = None
+        return
+    _LIMITER = RateLimiter(rate, burst)
+
+
+_SCHEDULER: "Scheduler | None" = None
+
+
+def schedule(
+    concurrency: int = 0,
+    rate: float = 0,
+    burst: int = 1,
+    weights: dict[str, int] | None = None,
+    preemptible: tuple[str, ...] = ("bulk",),
+    reserve: int = 1,
+) -> "Scheduler | None":
+    """Admit the requests of every parser by priority class, see `scheduler.Scheduler`.
+    The class of a request is `scheduler.PRIORITY`, set with `scheduler.priority` or `IMDbAPI(priority=...)`.
+
+    Args:
+        concurrency (int, optional): The requests in flight at once, 0 removes the scheduler.
+        rate (float, optional): The requests started per second, 0 for no limit.
+        burst (int, optional): The requests that may be started at once after an idle period.
+        weights (dict[str, int] | None, optional): The classes with their weights, `scheduler.WEIGHTS` by default.
+        preemptible (tuple[str, ...], optional): The classes yielding to the others.
+        reserve (int, optional): The slots preemptible classes leave free for the others.
+
+    Returns:
+        Scheduler | None: The scheduler, for its `stats`.
+
+    Raises:
+        TypeError: When an argument is not of the correct type.
+        ValueError: When a number is out of range or a preemptible class unknown.
+    """
+    global _SCHEDULER
+    if isinstance(concurrency, int) and concurrency == 0:
+        _SCHEDULER = None
+        return None
+    from SimpleIMDbDev.scheduler import Scheduler
+
+    _SCHEDULER = Scheduler(concurrency, rate, burst, weights, preemptible, reserve)
+    return _SCHEDULER
+
+
+def compress(encodings: list[str] | None = None) -> None:
+    """Choose the content codings asked for upstream.
+
+    Args:
+        encodings (list[str] | None, optional): The codings in order of preference, from `DECODERS`.
+            None asks for every installed one, an empty list for uncompressed bodies.
+
+    Returns:
+        None: No return
+
+    Raises:
+        TypeError: When the encodings are not a list of strings.
+        ValueError: When a coding is not supported or its package is not installed.
+    """
+    global _ENCODINGS
+    if encodings is None:
+        encodings = list(DECODERS)
+    if not isinstance(encodings, list) or not all(isinstance(encoding, str) for encoding in encodings):
+        raise TypeError("The encodings must be a list of strings.")
+    unknown = [encoding for encoding in encodings if encoding not in DECODERS]
+    if unknown:
+        raise ValueError(f"Unsupported encodings {unknown}, the installed ones are {list(DECODERS)}.")
+    _ENCODINGS = list(encodings)
+    SESSION.headers["Accept-Encoding"] = ", ".join(_ENCODINGS) or "identity"
+
+
+_HTTP2: "httpx.Client | None" = None
+# Whether the HTTP/2 clients may fall back to HTTP/1.1.
+_HTTP1 = True
+# Headers of HTTP/1.1 connections, not allowed in HTTP/2.
+_HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+# One async client per event loop, their connections cannot be shared between loops.
+_ASYNC_HTTP2: "dict[asyncio.AbstractEventLoop, httpx.AsyncClient]" = {}
+
+
+def http2(enabled: bool = True, prior_knowledge: bool = False) -> None:
+    """Send the requests of every parser over HTTP/2, concurrent requests to a host share one connection.
+    Used by both `request` and `arequest`, disabling goes back to the HTTP/1.1 `SESSION` pool.
+
+    Args:
+        enabled (bool, optional): Whether to use HTTP/2.
+        prior_knowledge (bool, optional): Only speak HTTP/2, also over plain `http://` URLs.
+            By default it is negotiated with TLS and servers without it are answered over HTTP/1.1.
+
+    Returns:
+        None: No return
+
+    Raises:
+        TypeError: When enabled is not a boolean.
+        ImportError: When `httpx` or `h2` is not installed.
+    """
+    global _HTTP2, _HTTP1
+    if not isinstance(enabled, bool) or not isinstance(prior_knowledge, bool):
+        raise TypeError("Enabled and prior_knowledge must be booleans.")
+    if _HTTP2 is not None:
+        _HTTP2.close()
+        _HTTP2 = None
+    _ASYNC_HTTP2.clear()
+    if not enabled:
+        return
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        h2 = None
+    if httpx is None or h2 is None:
+        raise ImportError("HTTP/2 requires the `httpx` and `h2` packages, install `SimpleIMDbDev[http2]`.")
+    _HTTP1 = not prior_knowledge
+    _HTTP2 = httpx.Client(http1=_HTTP1, http2=True, timeout=None)
+
+
+def _async_client() -> "httpx.AsyncClient":
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP2.get(loop)
+    if client is None:
+        for closed in [other for other in _ASYNC_HTTP2 if other.is_closed()]:
+            del _ASYNC_HTTP2[closed]
+        client = _ASYNC_HTTP2[loop] = httpx.AsyncClient(http1=_HTTP1, http2=True, timeout=None)
+    return client
+
+
+def _httpx_arguments(kwargs: dict) -> dict:
+    """The `requests` arguments used by the parsers as `httpx` ones, the session headers included."""
+    unsupported = set(kwargs) - {"headers", "params", "json", "data", "timeout"}
+    if unsupported:
+        raise TypeError(f"Arguments {sorted(unsupported)} are not supported over HTTP/2.")
+    arguments = dict(kwargs)
+    headers = {**SESSION.headers, **(kwargs.get("headers") or {})}
+    arguments["headers"] = {name: value for name, value in headers.items() if name.lower() not in _HOP_BY_HOP}
+    if "data" in arguments:
+        arguments["content"] = arguments.pop("data")
+    return arguments
+
+
+def _response(reply: "httpx.Response", content: bytes) -> requests.Response:
+    """An `httpx` reply as a `requests.Response`, so the parsers handle both the same."""
+    response = requests.Response()
+    response.status_code = reply.status_code
+    response.headers = CaseInsensitiveDict(reply.headers)
+    response.url = str(reply.url)
+    response.reason = reply.reason_phrase
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def _translate(error: Exception) -> Exception:
+    """An `httpx` error as the `requests` one the parsers and the router expect."""
+    if isinstance(error, httpx.TimeoutException):
+        return Timeout(error)
+    if isinstance(error, httpx.DecodingError):
+        return ContentDecodingError(error)
+    return ConnectionError(error)
+
+
+def _http2_request(method: str, url: str, endpoint: str, kwargs: dict) -> requests.Response:
+    try:
+        with _HTTP2.stream(method, url, **_httpx_arguments(kwargs)) as reply:  # type: ignore
+            body = _Body(reply.headers.get("Content-Encoding", ""))
+            for chunk in reply.iter_raw(CHUNK_SIZE):
+                body.feed(chunk)
+    except httpx.HTTPError as error:
+        raise _translate(error)
+    return _response(reply, body.finish(endpoint))
+
+
+class _Traffic:
+    """Bytes received on the wire and after decoding, per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict[str, int]] = {}
+
+    def add(self, endpoint: str, encoding: str, wire: int, decoded: int) -> None:
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            stats["requests"] += 1
+            stats["wire_bytes"] += wire
+            stats["decoded_bytes"] += decoded
+            key = f"{encoding or 'identity'}_requests"
+            stats[key] = stats.get(key, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._endpoints.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+_TRAFFIC = _Traffic()
+
+
+def traffic() -> dict[str, dict[str, int]]:
+    """Gets the bytes received upstream since the start or the last `reset_traffic`.
+
+    Returns:
+        dict[str, dict[str, int]]: By endpoint, the `requests`, `wire_bytes` (as received, compressed),
+            `decoded_bytes` (after decompression) and the requests per coding such as `gzip_requests`.
+    """
+    return _TRAFFIC.snapshot()
+
+
+def reset_traffic() -> None:
+    """Forget the counted bytes.
+
+    Returns:
+        None: No return
+    """
+    _TRAFFIC.clear()
+
+
+class _Body:
+    """Collects a body as it arrives, decompressing each chunk, and counts its bytes."""
+
+    def __init__(self, content_encoding: str, keep: bool = True):
+        self.keep = keep
+        self.encodings = [
+            encoding.strip().lower()
+            for encoding in content_encoding.split(",")
+            if encoding.strip() and encoding.strip().lower() != "identity"
+        ]
+        # Codings are listed in the order they were applied.
+        self.decoders = [DECODERS[encoding]() for encoding in reversed(self.encodings) if encoding in DECODERS]
+        if len(self.decoders) != len(self.encodings):
+            self.decoders = []  # An unknown coding, the body is kept as received.
+        self.chunks: list[bytes] = []
+        self.wire = 0
+        self.decoded = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Decompress a chunk, kept unless the body is streamed."""
+        self.wire += len(chunk)
+        try:
+            for decoder in self.decoders:
+                chunk = decoder(chunk)
+        except _DECODE_ERRORS as error:
+            raise ContentDecodingError(f"The {', '.join(self.encodings)} body could not be decoded: {error}")
+        self.decoded += len(chunk)
+        if self.keep:
+            self.chunks.append(chunk)
+        return chunk
+
+    def finish(self, endpoint: str) -> bytes:
+        """Count the bytes, returns the kept body."""
+        _TRAFFIC.add(endpoint, ", ".join(self.encodings), self.wire, self.decoded)
+        METRICS.count(endpoint, "wire_bytes", self.wire)
+        METRICS.count(endpoint, "decoded_bytes", self.decoded)
+        return b"".join(self.chunks)
+
+
+def _read(response: requests.Response, endpoint: str) -> None:
+    """Read the body as it arrives and keep it as the response content."""
+    body = _Body(response.headers.get("Content-Encoding", ""))
+    try:
+        for chunk in response.raw.stream(CHUNK_SIZE, decode_content=False):
+            body.feed(chunk)
+    except ProtocolError as error:
+        raise ChunkedEncodingError(error)
+    except ReadTimeoutError as error:
+        raise ConnectionError(error)
+    response._content = body.finish(endpoint)
+    response._content_consumed = True
+
+
+def request(method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+    """Send a request on the shared session, the body is read before returning.
+    The body is decompressed while it is read, see `compress`.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The URL.
+        endpoint (str): The endpoint label for the metrics, such as `rest.titles`.
+        **kwargs: Passed to `requests.Session.request`.
+
+    Returns:
+        requests.Response: The response.
+
+    Raises:
+        CircuitOpen: When the circuit of the endpoint is open, see `breakers`.
+        RequestException: Any connection issues.
+        ValueError: When the priority class is unknown to the scheduler.
+    """
+    with _circuit(endpoint) as status:
+        if _SCHEDULER is None:
+            response = _request(method, url, endpoint, kwargs)
+        else:
+            with _SCHEDULER.slot():
+                response = _request(method, url, endpoint, kwargs)
+        status(response.status_code)
+    return response
+
+
+def _request(method: str, url: str, endpoint: str, kwargs: dict) -> requests.Response:
+    if _LIMITER is not None:
+        _LIMITER.acquire()
+    if _HTTP2 is not None:
+        with METRICS.timer(endpoint, "transfer"):
+            response = _http2_request(method, url, endpoint, kwargs)
+        METRICS.count(endpoint, f"status_{response.status_code}")
+        return response
+    if not METRICS.enabled:
+        response = SESSION.request(method, url, stream=True, **kwargs)
+        _read(response, endpoint)
+        return response
+    start = time.perf_counter()
+    response = SESSION.request(method, url, stream=True, **kwargs)
+    headers = time.perf_counter()
+    _read(response, endpoint)
+    METRICS.observe(endpoint, "headers", headers - start)
+    METRICS.observe(endpoint, "transfer", time.perf_counter() - headers)
+    METRICS.count(endpoint, f"status_{response.status_code}")
+    return response
+
+
+async def arequest(method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+    """`request` as a coroutine, over the HTTP/2 client of the running loop with `http2()`,
+    otherwise the HTTP/1.1 `SESSION` on a worker thread.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The URL.
+        endpoint (str): The endpoint label for the metrics, such as `rest.titles`.
+        **kwargs: The `requests.Session.request` arguments, `headers`, `params`, `json`, `data` or `timeout`.
+
+    Returns:
+        requests.Response: The response, its body read.
+
+    Raises:
+        CircuitOpen: When the circuit of the endpoint is open, see `breakers`.
+        RequestException: Any connection issues.
+    """
+    if _HTTP2 is None:
+        return await asyncio.to_thread(request, method, url, endpoint, **kwargs)
+    with _circuit(endpoint) as status:
+        if _SCHEDULER is None:
+            response = await _arequest(method, url, endpoint, kwargs)
+        else:
+            async with _SCHEDULER.aslot():
+                response = await _arequest(method, url, endpoint, kwargs)
+        status(response.status_code)
+    return response
+
+
+async def _arequest(method: str, url: str, endpoint: str, kwargs: dict) -> requests.Response:
+    if _LIMITER is not None:
+        await _LIMITER.aacquire()
+    with METRICS.timer(endpoint, "transfer"):
+        try:
+            async with _async_client().stream(method, url, **_httpx_arguments(kwargs)) as reply:
+                body = _Body(reply.headers.get("Content-Encoding", ""))
+                async for chunk in reply.aiter_raw(CHUNK_SIZE):
+                    body.feed(chunk)
+        except httpx.HTTPError as error:
+            raise _translate(error)
+        response = _response(reply, body.finish(endpoint))
+    METRICS.count(endpoint, f"status_{response.status_code}")
+    return response
+
+
+@contextmanager
+def stream(method: str, url: str, endpoint: str, **kwargs) -> Iterator[tuple[requests.Response, Iterator[bytes]]]:
+    """Send a request without reading the body, for bodies too large to hold at once.
+    The decompressed chunks are produced as they arrive, the bytes are counted once they are all read.
+
+    Examples:
+        with transport.stream("GET", url, "rest.titles") as (response, chunks):
+            for chunk in chunks:
+                ...
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The URL.
+        endpoint (str): The endpoint label for the metrics, such as `rest.titles`.
+        **kwargs: The `requests.Session.request` arguments.
+
+    Returns:
+        Iterator[tuple[requests.Response, Iterator[bytes]]]: A context manager giving the response, its body unread,
+            and the decompressed chunks of the body. The connection is released on exit.
+
+    Raises:
+        CircuitOpen: When the circuit of the endpoint is open, see `breakers`.
+        RequestException: Any connection issues, also while the chunks are read.
+
+    Note:
+        The scheduler slot and the circuit breaker probe are only held until the headers arrive,
+        a slow consumer does not hold up other requests. The reply status is what the breaker records,
+        errors while the chunks are read are raised but not counted as failures of the endpoint.
+    """
+    with ExitStack() as admission:
+        status = admission.enter_context(_circuit(endpoint))
+        if _SCHEDULER is not None:
+            admission.enter_context(_SCHEDULER.slot())
+        body = ExitStack()
+        response, chunks = body.enter_context(_stream(method, url, endpoint, kwargs))
+        status(response.status_code)
+    with body:
+        yield response, chunks
+
+
+@contextmanager
+def _stream(method: str, url: str, endpoint: str, kwargs: dict) -> Iterator[tuple[requests.Response, Iterator[bytes]]]:
+    if _LIMITER is not None:
+        _LIMITER.acquire()
+    if _HTTP2 is not None:
+        try:
+            with _HTTP2.stream(method, url, **_httpx_arguments(kwargs)) as reply:
+                response = _response(reply, b"")
+                response._content = False
+                response._content_consumed = False
+                METRICS.count(endpoint, f"status_{response.status_code}")
+                yield response, _chunks(reply.iter_raw(CHUNK_SIZE), reply.headers, endpoint)
+        except httpx.HTTPError as error:
+            raise _translate(error)
+        return
+    response = SESSION.request(method, url, stream=True, **kwargs)
+    METRICS.count(endpoint, f"status_{response.status_code}")
+    try:
+        yield response, _chunks(response.raw.stream(CHUNK_SIZE, decode_content=False), response.headers, endpoint)
+    except ProtocolError as error:
+        raise ChunkedEncodingError(error)
+    except ReadTimeoutError as error:
+        raise ConnectionError(error)
+    finally:
+        response.close()
+
+
+def _chunks(raw: Iterator[bytes], headers, endpoint: str) -> Iterator[bytes]:
+    body = _Body(headers.get("Content-Encoding", ""), keep=False)
+    for chunk in raw:
+        chunk = body.feed(chunk)
+        if chunk:
+            yield chunk
+    body.finish(endpoint)
+
+
+def decode(response: requests.Response, endpoint: str) -> Any:
+    """Decode the JSON body of a response.
+
+    Args:
+        response (requests.Response): The response.
+        endpoint (str): The endpoint label for the metrics.
+
+    Returns:
+        Any: The decoded JSON.
+
+    Raises:
+        JSONDecodeError: When the body is not JSON.
+    """
+    with METRICS.timer(endpoint, "decode"):
+        return response.json()
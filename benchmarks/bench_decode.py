@@ -0,0 +1,59 @@
+"""CPU-only benchmarks of decoding and object construction, no network involved."""
+
+import json
+
+from SimpleIMDbDev import flatten, jsonstream
+from SimpleIMDbDev.GraphQL import IMDbGraphQL, get_attribute_main_query, todict
+from stub_server import graphql_name, graphql_title, rest_title
+
+TITLE = graphql_title("tt0477051", credits=50)
+NAME = graphql_name("nm0000115", known_for=10)
+
+
+def test_graphql_title_construction(benchmark):
+    benchmark(lambda: IMDbGraphQL.Title(**TITLE))
+
+
+def test_graphql_name_construction(benchmark):
+    benchmark(lambda: IMDbGraphQL.Name(**NAME))
+
+
+def test_flatten_graphql_title(benchmark):
+    title = IMDbGraphQL.Title(**TITLE)
+    benchmark(lambda: flatten(title.as_dict()))
+
+
+def test_flatten_rest_title(benchmark):
+    title = rest_title("tt0477051", credits=50)
+    benchmark(flatten, title)
+
+
+def test_todict(benchmark):
+    title = IMDbGraphQL.Title(**TITLE)
+    benchmark(todict, title)
+
+
+def test_attribute_main_query(benchmark):
+    benchmark(get_attribute_main_query, IMDbGraphQL.Title.SCHEMA)
+
+
+def test_json_decode_rest_title(benchmark):
+    content = json.dumps(rest_title("tt0477051", credits=500)).encode()
+    benchmark(json.loads, content)
+
+
+CREDITS_BODY = json.dumps({"credits": rest_title("tt0477051", credits=20000)["credits"], "next_page_token": ""}).encode()
+CREDITS_CHUNKS = [CREDITS_BODY[start : start + 65536] for start in range(0, len(CREDITS_BODY), 65536)]
+
+
+def test_credits_json_loads(benchmark):
+    """The whole body buffered, then decoded at once."""
+    benchmark(lambda: json.loads(b"".join(CREDITS_CHUNKS))["credits"])
+
+
+def test_credits_streamed(benchmark):
+    benchmark(lambda: sum(1 for _ in jsonstream.items(iter(CREDITS_CHUNKS), "credits")))
+
+
+def test_credits_streamed_first_record(benchmark):
+    benchmark(lambda: next(iter(jsonstream.items(iter(CREDITS_CHUNKS), "credits"))))
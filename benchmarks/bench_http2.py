@@ -0,0 +1,57 @@
+"""High fan-out lookups over the HTTP/1.1 `SESSION` pool and over one multiplexed HTTP/2 connection.
+Requires `httpx` and `h2`, run with `STUB_LATENCY` set to see the effect of the concurrency.
+"""
+
+import asyncio
+import pytest
+
+from SimpleIMDbDev import IMDbAPI, transport
+from SimpleIMDbDev.aio import AsyncIMDbAPI
+from SimpleIMDbDev.cache import CACHE
+from stub_server import H2StubServer
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+FAN_OUT_IDS = [f"tt{n:07d}" for n in range(200001, 200129)]
+
+
+@pytest.fixture
+def h2_stub(stub):
+    """The HTTP/2 stand-in, configured as the HTTP/1.1 one, with the transport switched to it."""
+    server = H2StubServer(latency=stub.latency, error_rate=stub.error_rate, credits=stub.credits)
+    with server, server.patch():
+        transport.http2(prior_knowledge=True)
+        try:
+            yield server
+        finally:
+            transport.http2(False)
+
+
+async def _fan_out(concurrency: int) -> int:
+    results = AsyncIMDbAPI("Rest").getMovies(FAN_OUT_IDS, concurrency)
+    return len([result async for result in results])
+
+
+@pytest.mark.parametrize("workers", [8, 32])
+def test_sync_http1_fan_out(benchmark, stub, workers):
+    api = IMDbAPI("Rest")
+    benchmark.pedantic(lambda: list(api.getMovies(FAN_OUT_IDS, workers)), setup=CACHE.clear, rounds=5)
+
+
+@pytest.mark.parametrize("workers", [8, 32])
+def test_sync_http2_fan_out(benchmark, h2_stub, workers):
+    api = IMDbAPI("Rest")
+    benchmark.pedantic(lambda: list(api.getMovies(FAN_OUT_IDS, workers)), setup=CACHE.clear, rounds=5)
+    assert h2_stub.connections == 1
+
+
+def test_async_http1_fan_out(benchmark, stub):
+    """Without HTTP/2 the coroutines run the `SESSION` requests on the default thread pool."""
+    benchmark.pedantic(lambda: asyncio.run(_fan_out(64)), setup=CACHE.clear, rounds=5)
+
+
+def test_async_http2_fan_out(benchmark, h2_stub):
+    benchmark.pedantic(lambda: asyncio.run(_fan_out(64)), setup=CACHE.clear, rounds=5)
+    # One connection per event loop, each round runs its own loop.
+    assert h2_stub.connections <= 5
@@ -0,0 +1,22 @@
+"""CPU-only benchmarks of ID parsing, one at a time and as a column."""
+
+from SimpleIMDbDev import ids
+
+COLUMN = [f"tt{number:07d}" for number in range(0, 400_000, 2)]
+
+
+def test_normalize_id(benchmark):
+    benchmark(ids.normalize_id, "tt0477051", "tt")
+
+
+def test_pack_many(benchmark):
+    benchmark(ids.pack_many, COLUMN)
+
+
+def test_pack_one_at_a_time(benchmark):
+    benchmark(lambda: [ids.pack(id) for id in COLUMN])
+
+
+def test_unpack_many(benchmark):
+    packed = ids.pack_many(COLUMN)
+    benchmark(ids.unpack_many, packed)
@@ -0,0 +1,35 @@
+"""Cold start of `import SimpleIMDbDev`, measured in fresh interpreters.
+`IMPORT_BUDGET_MS` sets the budget for the package's own cumulative import time, 25 ms by default.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 25))
+EAGER_FORBIDDEN = ["requests", "SimpleIMDbDev.Rest", "SimpleIMDbDev.GraphQL", "importlib.metadata"]
+
+
+def _import_time(statement: str = "import SimpleIMDbDev") -> float:
+    """The cumulative `-X importtime` of the package in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| SimpleIMDbDev$", result.stderr, re.MULTILINE)
+    assert match, result.stderr
+    return int(match.group(1)) / 1000
+
+
+def test_import_time(benchmark):
+    milliseconds = benchmark.pedantic(_import_time, rounds=10)
+    assert milliseconds < IMPORT_BUDGET_MS, f"import took {milliseconds:.1f} ms"
+
+
+def test_import_is_lazy():
+    check = f"import sys, SimpleIMDbDev; print([m for m in {EAGER_FORBIDDEN!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
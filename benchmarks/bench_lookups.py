@@ -0,0 +1,143 @@
+"""Lookup benchmarks against the stub server, for both parsers and each cache path."""
+
+import pytest
+
+from SimpleIMDbDev import GraphQL, IMDbAPI, NotFound, Rest, transport
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.metrics import METRICS
+
+BULK_IDS = [f"tt{n:07d}" for n in range(100001, 100101)]
+
+
+def test_rest_movie_miss(benchmark, stub):
+    benchmark.pedantic(Rest.getMovie, args=("tt0477051",), setup=CACHE.clear, rounds=200)
+
+
+def test_rest_movie_hit(benchmark, stub):
+    Rest.getMovie("tt0477051")
+    benchmark(Rest.getMovie, "tt0477051")
+
+
+def test_rest_movie_revalidated(benchmark, stub):
+    """Every call revalidates the expired entry and gets a `304 Not Modified`."""
+    CACHE.ttl = 1e-9
+    Rest.getMovie("tt0477051")
+    benchmark(Rest.getMovie, "tt0477051")
+    assert CACHE.stats()["not_modified"] > 0
+
+
+def test_rest_credits_miss(benchmark, stub):
+    benchmark.pedantic(Rest.getMovie, args=("tt0477051", "credits"), setup=CACHE.clear, rounds=100)
+
+
+@pytest.mark.parametrize("encodings", [[], ["gzip"]], ids=["identity", "gzip"])
+def test_rest_akas_miss(benchmark, stub, encodings):
+    """The large `akas` payload, uncompressed and gzipped, the wire and decoded bytes are in `extra_info`."""
+    transport.compress(encodings)
+    transport.reset_traffic()
+    try:
+        benchmark.pedantic(Rest.getMovie, args=("tt0477051", "akas"), setup=CACHE.clear, rounds=100)
+    finally:
+        transport.compress()
+    stats = transport.traffic()["rest.titles"]
+    benchmark.extra_info["wire_bytes"] = stats["wire_bytes"] // stats["requests"]
+    benchmark.extra_info["decoded_bytes"] = stats["decoded_bytes"] // stats["requests"]
+
+
+def test_rest_person_miss(benchmark, stub):
+    benchmark.pedantic(Rest.getPerson, args=("nm0000115",), setup=CACHE.clear, rounds=200)
+
+
+def test_rest_not_found_hit(benchmark, stub):
+    def lookup():
+        try:
+            Rest.getMovie("tt0000404")
+        except NotFound:
+            pass
+
+    lookup()
+    benchmark(lookup)
+
+
+def test_rest_search(benchmark, stub):
+    def search():
+        Rest.searchMovie.cache_clear()
+        return Rest.searchMovie("Norbit", 2007, 2)
+
+    benchmark(search)
+
+
+def test_graphql_movie_miss(benchmark, stub):
+    benchmark.pedantic(GraphQL.getMovie, args=("tt0477051",), setup=CACHE.clear, rounds=100)
+
+
+def test_graphql_movie_hit(benchmark, stub):
+    """A hit still builds the `IMDbGraphQL.Title` from the cached payload."""
+    GraphQL.getMovie("tt0477051")
+    benchmark(GraphQL.getMovie, "tt0477051")
+
+
+def test_graphql_person_miss(benchmark, stub):
+    benchmark.pedantic(GraphQL.getPerson, args=("nm0000115",), setup=CACHE.clear, rounds=100)
+
+
+def test_imdbapi_rest_bulk_miss(benchmark, stub):
+    api = IMDbAPI("Rest")
+    benchmark.pedantic(lambda: [api.getMovie(id) for id in BULK_IDS], setup=CACHE.clear, rounds=5)
+
+
+def test_imdbapi_graphql_bulk_miss(benchmark, stub):
+    api = IMDbAPI("GraphQL")
+    benchmark.pedantic(lambda: [api.getMovie(id) for id in BULK_IDS], setup=CACHE.clear, rounds=5)
+
+
+@pytest.mark.parametrize("processes", [0, 2, 4], ids=["threads", "2-processes", "4-processes"])
+def test_imdbapi_graphql_concurrent_miss(benchmark, stub, processes):
+    """Concurrent lookups, objects built on the lookup threads or by a process pool."""
+    api = IMDbAPI("GraphQL")
+    benchmark.pedantic(
+        lambda: list(api.getMovies(BULK_IDS, workers=16, processes=processes)), setup=CACHE.clear, rounds=5
+    )
+
+
+def test_imdbapi_rest_bulk_hit(benchmark, stub):
+    api = IMDbAPI("Rest")
+    [api.getMovie(id) for id in BULK_IDS]
+    benchmark(lambda: [api.getMovie(id) for id in BULK_IDS])
+
+
+def test_imdbapi_rest_hit_instrumented(benchmark, stub):
+    """Compare with `test_imdbapi_rest_bulk_hit` for the cost of enabled metrics."""
+    api = IMDbAPI("Rest")
+    [api.getMovie(id) for id in BULK_IDS]
+    api.instrument()
+    try:
+        benchmark(lambda: [api.getMovie(id) for id in BULK_IDS])
+    finally:
+        METRICS.disable()
+        METRICS.reset()
+
+
+@pytest.fixture
+def redis_tier():
+    """A Redis protocol tier behind `CACHE`, with a simulated 1 ms round trip."""
+    from SimpleIMDbDev.rediscache import RedisBackend, StandInServer
+
+    with StandInServer(latency=0.001) as server:
+        backend = RedisBackend(port=server.port)
+        CACHE.backend = backend
+        try:
+            yield backend
+        finally:
+            CACHE.backend = None
+            backend.close()
+
+
+@pytest.mark.parametrize("prefetch", [True, False], ids=["prefetched", "per-key"])
+def test_imdbapi_rest_bulk_shared_hit(benchmark, stub, redis_tier, prefetch):
+    """A cold in-process tier served by the shared one, one pipelined round trip per batch or one per ID."""
+    api = IMDbAPI("Rest")
+    list(api.getMovies(BULK_IDS, workers=8))
+    if not prefetch:
+        api._prefetcher = lambda field: None
+    benchmark.pedantic(lambda: list(api.getMovies(BULK_IDS, workers=8)), setup=CACHE.clear, rounds=5)
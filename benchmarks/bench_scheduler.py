@@ -0,0 +1,50 @@
+"""Interactive lookups while a bulk backfill uses up a shared budget of `RATE` requests per second,
+enforced by `transport.limit` in arrival order, or by the scheduler ahead of the backfill.
+"""
+
+import itertools
+import threading
+import pytest
+
+from SimpleIMDbDev import IMDbAPI, transport
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.scheduler import priority
+
+RATE = 40
+_NUMBERS = itertools.count(300001)
+
+
+def _fresh_id() -> str:
+    return f"tt{next(_NUMBERS):07d}"
+
+
+@pytest.fixture
+def backfill(stub):
+    """A bulk `getMovies` over fresh IDs on a background thread, for the duration of the benchmark."""
+    stop = threading.Event()
+
+    def run():
+        with priority("bulk"):
+            ids = iter(_fresh_id, None)
+            for _ in IMDbAPI("Rest").getMovies(itertools.takewhile(lambda _: not stop.is_set(), ids), 16):
+                pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    yield
+    stop.set()
+    thread.join()
+
+
+@pytest.mark.parametrize("scheduled", [False, True])
+def test_interactive_under_backfill(benchmark, backfill, scheduled):
+    if scheduled:
+        transport.schedule(8, rate=RATE, reserve=2)
+    else:
+        transport.limit(RATE)
+    api = IMDbAPI("Rest", priority="interactive")
+    try:
+        benchmark.pedantic(lambda: api.getMovie(_fresh_id()), setup=CACHE.clear, rounds=20)
+    finally:
+        transport.schedule(0)
+        transport.limit(0)
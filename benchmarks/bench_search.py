@@ -0,0 +1,65 @@
+"""CPU-only benchmarks of the batch search filter, `rankSearchColumns` with and without NumPy and `filterSearchResults`.
+Each batch holds 50 000 results, split in queries of 10, 50 or 200 candidates.
+"""
+
+import random
+from unittest import mock
+
+import pytest
+
+from SimpleIMDbDev import Rest
+
+RESULTS = 50_000
+SIZES = [10, 50, 200]
+
+
+def _candidates(size: int) -> tuple[list[list[dict]], list[int]]:
+    generator = random.Random(31)
+    candidates = [
+        [
+            {
+                "id": f"tt{query:05d}{index:03d}",
+                "start_year": generator.randrange(1950, 2025),
+                "rating": {"aggregate_rating": generator.random() * 10, "votes_count": generator.randrange(10**6)},
+            }
+            for index in range(size)
+        ]
+        for query in range(RESULTS // size)
+    ]
+    return candidates, [generator.randrange(1950, 2025) for _ in candidates]
+
+
+def _columns(candidates: list[list[dict]]) -> tuple[list, list, list, list]:
+    titles = [title for query in candidates for title in query]
+    return (
+        [index for index, query in enumerate(candidates) for _ in query],
+        [title["start_year"] for title in titles],
+        [title["rating"]["votes_count"] for title in titles],
+        [title["rating"]["aggregate_rating"] for title in titles],
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("rank", [True, False], ids=["rank", "filter"])
+def test_rank_search_columns(benchmark, rank, size):
+    numpy = pytest.importorskip("numpy")
+    candidates, years = _candidates(size)
+    columns = [numpy.asarray(column, dtype=float) for column in _columns(candidates)]
+    columns[0] = columns[0].astype(numpy.intp)
+    benchmark(Rest.rankSearchColumns, *columns, years, 5, rank)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("rank", [True, False], ids=["rank", "filter"])
+def test_rank_search_columns_without_numpy(benchmark, rank, size):
+    candidates, years = _candidates(size)
+    columns = _columns(candidates)
+    with mock.patch.object(Rest, "numpy", None):
+        benchmark(Rest.rankSearchColumns, *columns, years, 5, rank)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("rank", [True, False], ids=["rank", "filter"])
+def test_filter_search_results(benchmark, rank, size):
+    candidates, years = _candidates(size)
+    benchmark(Rest.filterSearchResults, candidates, years, 5, rank)
@@ -0,0 +1,33 @@
+"""Series traversal benchmarks against the stub server, 5 seasons of 20 episodes by default.
+Run with `STUB_LATENCY` set to see the effect of the concurrent lookups.
+"""
+
+import pytest
+
+from SimpleIMDbDev import IMDbAPI
+from SimpleIMDbDev.cache import CACHE
+
+
+def test_series_serial_miss(benchmark, stub):
+    """The serial baseline, one listing then one `getMovie` at a time."""
+    api = IMDbAPI("Rest")
+
+    def serial():
+        return [
+            [api.getMovie(id) for id, _ in season]
+            for _, season in api.getSeries("tt0903747", details=False)
+        ]
+
+    benchmark.pedantic(serial, setup=CACHE.clear, rounds=3)
+
+
+@pytest.mark.parametrize("workers", [4, 16])
+def test_series_concurrent_miss(benchmark, stub, workers):
+    api = IMDbAPI("Rest")
+    benchmark.pedantic(lambda: list(api.getSeries("tt0903747", workers=workers)), setup=CACHE.clear, rounds=3)
+
+
+def test_series_hit(benchmark, stub):
+    api = IMDbAPI("Rest")
+    list(api.getSeries("tt0903747"))
+    benchmark(lambda: list(api.getSeries("tt0903747")))
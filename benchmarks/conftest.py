@@ -0,0 +1,31 @@
+"""Benchmark fixtures, the stub server is configured from the environment:
+`STUB_LATENCY` (seconds per reply), `STUB_ERROR_RATE` (share of `500` replies) and `STUB_CREDITS`.
+"""
+
+import os
+import pytest
+
+from SimpleIMDbDev.cache import CACHE
+from stub_server import StubServer
+
+
+@pytest.fixture(scope="session")
+def stub():
+    """The local imdbapi.dev stand-in, with `Rest` and `GraphQL` pointed at it."""
+    server = StubServer(
+        latency=float(os.environ.get("STUB_LATENCY", 0)),
+        error_rate=float(os.environ.get("STUB_ERROR_RATE", 0)),
+        credits=int(os.environ.get("STUB_CREDITS", 10)),
+    )
+    with server, server.patch():
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Every benchmark starts from an empty cache with the default settings."""
+    CACHE.clear()
+    ttl, negative_ttl = CACHE.ttl, CACHE.negative_ttl
+    yield CACHE
+    CACHE.clear()
+    CACHE.ttl, CACHE.negative_ttl = ttl, negative_ttl
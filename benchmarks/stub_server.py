@@ -0,0 +1,360 @@
+"""A local stand-in for imdbapi.dev used by the benchmarks.
+Serves recorded `Rest` and `GraphQL` payloads for any ID, with configurable latency and error rate.
+Bodies are gzipped when the request accepts it.
+
+Examples:
+    with StubServer(latency=0.02, error_rate=0.01) as server, server.patch():
+        IMDbAPI().getMovie("tt0477051")
+
+    python benchmarks/stub_server.py --port 8080 --latency 0.05
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from SimpleIMDbDev import GraphQL, Rest
+
+# fmt: off
+REST_TITLE = {
+    "type": "movie", "primary_title": "Norbit",
+    "primary_image": {"url": "https://m.media-amazon.com/images/M/MV5BMTI4NDE4MjgyNV5BMl5BanBnXkFtZTcwMTQwODc0MQ@@._V1_.jpg", "width": 300, "height": 444},
+    "genres": ["Comedy", "Romance"], "rating": {"aggregate_rating": 4.2, "votes_count": 84384},
+    "start_year": 2007, "runtime_minutes": 102,
+    "plot": "A mild-mannered guy, who is married to a monstrous woman, meets the woman of his dreams, and schemes to find a way to be with her.",
+}
+REST_CREDIT = {
+    "name": {"id": "nm0000552", "display_name": "Eddie Murphy",
+             "primary_image": {"url": "https://m.media-amazon.com/images/M/MV5BMTc0NDQzODAwNF5BMl5BanBnXkFtZTYwMzUzNTk3._V1_.jpg", "width": 285, "height": 400}},
+    "category": "ACTOR", "characters": ["Norbit", "Rasputia", "Mr. Wong"],
+}
+REST_AKA = {"country_code": "BG", "language_code": "bul", "text": "Норбит"}
+REST_RELEASE_DATE = {"country_code": "US", "release_date": {"year": 2007, "month": 2, "day": 9}}
+REST_NAME = {
+    "display_name": "Nicolas Cage",
+    "primary_image": {"url": "https://m.media-amazon.com/images/M/MV5BMjUxMjE4MTQxMF5BMl5BanBnXkFtZTcwNzc2MDM1NA@@._V1_.jpg", "width": 1503, "height": 2048},
+    "alternative_names": ["Nicholas Cage", "Nicolas Kim Coppola", "Nicolas Coppola"],
+    "primary_professions": ["actor", "producer", "director"],
+    "biography": "Nicolas Cage was born Nicolas Kim Coppola in Long Beach, California.",
+    "birth_name": "Nicholas Kim Coppola", "birth_date": {"year": 1964, "month": 1, "day": 7},
+    "birth_location": "Long Beach, California, USA",
+}
+REST_KNOWN_FOR = {
+    "title": {"id": "tt0119094", "type": "movie", "primary_title": "Face/Off",
+              "rating": {"aggregate_rating": 7.3, "votes_count": 415671}, "start_year": 1997},
+    "category": "ACTOR", "characters": ["Castor Troy"],
+}
+GRAPHQL_NAME = {
+    "display_name": "Eddie Murphy", "alternate_names": ["Fred Braughton", "Edward 'Eddie' Regan Murphy"],
+    "birth_year": 1961, "birth_location": "Brooklyn, New York City, New York, USA",
+    "death_year": None, "death_location": None, "dead_reason": None,
+    "avatars": [{"url": "https://m.media-amazon.com/images/M/MV5BMTc0NDQzODAwNF5BMl5BanBnXkFtZTYwMzUzNTk3._V1_.jpg", "width": 285, "height": 400}],
+}
+GRAPHQL_TITLE = {
+    "type": "movie", "is_adult": False, "primary_title": "Norbit", "original_title": None,
+    "start_year": 2007, "end_year": None, "runtime_minutes": 102, "plot": REST_TITLE["plot"],
+    "rating": {"aggregate_rating": 4.2, "votes_count": 79169},
+    "certificates": [{"country": {"code": "US", "name": "United States"}, "rating": "PG-13"}],
+    "critic_review": {"score": 27, "review_count": 26}, "genres": ["Comedy", "Romance"],
+    "spoken_languages": [{"code": "eng", "name": "English"}],
+    "origin_countries": [{"code": "US", "name": "United States"}],
+    "posters": [{"url": REST_TITLE["primary_image"]["url"], "width": 300, "height": 444, "language_code": None}],
+}
+# fmt: on
+
+
+def rest_title(id: str, credits: int = 0) -> dict:
+    """A recorded `/v2/titles/{id}` payload, with `credits` entries when above 0."""
+    title = {"id": id, **REST_TITLE}
+    if credits:
+        title["credits"] = [REST_CREDIT] * credits
+    return title
+
+
+def graphql_title(id: str, credits: int = 10) -> dict:
+    """A recorded GraphQL `title` payload with `credits` entries."""
+    credit = {"name": {"id": "nm0000552", **GRAPHQL_NAME}, "category": "actor",
+              "characters": ["Norbit"], "episodes_count": None}  # fmt: skip
+    return {"id": id, **GRAPHQL_TITLE, "credits": [credit] * credits}
+
+
+def graphql_name(id: str, known_for: int = 5) -> dict:
+    """A recorded GraphQL `name` payload with `known_for` titles."""
+    title = {"id": "tt0119094", **GRAPHQL_TITLE}
+    del title["is_adult"], title["end_year"], title["plot"], title["rating"]
+    return {"id": id, **GRAPHQL_NAME, "known_for": [title] * known_for}
+
+
+EPISODE_PAGE = 50
+
+
+class StubServer:
+    """A threaded HTTP server answering like `rest.imdbapi.dev` and `graph.imdbapi.dev`.
+    Replies carry an `ETag` and honour `If-None-Match`, IDs ending in `404` are not found.
+
+    Args:
+        latency (float, optional): Seconds to wait before each reply.
+        error_rate (float, optional): Share of requests answered with a `500`.
+        credits (int, optional): Number of credits in title and `credits` payloads.
+        seed (int, optional): Seed for the error sampling.
+        port (int, optional): The port to listen on, 0 picks a free one.
+        seasons (int, optional): Number of seasons of every series.
+        episodes (int, optional): Number of episodes of every season, listed `EPISODE_PAGE` per page.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        credits: int = 10,
+        seed: int = 0,
+        port: int = 0,
+        seasons: int = 5,
+        episodes: int = 20,
+    ):
+        self.latency = latency
+        self.seasons = seasons
+        self.episodes = episodes
+        self.error_rate = error_rate
+        self.credits = credits
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = self._listen(port)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @contextmanager
+    def patch(self):
+        """Point the `Rest` and `GraphQL` modules at this server for the duration."""
+        base_url, endpoint = Rest.BASE_URL, GraphQL.API_ENDPOINT
+        Rest.BASE_URL, GraphQL.API_ENDPOINT = self.url, f"{self.url}/v1"
+        try:
+            yield self
+        finally:
+            Rest.BASE_URL, GraphQL.API_ENDPOINT = base_url, endpoint
+
+    def _fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            return bool(self.error_rate) and self._random.random() < self.error_rate
+
+    def route(self, method: str, path: str, query: dict, body: bytes) -> tuple[int, dict]:
+        """Answer a request, returns the status and JSON payload."""
+        if method == "POST" and path == "/v1":
+            request = json.loads(body or b"{}").get("query", "")
+            match = re.search(r'(title|name)\(id: "(\w+)"\)', request)
+            if not match:
+                return 400, {"errors": [{"message": "BAD_QUERY"}]}
+            field, id = match.groups()
+            if id.endswith("404"):
+                return 200, {"errors": [{"message": "NOT_FOUND", "path": [field]}], "data": {field: None}}
+            value = graphql_title(id, self.credits) if field == "title" else graphql_name(id)
+            return 200, {"data": {field: value}}
+        parts = path.strip("/").split("/")
+        if path == "/v2/search/titles":
+            search = query.get("query", [""])[0]
+            titles = [{"id": f"tt{1000000 + n}", **REST_TITLE, "start_year": 2000 + n % 20} for n in range(25)]
+            return 200, {"titles": titles if search else []}
+        if len(parts) < 3 or parts[0] != "v2" or parts[1] not in ["titles", "names"]:
+            return 404, {"code": 5, "message": "Not Found"}
+        kind, id, subselection = parts[1], parts[2], "/".join(parts[3:])
+        if id.endswith("404"):
+            return 404, {"code": 5, "message": f"{id} not found"}
+        match kind, subselection:
+            case "titles", "":
+                return 200, rest_title(id)
+            case "titles", "credits":
+                return 200, {"credits": [REST_CREDIT] * self.credits, "next_page_token": ""}
+            case "titles", "akas":
+                return 200, {"akas": [REST_AKA] * self.credits}
+            case "titles", "release_dates":
+                return 200, {"release_dates": [REST_RELEASE_DATE] * self.credits}
+            case "titles", "seasons":
+                seasons = [{"season": str(n), "episode_count": self.episodes} for n in range(1, self.seasons + 1)]
+                return 200, {"seasons": seasons}
+            case "titles", "episodes":
+                season = query.get("season", ["1"])[0]
+                start = int(query.get("page_token", ["0"])[0])
+                end = min(start + EPISODE_PAGE, self.episodes)
+                episodes = [
+                    {"id": f"tt{9000000 + int(season) * 1000 + n}", "title": f"Episode {n + 1}",
+                     "season": season, "episode_number": n + 1}
+                    for n in range(start, end)
+                ]
+                return 200, {"episodes": episodes, "next_page_token": str(end) if end < self.episodes else ""}
+            case "names", "":
+                return 200, {"id": id, **REST_NAME}
+            case "names", "known_for":
+                return 200, {"known_for": [REST_KNOWN_FOR] * 4}
+        return 404, {"code": 5, "message": "Not Found"}
+
+    def reply(self, method: str, target: str, headers, body: bytes) -> tuple[int, list[tuple[str, str]], bytes]:
+        """Answer a request, returns the status, the reply headers and the body."""
+        if self.latency:
+            time.sleep(self.latency)
+        if self._fail():
+            status, payload = 500, {"code": 13, "message": "stub failure"}
+        else:
+            url = urlparse(target)
+            status, payload = self.route(method, url.path, parse_qs(url.query), body)
+        content = json.dumps(payload).encode()
+        etag = '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+        if status == 200 and method == "GET" and headers.get("If-None-Match") == etag:
+            status, content = 304, b""
+        reply_headers = [("Content-Type", "application/json")]
+        if content and "gzip" in headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content, compresslevel=5)
+            reply_headers.append(("Content-Encoding", "gzip"))
+        reply_headers.append(("Content-Length", str(len(content))))
+        if status in [200, 304]:
+            reply_headers.append(("ETag", etag))
+        return status, reply_headers, content
+
+    def _listen(self, port: int) -> socketserver.TCPServer:
+        server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        server.daemon_threads = True
+        return server
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, content = server.reply(method, self.path, self.headers, body)
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                self._reply("GET")
+
+            def do_POST(self):
+                self._reply("POST")
+
+        return Handler
+
+
+class _H2Connection:
+    """One HTTP/2 connection of the `H2StubServer`, each stream answered on its own thread."""
+
+    def __init__(self, stub: StubServer, sock):
+        import h2.config
+        import h2.connection
+
+        self.stub = stub
+        self.sock = sock
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.condition = threading.Condition()
+        self.streams: dict[int, tuple[dict, bytearray]] = {}
+
+    def _flush(self) -> None:
+        """Send the pending frames, must be called holding the condition."""
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def serve(self) -> None:
+        import h2.events
+
+        with self.condition:
+            self.conn.initiate_connection()
+            self._flush()
+        while data := self.sock.recv(65535):
+            with self.condition:
+                events = self.conn.receive_data(data)
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        self.streams[event.stream_id] = (dict(event.headers), bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        self.streams[event.stream_id][1].extend(event.data)
+                        self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = self.streams.pop(event.stream_id)
+                        threading.Thread(target=self._answer, args=(event.stream_id, headers, bytes(body)), daemon=True).start()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                self.condition.notify_all()  # Window updates may unblock replies.
+                self._flush()
+
+    def _answer(self, stream_id: int, headers: dict, body: bytes) -> None:
+        request_headers = {name.title(): value for name, value in headers.items()}
+        status, reply_headers, content = self.stub.reply(headers[":method"], headers[":path"], request_headers, body)
+        with self.condition:
+            self.conn.send_headers(stream_id, [(":status", str(status))] + [(k.lower(), v) for k, v in reply_headers])
+            while content:
+                size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                if size <= 0:
+                    self._flush()
+                    self.condition.wait()
+                    continue
+                self.conn.send_data(stream_id, content[:size])
+                content = content[size:]
+            self.conn.end_stream(stream_id)
+            self._flush()
+
+
+class H2StubServer(StubServer):
+    """The `StubServer` speaking cleartext HTTP/2 (`h2c` with prior knowledge), requires the `h2` package.
+    Use with `transport.http2(prior_knowledge=True)`, all requests then share one connection.
+    The connections accepted are counted in `connections`.
+    """
+
+    connections = 0
+
+    def _listen(self, port: int) -> socketserver.TCPServer:
+        stub = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                with stub._lock:
+                    stub.connections += 1
+                _H2Connection(stub, self.request).serve()
+
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the imdbapi.dev stub server.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--credits", type=int, default=10)
+    args = parser.parse_args()
+    with StubServer(args.latency, args.error_rate, args.credits, port=args.port) as stub:
+        print(f"Serving on {stub.url}, Rest at {stub.url}/v2 and GraphQL at {stub.url}/v1")
+        threading.Event().wait()
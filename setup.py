@@ -1,6 +1,11 @@
 import setuptools
 
 DEV_PACKAGES = ["responses", "flake8", "pytest"]
+BENCH_PACKAGES = ["pytest", "pytest-benchmark", "httpx", "h2"]
+CLI_PACKAGES = ["tqdm", "pyarrow"]
+COLUMNAR_PACKAGES = ["pyarrow", "numpy"]
+COMPRESSION_PACKAGES = ["brotli", "zstandard"]
+HTTP2_PACKAGES = ["httpx", "h2"]
 
 setuptools.setup(
     name="SimpleIMDbDev",
@@ -13,6 +18,14 @@ setuptools.setup(
     license="GNU General Public License v3.0",
     extras_require={
         "dev": DEV_PACKAGES,
+        "bench": BENCH_PACKAGES,
+        "cli": CLI_PACKAGES,
+        "columnar": COLUMNAR_PACKAGES,
+        "compression": COMPRESSION_PACKAGES,
+        "http2": HTTP2_PACKAGES,
+    },
+    entry_points={
+        "console_scripts": ["simpleimdbdev=SimpleIMDbDev.cli:main"],
     },
     install_requires=[
         'importlib-metadata; python_version>="3.10"',
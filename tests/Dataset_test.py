@@ -0,0 +1,113 @@
+import gzip, os, tempfile, unittest
+from SimpleIMDbDev import Dataset, IMDbAPI, NotFound
+from SimpleIMDbDev.cli import main
+
+# fmt: off
+TITLE_BASICS = [
+    "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres",
+    "tt0477051\tmovie\tNorbit\tNorbit\t0\t2007\t\\N\t102\tComedy,Romance",
+    "tt0119094\tmovie\tFace/Off\tFace/Off\t0\t1997\t\\N\t138\tAction,Crime,Sci-Fi",
+    "tt10000000\tshort\tNorbit Returns\t\\N\t0\t2019\t\\N\t\\N\t\\N",
+]
+TITLE_RATINGS = [
+    "tconst\taverageRating\tnumVotes",
+    "tt0477051\t4.2\t84384",
+    "tt0119094\t7.3\t415671",
+]
+NAME_BASICS = [
+    "nconst\tprimaryName\tbirthYear\tdeathYear\tprimaryProfession\tknownForTitles",
+    "nm0000552\tEddie Murphy\t1961\t\\N\tactor,writer,producer\ttt0477051",
+    "nm0000115\tNicolas Cage\t1964\t\\N\tactor,producer,director\ttt0119094,tt9999999",
+]
+TITLE_PRINCIPALS = [
+    "tconst\tordering\tnconst\tcategory\tjob\tcharacters",
+    "tt0477051\t1\tnm0000552\tactor\t\\N\t[\"Norbit\",\"Rasputia\",\"Mr. Wong\"]",
+    "tt0477051\t2\tnm0005367\tdirector\t\\N\t\\N",
+    "tt0119094\t1\tnm0000115\tactor\t\\N\t[\"Castor Troy\"]",
+]
+# fmt: on
+
+
+class TestDataset(unittest.TestCase):
+    """Test cases for the offline dataset backend, built from tiny dumps."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        for name, lines in [("title.basics.tsv", TITLE_BASICS), ("title.ratings.tsv", TITLE_RATINGS),
+                            ("name.basics.tsv", NAME_BASICS)]:  # fmt: skip
+            with open(os.path.join(cls.directory.name, name), "w", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        with gzip.open(os.path.join(cls.directory.name, "title.principals.tsv.gz"), "wt", encoding="utf-8") as file:
+            file.write("\n".join(TITLE_PRINCIPALS) + "\n")
+        cls.database = os.path.join(cls.directory.name, "imdb.sqlite")
+        cls.counts = Dataset.ingest(cls.directory.name, cls.database)
+        cls.api = IMDbAPI("Dataset", cls.database)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_ingest(self):
+        self.assertEqual(
+            self.counts,
+            {"title.basics": 3, "title.ratings": 2, "name.basics": 2, "title.principals": 3},
+        )
+        with self.assertRaises(ValueError):
+            Dataset.ingest(os.path.join(self.directory.name, "missing"), self.database)
+        with self.assertRaises(ValueError):
+            Dataset.connect(os.path.join(self.directory.name, "missing.sqlite"))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            self.api.getMovie(6.4)  # type: ignore
+        with self.assertRaises(ValueError):
+            self.api.getMovie("a")
+        with self.assertRaises(NotImplementedError):
+            self.api.getMovie("tt0477051", "akas")
+        with self.assertRaises(NotFound):
+            self.api.getMovie("tt0000001")
+        with self.assertRaises(NotFound):
+            self.api.getPerson(1)
+
+    def test_movie(self):
+        movie = self.api.getMovie(477051)
+        self.assertEqual(
+            movie,
+            {"id": "tt0477051", "type": "movie", "primary_title": "Norbit", "original_title": "Norbit",
+             "start_year": 2007, "runtime_minutes": 102, "is_adult": False, "genres": ["Comedy", "Romance"],
+             "rating": {"aggregate_rating": 4.2, "votes_count": 84384}},
+        )  # fmt: skip
+        movie = self.api.updateMovie(movie, "credits")
+        self.assertEqual(
+            movie["credits"],
+            [{"name": {"id": "nm0000552", "display_name": "Eddie Murphy"}, "category": "ACTOR",
+              "characters": ["Norbit", "Rasputia", "Mr. Wong"]},
+             {"name": {"id": "nm0005367"}, "category": "DIRECTOR"}],
+        )  # fmt: skip
+        self.assertEqual(self.api.getMovie("tt10000000")["primary_title"], "Norbit Returns")
+
+    def test_person(self):
+        person = self.api.getPerson("nm0000115")
+        self.assertEqual(person["birth_date"], {"year": 1964})
+        self.assertEqual(person["primary_professions"], ["actor", "producer", "director"])
+        person = self.api.updatePerson(person, "known_for")
+        self.assertEqual(len(person["known_for"]), 1)
+        self.assertEqual(person["known_for"][0]["title"]["primary_title"], "Face/Off")
+        self.assertEqual(person["known_for"][0]["characters"], ["Castor Troy"])
+
+    def test_search(self):
+        results = self.api.searchMovie("norbit")
+        self.assertEqual([r["id"] for r in results], ["tt0477051", "tt10000000"])
+        results = self.api.searchMovie("norbit", 2008, 1)
+        self.assertEqual([r["id"] for r in results], ["tt0477051"])
+        self.assertEqual(self.api.searchMovie('face"off')[0]["id"], "tt0119094")
+
+    def test_cli(self):
+        database = os.path.join(self.directory.name, "cli.sqlite")
+        self.assertEqual(main(["dataset", "ingest", self.directory.name, database]), 0)
+        self.assertTrue(os.path.isfile(database))
+
+
+if __name__ == "__main__":
+    unittest.main()
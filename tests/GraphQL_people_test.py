@@ -28,7 +28,7 @@ class TestPersonMethods(unittest.TestCase):
         with self.assertRaises(ValueError):
             GraphQL.getPerson(-1)
         with self.assertRaises(ValueError):
-            GraphQL.getPerson("nm12345678")
+            GraphQL.getPerson("nm01234567")
 
     @responses.activate
     def test_valid(self):
@@ -35,7 +35,7 @@ class TestPersonMethods(unittest.TestCase):
         with self.assertRaises(ValueError):
             Rest.getPerson(-1)
         with self.assertRaises(ValueError):
-            Rest.getPerson("nm12345678")
+            Rest.getPerson("nm01234567")
         with self.assertRaises(ValueError):
             Rest.updatePerson({}, "known_for")
         with self.assertRaises(ValueError):
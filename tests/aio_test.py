@@ -0,0 +1,85 @@
+import asyncio, responses, unittest
+from SimpleIMDbDev import GraphQL, Rest, transport
+from SimpleIMDbDev.aio import AsyncIMDbAPI
+from SimpleIMDbDev.cache import CACHE, NotFound
+
+GRAPHQL_NAME = (
+    '{"data": {"name": {"id": "nm0000552", "display_name": "Eddie Murphy",'
+    ' "alternate_names": [], "birth_year": 1961, "avatars": []}}}'
+)
+
+
+async def _collect(results) -> dict:
+    return {id: result async for id, result in results}
+
+
+class TestAsync(unittest.TestCase):
+    """Test cases for the asyncio interface and the HTTP/2 transport option.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            AsyncIMDbAPI(1)  # type: ignore
+        with self.assertRaises(ValueError):
+            AsyncIMDbAPI("Dataset")
+        with self.assertRaises(TypeError):
+            AsyncIMDbAPI().getMovies(["tt0477051"], "8")  # type: ignore
+        with self.assertRaises(ValueError):
+            AsyncIMDbAPI().getPeople(["nm0000552"], 0)
+        with self.assertRaises(TypeError):
+            asyncio.run(AsyncIMDbAPI().getMovie(6.4))  # type: ignore
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(AsyncIMDbAPI("GraphQL").getMovie("tt0477051", "credits"))
+        with self.assertRaises(TypeError):
+            transport.http2("yes")  # type: ignore
+
+    @unittest.skipIf(transport.httpx is not None, "httpx is installed")
+    def test_http2_requires_httpx(self):
+        with self.assertRaises(ImportError):
+            transport.http2()
+        self.assertIsNone(transport._HTTP2)
+
+    def test_httpx_arguments(self):
+        arguments = transport._httpx_arguments({"headers": {"Accept": "application/json"}, "data": b"{}"})
+        self.assertNotIn("Connection", arguments["headers"])
+        self.assertEqual(arguments["headers"]["Accept"], "application/json")
+        self.assertEqual(arguments["content"], b"{}")
+        with self.assertRaises(TypeError):
+            transport._httpx_arguments({"stream": True})
+
+    @responses.activate
+    def test_rest(self):
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/titles/tt0477051",
+            json={"id": "tt0477051", "primary_title": "Norbit"},
+        )
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0000404", status=404, json={})
+        api = AsyncIMDbAPI("Rest")
+        self.assertEqual(asyncio.run(api.getMovie("tt0477051"))["primary_title"], "Norbit")
+        self.assertEqual(asyncio.run(api.getMovie(477051))["primary_title"], "Norbit")
+        with self.assertRaises(NotFound):
+            asyncio.run(api.getMovie("tt0000404"))
+        with self.assertRaises(NotFound):
+            asyncio.run(api.getMovie("tt0000404"))
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(CACHE.stats()["hits"], 1)
+
+    @responses.activate
+    def test_graphql_many(self):
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=GRAPHQL_NAME)
+        results = asyncio.run(_collect(AsyncIMDbAPI("GraphQL").getPeople(["nm0000552", "bad"], 4)))
+        self.assertEqual(results["nm0000552"]["display_name"], "Eddie Murphy")
+        self.assertIsInstance(results["bad"], ValueError)
+        self.assertEqual(len(responses.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
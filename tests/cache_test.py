@@ -0,0 +1,241 @@
+import responses, threading, unittest
+from unittest import mock
+from requests.exceptions import HTTPError
+from SimpleIMDbDev import GraphQL, Rest
+from SimpleIMDbDev.cache import CACHE, CacheEntry, NotFound, ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the response cache.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        CACHE.ttl = 0
+
+    def tearDown(self):
+        CACHE.clear()
+        CACHE.ttl = 0
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            ResponseCache("60")  # type: ignore
+        with self.assertRaises(ValueError):
+            ResponseCache(-1)
+
+    def test_get_or_load(self):
+        cache = ResponseCache(ttl=60)
+        loads = []
+
+        def loader(entry):
+            loads.append(entry)
+            return CacheEntry({"id": "tt0477051"}, etag='"v1"')
+
+        self.assertEqual(cache.get_or_load("key", loader), {"id": "tt0477051"})
+        self.assertEqual(cache.get_or_load("key", loader), {"id": "tt0477051"})
+        self.assertEqual(loads, [None])
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+
+    @responses.activate
+    def test_revalidation(self):
+        """An expired entry is revalidated and a 304 refreshes it without a new body."""
+        CACHE.ttl = 60
+        tt0477051 = {"id": "tt0477051", "type": "movie", "primary_title": "Norbit"}
+        url = "https://rest.imdbapi.dev/v2/titles/tt0477051"
+        responses.add(
+            responses.GET,
+            url,
+            json=tt0477051,
+            status=200,
+            headers={"ETag": '"abc"', "Last-Modified": "Fri, 09 Feb 2007 00:00:00 GMT"},
+        )
+        self.assertEqual(Rest.getMovie("tt0477051"), tt0477051)
+
+        responses.replace(responses.GET, url, status=304)
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=10**10):
+            self.assertEqual(Rest.getMovie("tt0477051"), tt0477051)
+        conditional = responses.calls[-1].request.headers
+        self.assertEqual(conditional["If-None-Match"], '"abc"')
+        self.assertEqual(conditional["If-Modified-Since"], "Fri, 09 Feb 2007 00:00:00 GMT")
+
+        stats = CACHE.stats()
+        self.assertEqual(stats["revalidations"], 1)
+        self.assertEqual(stats["not_modified"], 1)
+        self.assertEqual(stats["revalidation_hit_rate"], 1.0)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_revalidation_changed(self):
+        """A full reply to a conditional request replaces the entry."""
+        CACHE.ttl = 60
+        url = "https://rest.imdbapi.dev/v2/names/nm0000115"
+        responses.add(
+            responses.GET, url, json={"id": "nm0000115", "display_name": "Nic"}, headers={"ETag": '"1"'}
+        )
+        Rest.getPerson("nm0000115")
+        nm0000115 = {"id": "nm0000115", "display_name": "Nicolas Cage"}
+        responses.replace(responses.GET, url, json=nm0000115, headers={"ETag": '"2"'})
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=10**10):
+            self.assertEqual(Rest.getPerson("nm0000115"), nm0000115)
+        self.assertEqual(CACHE.stats()["revalidation_hit_rate"], 0.0)
+
+    def test_stale_while_revalidate(self):
+        """A recently expired entry is served while the worker refreshes it."""
+        cache = ResponseCache(ttl=60, stale_while_revalidate=30)
+        versions = iter(["v1", "v2"])
+
+        def loader(entry):
+            return CacheEntry(next(versions))
+
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            self.assertEqual(cache.get_or_load("key", loader), "v1")
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1070):
+            self.assertEqual(cache.get_or_load("key", loader), "v1")
+            cache.wait_for_refreshes()
+            self.assertEqual(cache.get_or_load("key", loader), "v2")
+        stats = cache.stats()
+        self.assertEqual(stats["stale_hits"], 1)
+        self.assertEqual(stats["refreshes"], 1)
+
+    def test_max_staleness(self):
+        """An entry past the staleness limit is loaded on the request path."""
+        cache = ResponseCache(ttl=60, stale_while_revalidate=30)
+        versions = iter(["v1", "v2"])
+
+        def loader(entry):
+            return CacheEntry(next(versions))
+
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            cache.get_or_load("key", loader)
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1100):
+            self.assertEqual(cache.get_or_load("key", loader), "v2")
+        self.assertEqual(cache.stats()["stale_hits"], 0)
+
+    def test_refresh_ahead(self):
+        """Hot entries are refreshed before they expire, failed refreshes keep the entry."""
+        cache = ResponseCache(ttl=60, refresh_ahead=10, hot_hits=2)
+        loads = []
+
+        def loader(entry):
+            loads.append(entry)
+            if entry is not None:
+                raise ConnectionError("upstream down")
+            return CacheEntry("v1")
+
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            cache.get_or_load("key", loader)
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1055):
+            cache.get_or_load("key", loader)
+            self.assertEqual(len(loads), 1)
+            self.assertEqual(cache.get_or_load("key", loader), "v1")
+            cache.wait_for_refreshes()
+            self.assertEqual(cache.get_or_load("key", loader), "v1")
+        self.assertEqual(len(loads), 2)
+        self.assertEqual(cache.stats()["refresh_errors"], 1)
+
+    def test_refresh_queue_bounded(self):
+        """Refreshes beyond the queue size are dropped and the stale entry kept."""
+        cache = ResponseCache(ttl=60, stale_while_revalidate=30, max_refresh_queue=1)
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            for key in ["a", "b", "c"]:
+                cache.get_or_load(key, lambda entry: CacheEntry("old"))
+        started, release = threading.Event(), threading.Event()
+
+        def slow(entry):
+            started.set()
+            release.wait(5)
+            return CacheEntry("new")
+
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1070):
+            cache.get_or_load("a", slow)
+            started.wait(5)
+            cache.get_or_load("b", slow)
+            self.assertEqual(cache.get_or_load("c", slow), "old")
+            release.set()
+            cache.wait_for_refreshes()
+        self.assertEqual(cache.stats()["refresh_dropped"], 1)
+
+    @responses.activate
+    def test_negative_rest(self):
+        """Missing IDs are answered from the cache after the first lookup."""
+        responses.add(
+            responses.GET, "https://rest.imdbapi.dev/v2/titles/tt9999999", json={}, status=404
+        )
+        responses.add(
+            responses.GET, "https://rest.imdbapi.dev/v2/names/nm9999999", json={"id": "nm9999999"}
+        )
+        for _ in range(3):
+            with self.assertRaises(NotFound):
+                Rest.getMovie("tt9999999")
+            with self.assertRaises(HTTPError):
+                Rest.getPerson("nm9999999")
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(CACHE.stats()["negative_hits"], 4)
+
+    @responses.activate
+    def test_negative_graphql(self):
+        responses.add(
+            responses.POST,
+            "https://graph.imdbapi.dev/v1",
+            json={"errors": [{"message": "NOT_FOUND", "path": ["title"]}], "data": {"title": None}},
+        )
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                GraphQL.getMovie("tt9999999")
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_graphql_errors_not_cached(self):
+        """Errors other than a missing ID are raised as ValueError and not cached."""
+        responses.add(
+            responses.POST,
+            "https://graph.imdbapi.dev/v1",
+            json={
+                "errors": [{"message": "Too many requests", "extensions": {"code": "RATE_LIMITED"}}],
+                "data": {"title": None},
+            },
+        )
+        for _ in range(2):
+            with self.assertRaises(ValueError) as context:
+                GraphQL.getMovie("tt9999999")
+            self.assertNotIsInstance(context.exception, NotFound)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(CACHE.stats()["negative_hits"], 0)
+        responses.replace(
+            responses.POST,
+            "https://graph.imdbapi.dev/v1",
+            json={"errors": [{"message": "missing", "extensions": {"code": "NOT_FOUND"}}], "data": {"title": None}},
+        )
+        with self.assertRaises(NotFound):
+            GraphQL.getMovie("tt9999999")
+
+    def test_negative_ttl(self):
+        """Negative entries expire on their own ttl and are not served stale."""
+        cache = ResponseCache(ttl=3600, stale_while_revalidate=3600, negative_ttl=10)
+        calls = []
+
+        def loader(entry):
+            calls.append(entry)
+            raise NotFound("tt9999999 not found.")
+
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            for _ in range(2):
+                with self.assertRaises(NotFound):
+                    cache.get_or_load("key", loader)
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1011):
+            with self.assertRaises(NotFound):
+                cache.get_or_load("key", loader)
+        self.assertEqual(calls, [None, None])
+
+        disabled = ResponseCache(negative_ttl=0)
+        with self.assertRaises(NotFound):
+            disabled.get_or_load("key", loader)
+        self.assertNotIn("key", disabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
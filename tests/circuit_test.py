@@ -0,0 +1,108 @@
+import responses, time, unittest
+from requests.exceptions import HTTPError
+from SimpleIMDbDev import IMDbAPI, Rest, transport
+from SimpleIMDbDev.cache import CACHE, StaleResult, served_stale
+from SimpleIMDbDev.transport import CircuitBreaker, CircuitOpen
+
+URL = f"{Rest.BASE_URL}/v2/titles/tt0477051"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the circuit breakers and the stale cache fallback.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        self.ttl = CACHE.ttl
+
+    def tearDown(self):
+        transport.breakers(0)
+        CACHE.ttl = self.ttl
+        CACHE.stale_if_open = True
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            CircuitBreaker("5")  # type: ignore
+        with self.assertRaises(TypeError):
+            transport.breakers(cooldown="30")  # type: ignore
+        with self.assertRaises(ValueError):
+            transport.breakers(-1)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(probes=0)
+
+    def test_states(self):
+        breaker = CircuitBreaker(failures=2, cooldown=0.05)
+        for _ in range(2):
+            breaker.record(True, breaker.allow())
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpen) as context:
+            breaker.allow("rest.titles")
+        self.assertLessEqual(context.exception.retry_after, 0.05)
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, "half_open")
+        probe = breaker.allow()
+        self.assertTrue(probe)
+        # One probe at a time.
+        with self.assertRaises(CircuitOpen):
+            breaker.allow()
+        breaker.record(False, probe)
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.stats()["opened"], 1)
+        self.assertEqual(breaker.stats()["rejected"], 2)
+
+    def test_failed_probe(self):
+        breaker = CircuitBreaker(failures=1, cooldown=0.01)
+        breaker.record(True, breaker.allow())
+        time.sleep(0.02)
+        breaker.record(True, breaker.allow())
+        self.assertEqual(breaker.state, "open")
+        # Replies that are not upstream failures do not count.
+        breaker = CircuitBreaker(failures=1)
+        breaker.record(None, breaker.allow())
+        self.assertEqual(breaker.state, "closed")
+
+    @responses.activate
+    def test_fail_fast(self):
+        responses.add(responses.GET, URL, status=503, json={})
+        transport.breakers(failures=2, cooldown=60)
+        api = IMDbAPI("Rest")
+        for _ in range(2):
+            with self.assertRaises(HTTPError):
+                api.getMovie("tt0477051")
+        with self.assertRaises(CircuitOpen):
+            api.getMovie("tt0477051")
+        self.assertEqual(len(responses.calls), 2)
+        stats = api.circuitStats()["rest.titles"]
+        self.assertEqual((stats["state"], stats["failures"], stats["rejected"]), ("open", 2, 1))
+
+    @responses.activate
+    def test_stale_fallback(self):
+        responses.add(responses.GET, URL, json={"id": "tt0477051", "primary_title": "Norbit"})
+        CACHE.ttl = 0.01
+        api = IMDbAPI("Rest")
+        self.assertNotIsInstance(api.getMovie("tt0477051"), StaleResult)
+        time.sleep(0.02)
+        responses.replace(responses.GET, URL, status=500, json={})
+        transport.breakers(failures=1, cooldown=60)
+        with self.assertRaises(HTTPError):
+            api.getMovie("tt0477051")
+        movie = api.getMovie("tt0477051")
+        self.assertIsInstance(movie, StaleResult)
+        self.assertTrue(movie.stale)
+        self.assertGreater(movie.age, 0)
+        self.assertIsInstance(movie.error, CircuitOpen)
+        self.assertEqual(movie["primary_title"], "Norbit")
+        self.assertEqual(CACHE.stats()["stale_fallbacks"], 1)
+        with served_stale() as stale:
+            Rest.getMovie("tt0477051")
+        self.assertEqual(stale[0][0], URL)
+        CACHE.stale_if_open = False
+        with self.assertRaises(CircuitOpen):
+            api.getMovie("tt0477051")
+        self.assertEqual(len(responses.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
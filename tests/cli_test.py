@@ -0,0 +1,115 @@
+import csv, json, os, responses, tempfile, time, unittest
+from SimpleIMDbDev import IMDbAPI, transport
+from SimpleIMDbDev.cache import CACHE, NotFound
+from SimpleIMDbDev.cli import main
+
+
+class TestCLI(unittest.TestCase):
+    """Test cases for the bulk lookups and the command line interface.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.ids = os.path.join(self.directory.name, "ids.txt")
+        with open(self.ids, "w") as file:
+            file.write("# titles\ntt0477051\n\ntt0120812\ntt9999999\n")
+        responses.start()
+        for id, title in [("tt0477051", "Norbit"), ("tt0120812", "Rush Hour")]:
+            responses.add(
+                responses.GET,
+                f"https://rest.imdbapi.dev/v2/titles/{id}",
+                json={"id": id, "primary_title": title, "genres": ["Comedy"]},
+            )
+        responses.add(responses.GET, "https://rest.imdbapi.dev/v2/titles/tt9999999", status=404)
+
+    def tearDown(self):
+        responses.stop()
+        responses.reset()
+        CACHE.clear()
+        transport.limit(0)
+        self.directory.cleanup()
+
+    def read_jsonl(self, path):
+        with open(path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            IMDbAPI().getMovies(["tt0477051"], workers="8")  # type: ignore
+        with self.assertRaises(ValueError):
+            IMDbAPI().getMovies(["tt0477051"], workers=0)
+        with self.assertRaises(ValueError):
+            transport.limit(-1)
+
+    def test_get_movies(self):
+        results = dict(IMDbAPI().getMovies(["tt0477051", "tt0120812", "tt9999999", "abc"], workers=2))
+        self.assertEqual(results["tt0477051"]["primary_title"], "Norbit")
+        self.assertEqual(results["tt0120812"]["primary_title"], "Rush Hour")
+        self.assertIsInstance(results["tt9999999"], NotFound)
+        self.assertIsInstance(results["abc"], ValueError)
+
+    def test_rate_limit(self):
+        limiter = transport.RateLimiter(100, burst=2)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
+
+    def test_get(self):
+        output = os.path.join(self.directory.name, "movies.jsonl")
+        cache = os.path.join(self.directory.name, "cache.jsonl")
+        arguments = ["get", "movie", self.ids, "-o", output, "--cache", cache, "--rate", "1000", "-q"]
+        self.assertEqual(main(arguments), 1)
+        rows = self.read_jsonl(output)
+        self.assertEqual(sorted(row["primary_title"] for row in rows), ["Norbit", "Rush Hour"])
+        self.assertEqual(len(self.read_jsonl(cache)), 2)
+
+        CACHE.clear()
+        self.assertEqual(main(arguments), 1)
+        self.assertEqual(len(responses.calls), 4)
+
+    def test_csv(self):
+        output = os.path.join(self.directory.name, "movies.csv")
+        main(["get", "movie", self.ids, "-o", output, "-q"])
+        with open(output, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(json.loads(rows[0]["genres"]), ["Comedy"])
+
+    def test_enrich(self):
+        source = os.path.join(self.directory.name, "rows.csv")
+        with open(source, "w", newline="") as file:
+            file.write("tconst,seen\ntt0477051,yes\n")
+        output = os.path.join(self.directory.name, "enriched.jsonl")
+        self.assertEqual(main(["enrich", source, "--column", "tconst", "-o", output, "-q"]), 0)
+        self.assertEqual(
+            self.read_jsonl(output)[0],
+            {"tconst": "tt0477051", "seen": "yes", "imdb_id": "tt0477051",
+             "imdb_primary_title": "Norbit", "imdb_genres": ["Comedy"]},
+        )
+
+    def test_search(self):
+        responses.add(
+            responses.GET,
+            "https://rest.imdbapi.dev/v2/search/titles",
+            json={"titles": [{"id": "tt0477051", "primary_title": "Norbit", "start_year": 2007},
+                             {"id": "tt0000001", "primary_title": "Norbit", "start_year": 1990}]},
+        )
+        queries = os.path.join(self.directory.name, "queries.txt")
+        with open(queries, "w") as file:
+            file.write("Norbit\t2007\n")
+        output = os.path.join(self.directory.name, "search.jsonl")
+        self.assertEqual(main(["search", queries, "-o", output, "-q"]), 0)
+        self.assertEqual(self.read_jsonl(output), [
+            {"query": "Norbit\t2007", "id": "tt0477051", "primary_title": "Norbit", "start_year": 2007}
+        ])
+
+    def test_parquet_requires_file(self):
+        with self.assertRaises(ValueError):
+            main(["get", "movie", self.ids, "--format", "parquet", "-q"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os, responses, tempfile, unittest
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.cli import main
+
+try:
+    import pyarrow, pyarrow.parquet
+    from SimpleIMDbDev import columnar
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestColumnar(unittest.TestCase):
+    """Test cases for the columnar export.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    titles = [
+        {"id": "tt0477051", "type": "movie", "primary_title": "Norbit", "genres": ["Comedy", "Romance"],
+         "rating": {"aggregate_rating": 4.2, "votes_count": 84384}, "start_year": 2007, "runtime_minutes": 102,
+         "credits": [{"name": {"id": "nm0000552", "display_name": "Eddie Murphy"}, "category": "ACTOR",
+                      "characters": ["Norbit"]}]},
+        {"id": "tt0120812", "type": "movie", "primary_title": "Rush Hour", "genres": ["Comedy"], "unknown": 1},
+    ]
+
+    def setUp(self):
+        CACHE.clear()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        CACHE.clear()
+        self.directory.cleanup()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(ValueError):
+            columnar.title_schema("Soap")
+        with self.assertRaises(ValueError):
+            columnar.ColumnarWriter(batch_size=0)
+        with self.assertRaises(TypeError):
+            columnar.ColumnarWriter().write(["tt0477051"])  # type: ignore
+
+    def test_schema(self):
+        schema = columnar.title_schema("GraphQL")
+        self.assertEqual(schema.field("start_year").type, pyarrow.int64())
+        self.assertEqual(schema.field("type").type, pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))
+        self.assertEqual(schema.field("genres").type.value_type, schema.field("type").type)
+        credit = schema.field("credits").type.value_type
+        self.assertNotIn("known_for", [field.name for field in credit.field("name").type])
+        self.assertIn("akas", columnar.title_schema("Rest").names)
+
+    def test_table(self):
+        table = columnar.to_table(self.titles, "Rest")
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column("primary_title").to_pylist(), ["Norbit", "Rush Hour"])
+        self.assertEqual(table.column("genres").to_pylist(), [["Comedy", "Romance"], ["Comedy"]])
+        self.assertEqual(table.column("credits")[0][0]["name"]["display_name"].as_py(), "Eddie Murphy")
+        arrays = columnar.to_numpy(table)
+        self.assertEqual(arrays["rating.votes_count"][0], 84384)
+        self.assertNotEqual(arrays["runtime_minutes"][1], arrays["runtime_minutes"][1])
+
+    def test_parquet_batches(self):
+        path = os.path.join(self.directory.name, "titles.parquet")
+        with columnar.ColumnarWriter(path, "Rest", batch_size=1) as writer:
+            self.assertEqual(writer.extend(self.titles), 2)
+        parquet = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        self.assertEqual(parquet.read().column("start_year").to_pylist(), [2007, None])
+        table = pyarrow.parquet.read_table(path, read_dictionary=["genres.list.element"])
+        self.assertEqual(table.column("genres").to_pylist(), [["Comedy", "Romance"], ["Comedy"]])
+
+    @responses.activate
+    def test_cli(self):
+        responses.add(
+            responses.GET, "https://rest.imdbapi.dev/v2/titles/tt0477051", json=self.titles[0]
+        )
+        ids = os.path.join(self.directory.name, "ids.txt")
+        with open(ids, "w") as file:
+            file.write("tt0477051\n")
+        path = os.path.join(self.directory.name, "titles.parquet")
+        self.assertEqual(main(["get", "movie", ids, "-o", path, "-q"]), 0)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.schema.names, columnar.title_schema("Rest").names)
+        self.assertEqual(table.column("rating").to_pylist()[0]["aggregate_rating"], 4.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
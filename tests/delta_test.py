@@ -0,0 +1,97 @@
+import os, responses, tempfile, unittest
+from SimpleIMDbDev import IMDbAPI, Rest
+from SimpleIMDbDev.cache import CACHE, NotFound
+from SimpleIMDbDev.delta import DeltaStore, content_hash, diff, sync
+
+
+def _add_title(id, votes, status=200):
+    body = {"id": id, "primary_title": "Norbit", "rating": {"aggregate_rating": 4.1, "votes_count": votes}}
+    responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/{id}", json=body if status == 200 else {}, status=status)
+
+
+class TestDeltaSync(unittest.TestCase):
+    """Test cases for the delta sync of changed records.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            DeltaStore(1)  # type: ignore
+        with self.assertRaises(TypeError):
+            IMDbAPI("Rest").syncMovies(["tt0477051"], {})  # type: ignore
+        with self.assertRaises(ValueError):
+            IMDbAPI("Rest").syncMovies(["tt0477051"], DeltaStore(), workers=0)
+
+    def test_content_hash(self):
+        self.assertEqual(content_hash({"a": 1, "b": [1, 2]}), content_hash({"b": [1, 2], "a": 1}))
+        self.assertNotEqual(content_hash({"a": 1}), content_hash({"a": 2}))
+        self.assertNotEqual(content_hash({"a": 1}), content_hash({"a": 1.0}))
+
+    def test_diff(self):
+        old = {"id": "tt0477051", "rating": {"votes_count": 1}, "genres": ["Comedy"], "a/b": 1, "gone": None}
+        new = {"id": "tt0477051", "rating": {"votes_count": 2}, "genres": ["Comedy", "Romance"], "a/b": 2, "new": 0}
+        self.assertEqual(
+            diff(old, new),
+            [
+                {"op": "replace", "path": "/rating/votes_count", "value": 2},
+                {"op": "replace", "path": "/genres", "value": ["Comedy", "Romance"]},
+                {"op": "replace", "path": "/a~1b", "value": 2},
+                {"op": "remove", "path": "/gone"},
+                {"op": "add", "path": "/new", "value": 0},
+            ],
+        )
+        self.assertEqual(diff(old, dict(old)), [])
+        self.assertEqual(diff([1, 2], [1, 3]), [{"op": "replace", "path": "/1", "value": 3}])
+
+    @responses.activate
+    def test_sync(self):
+        api = IMDbAPI("Rest")
+        store = DeltaStore()
+        _add_title("tt0477051", 1000)
+        _add_title("tt0119094", 500)
+        changes = {change.id: change for change in api.syncMovies(["tt0477051", "119094"], store, workers=2)}
+        self.assertEqual({change.kind for change in changes.values()}, {"added"})
+        self.assertEqual(sorted(changes), ["tt0119094", "tt0477051"])
+        self.assertEqual(len(store), 2)
+
+        # Nothing changed, nothing is emitted.
+        CACHE.clear()
+        self.assertEqual(list(api.syncMovies(["tt0477051", "tt0119094"], store)), [])
+        self.assertEqual(store.stats["unchanged"], 2)
+
+        # Only the vote count changed.
+        CACHE.clear()
+        responses.replace(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", json={
+            "id": "tt0477051", "primary_title": "Norbit", "rating": {"aggregate_rating": 4.1, "votes_count": 1001}
+        })
+        responses.replace(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0119094", json={}, status=404)
+        changes = {change.id: change for change in api.syncMovies(["tt0477051", "tt0119094"], store)}
+        self.assertEqual(changes["tt0477051"].kind, "changed")
+        self.assertEqual(
+            changes["tt0477051"].patch, [{"op": "replace", "path": "/rating/votes_count", "value": 1001}]
+        )
+        self.assertEqual(changes["tt0119094"].kind, "removed")
+        self.assertEqual(changes["tt0119094"].patch, [])
+        self.assertIsNone(changes["tt0119094"].record)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.get("tt0477051")["rating"]["votes_count"], 1001)
+
+    def test_errors_and_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "delta.sqlite")
+            results = [("tt0477051", {"id": "tt0477051"}), ("tt0000001", NotFound()), ("tt0000002", OSError())]
+            changes = list(sync(results, path, "tt"))
+            self.assertEqual([change.kind for change in changes], ["added", "error"])
+            with DeltaStore(path) as store:
+                self.assertIn("tt0477051", store)
+                self.assertNotIn("tt0000001", store)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os, responses, tempfile, unittest
+from SimpleIMDbDev import IMDbAPI, Rest, transport
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.graph import BloomFilter, Crawler, Edge, Node
+from SimpleIMDbDev.scheduler import priority
+
+# tt0477051 credits nm0000552 and nm0000115, both known for tt0477051 and tt0119094.
+CREDITS = {
+    "tt0477051": ["nm0000552", "nm0000115"],
+    "tt0119094": ["nm0000115"],
+}
+KNOWN_FOR = {
+    "nm0000552": ["tt0477051"],
+    "nm0000115": ["tt0477051", "tt0119094"],
+}
+
+
+def _add_graph():
+    for title, names in CREDITS.items():
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/{title}", json={"id": title})
+        credits = [{"name": {"id": name}, "category": "ACTOR", "characters": ["Norbit"]} for name in names]
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/{title}/credits", json={"credits": credits})
+    for name, titles in KNOWN_FOR.items():
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/names/{name}", json={"id": name, "display_name": name})
+        known_for = [{"title": {"id": title}, "category": "ACTOR"} for title in titles]
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/names/{name}/known_for", json={"known_for": known_for})
+
+
+class TestGraphCrawler(unittest.TestCase):
+    """Test cases for the breadth-first graph crawler.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            Crawler("tt0477051")
+        with self.assertRaises(ValueError):
+            Crawler(["xx0477051"])
+        with self.assertRaises(ValueError):
+            Crawler(["tt0477051"], max_depth=-1)
+        with self.assertRaises(TypeError):
+            BloomFilter(100, 1)  # type: ignore
+
+    @responses.activate
+    def test_breadth_first(self):
+        _add_graph()
+        items = list(IMDbAPI("Rest").crawl(["tt0477051"], max_depth=2, workers=2))
+        nodes = [item for item in items if isinstance(item, Node)]
+        edges = [item for item in items if isinstance(item, Edge)]
+        self.assertEqual(
+            sorted((node.id, node.depth) for node in nodes),
+            [("nm0000115", 1), ("nm0000552", 1), ("tt0119094", 2), ("tt0477051", 0)],
+        )
+        self.assertIn(Edge("tt0477051", "nm0000552", "credit", {"category": "ACTOR", "characters": ["Norbit"]}), edges)
+        # The leaf tt0119094 has no links fetched.
+        self.assertEqual(len(edges), 2 + 1 + 2)
+        self.assertNotIn(f"{Rest.BASE_URL}/v2/titles/tt0119094/credits", [call.request.url for call in responses.calls])
+
+    @responses.activate
+    def test_priority(self):
+        """The fetches on the pool are sent as the caller's priority class."""
+        _add_graph()
+        transport.schedule(concurrency=2)
+        try:
+            with priority("bulk"):
+                list(Crawler(["tt0477051"], max_depth=2, workers=2))
+            stats = IMDbAPI("Rest").schedulerStats()
+        finally:
+            transport.schedule(0)
+        self.assertEqual(stats["bulk"]["requests"], 7)
+        self.assertEqual(stats["default"]["requests"], 0)
+        crawler = Crawler(api=IMDbAPI("GraphQL", priority="bulk"))
+        self.assertEqual(crawler._links_api._priority, "bulk")
+
+    @responses.activate
+    def test_checkpoint(self):
+        _add_graph()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "crawl.json")
+        for bloom in [0, 1000]:
+            CACHE.clear()
+            crawler = Crawler(["tt0477051"], max_depth=2, workers=1, bloom=bloom)
+            run = iter(crawler)
+            first = next(run)
+            self.assertEqual(first, Node("tt0477051", 0, {"id": "tt0477051"}))
+            run.close()
+            crawler.save(path)
+            # The node being yielded when the run stopped is fetched again.
+            resumed = Crawler.load(path)
+            ids = sorted(item.id for item in resumed if isinstance(item, Node))
+            self.assertEqual(ids, ["nm0000115", "nm0000552", "tt0119094", "tt0477051"])
+            self.assertEqual(resumed.stats["nodes"], 5)
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(1000, 0.01)
+        for value in range(0, 2000, 2):
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in range(0, 2000, 2)))
+        false_positives = sum(value in bloom for value in range(1, 20000, 2))
+        self.assertLess(false_positives, 10000 * 0.03)
+        self.assertEqual(len(bloom), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
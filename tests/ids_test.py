@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+from SimpleIMDbDev import ids
+
+
+class TestIds(unittest.TestCase):
+    """Test cases for the parsing and packing of IDs."""
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            ids.parse_id(6.4, "tt")  # type: ignore
+        with self.assertRaises(TypeError):
+            ids.normalize_id(None, "nm")  # type: ignore
+        with self.assertRaises(TypeError):
+            ids.pack(477051)  # type: ignore
+        with self.assertRaises(TypeError):
+            ids.pack_many(["tt0477051", 6.4], "tt")  # type: ignore
+
+    def test_invalid_value(self):
+        """Test for correct types with invalid values for arguments."""
+        for id in ["a", "tt04770510", "nm0477051", "tt", "tt12a4567", "tt" + "1" * 19, "tt٣٤٥"]:
+            with self.assertRaises(ValueError):
+                ids.parse_id(id, "tt")
+        with self.assertRaises(ValueError):
+            ids.pack("xx0477051")
+        with self.assertRaises(ValueError):
+            ids.pack_many(["tt0477051", "nm0000552"], "tt")
+        with self.assertRaises(ValueError):
+            ids.pack_many(["tt0477051", "0477051"])
+
+    def test_normalize(self):
+        self.assertEqual(ids.normalize_id(477051, "tt"), "tt0477051")
+        self.assertEqual(ids.normalize_id("tt477051", "tt"), "tt0477051")
+        self.assertEqual(ids.normalize_id("nm0000552", "nm"), "nm0000552")
+        self.assertEqual(ids.normalize_id("tt10000000", "tt"), "tt10000000")
+
+    def test_pack(self):
+        for id in ["tt0477051", "nm0000552", "tt10000000", "nm12345678"]:
+            self.assertEqual(ids.unpack(ids.pack(id)), id)
+        self.assertNotEqual(ids.pack("tt0000552"), ids.pack("nm0000552"))
+
+    def test_pack_many(self):
+        column = ["tt0477051", "nm0000552", "tt10000000", "tt0000001"]
+        expected = [ids.pack(id) for id in column]
+        packed = ids.pack_many(column)
+        self.assertEqual([int(value) for value in packed], expected)
+        self.assertEqual(ids.unpack_many(packed), column)
+        self.assertEqual(list(ids.pack_many(["477051", 552], "nm")), [ids.pack("nm0477051"), ids.pack("nm0000552")])
+        with mock.patch.object(ids, "numpy", None):
+            packed = ids.pack_many(iter(column))
+            self.assertEqual(packed.typecode, "I")
+            self.assertEqual(list(packed), expected)
+            self.assertEqual(ids.unpack_many(packed), column)
+            self.assertEqual(ids.pack_many(["tt999999999999"]).typecode, "Q")
+
+    def test_too_long(self):
+        """The batch and scalar paths reject the same IDs past `MAX_DIGITS` digits."""
+        for id, prefix in [("9" * 19, "tt"), ("9" * 20, "tt"), ("tt" + "9" * 19, ""), ("nm" + "1" * 19, "nm")]:
+            with self.assertRaises(ValueError):
+                ids.parse_id(id, prefix or id[:2])
+            with self.assertRaises(ValueError):
+                ids.pack_many([id], prefix)
+            with mock.patch.object(ids, "numpy", None), self.assertRaises(ValueError):
+                ids.pack_many([id], prefix)
+        self.assertEqual(ids.unpack_many(ids.pack_many(["9" * 18], "tt")), ["tt" + "9" * 18])
+
+    def test_wide_ids(self):
+        column = ["tt999999999999", "nm0000552"]
+        packed = ids.pack_many(column)
+        self.assertEqual(ids.unpack_many(packed), column)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import gzip, json, responses, unittest
+from SimpleIMDbDev import IMDbAPI, Rest, jsonstream
+from SimpleIMDbDev.cache import NotFound
+
+CREDIT = {"name": {"id": "nm0000552", "display_name": "Eddie Murphy"}, "category": "ACTOR", "characters": ["Norbit", "Ünïcödé"]}
+DOCUMENT = {"credits": [dict(CREDIT, index=index, rating=index / 4) for index in range(300)], "next_page_token": "abc"}
+BODY = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+def _chunked(body: bytes, size: int):
+    return (body[start : start + size] for start in range(0, len(body), size))
+
+
+class TestJsonStream(unittest.TestCase):
+    """Test cases for the incremental parsing of subselections.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            jsonstream.items([b"{}"], 1)  # type: ignore
+        with self.assertRaises(TypeError):
+            Rest.streamMovie(6.4, "credits")  # type: ignore
+        with self.assertRaises(TypeError):
+            Rest.streamMovie("tt0477051", "credits", pages=1)  # type: ignore
+        with self.assertRaises(ValueError):
+            Rest.streamMovie("tt0477051", "")
+        with self.assertRaises(ValueError):
+            Rest.streamMovie("tt0477051", "known_for")
+        with self.assertRaises(NotImplementedError):
+            IMDbAPI("GraphQL").streamMovie("tt0477051", "credits")
+
+    def test_chunks(self):
+        """Chunks splitting tokens and multi-byte characters."""
+        for size in [3, 7, 4096, len(BODY)]:
+            stream = jsonstream.items(_chunked(BODY, size), "credits")
+            self.assertEqual(list(stream), DOCUMENT["credits"])
+            self.assertEqual(stream.fields["next_page_token"], "abc")
+
+    def test_incremental(self):
+        """The first record is produced before the rest of the body is read."""
+        read = []
+
+        def chunks():
+            for chunk in _chunked(BODY, 512):
+                read.append(len(chunk))
+                yield chunk
+
+        first = next(iter(jsonstream.items(chunks(), "credits")))
+        self.assertEqual(first["index"], 0)
+        self.assertLess(sum(read), 1024)
+
+    def test_invalid_documents(self):
+        for body in [b'{"credits": [1, 2', b'["credits"]', b'{"credits": [1 2]}', b""]:
+            with self.assertRaises(ValueError):
+                list(jsonstream.items([body], "credits"))
+        self.assertEqual(list(jsonstream.items([b'{"credits": []}'], "credits")), [])
+        self.assertEqual(list(jsonstream.items([b"{}"], "credits")), [])
+        numbers = jsonstream.items([b'{"akas": [12', b"34, true, null]}"], "akas")
+        self.assertEqual(list(numbers), [1234, True, None])
+
+    @responses.activate
+    def test_stream_movie(self):
+        url = f"{Rest.BASE_URL}/v2/titles/tt0477051/credits"
+        responses.add(
+            responses.GET,
+            url,
+            body=gzip.compress(BODY),
+            headers={"Content-Encoding": "gzip"},
+            match=[responses.matchers.query_param_matcher({})],
+        )
+        responses.add(
+            responses.GET,
+            url,
+            json={"credits": [CREDIT]},
+            match=[responses.matchers.query_param_matcher({"page_token": "abc"})],
+        )
+        credits = list(IMDbAPI("Rest").streamMovie("tt0477051", "credits"))
+        self.assertEqual(len(credits), 301)
+        self.assertEqual(credits[-1], CREDIT)
+        self.assertEqual(len(list(Rest.streamMovie("tt0477051", "credits", pages=False))), 300)
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0000404/akas", status=404)
+        with self.assertRaises(NotFound):
+            list(Rest.streamMovie("tt0000404", "akas"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import subprocess, sys, unittest
+import SimpleIMDbDev
+from SimpleIMDbDev import GraphQL, constants
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test cases for the lazily loaded submodules and constants."""
+
+    def test_package_import(self):
+        """The parsers and `requests` are only imported on first use."""
+        check = "import sys, SimpleIMDbDev; print(sorted(m for m in ['requests', 'SimpleIMDbDev.Rest'] if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_cli_help(self):
+        """The command line interface starts without `requests` or `sqlite3`."""
+        check = (
+            "import sys\nfrom SimpleIMDbDev.cli import main\ntry:\n    main(['--help'])\nexcept SystemExit:\n    pass\n"
+            "print(sorted(m for m in ['requests', 'sqlite3'] if m in sys.modules), file=sys.stderr)"
+        )
+        result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stderr.strip(), "[]")
+
+    def test_attributes(self):
+        self.assertIs(SimpleIMDbDev.GraphQL, GraphQL)
+        self.assertTrue(issubclass(SimpleIMDbDev.NotFound, ValueError))
+        self.assertIs(GraphQL.IMDbGraphQLTypes["IMDbGraphQL.Title"], GraphQL.IMDbGraphQL.Title)
+        self.assertEqual(constants.BASE_HEADERS, constants.base_headers())
+        self.assertIn("SimpleIMDbDev (", constants.BASE_HEADERS["User-Agent"])
+        with self.assertRaises(AttributeError):
+            SimpleIMDbDev.Missing
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import responses, unittest
+from SimpleIMDbDev import IMDbAPI
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.metrics import METRICS, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the instrumentation.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        METRICS.reset()
+
+    def tearDown(self):
+        CACHE.clear()
+        METRICS.disable()
+        METRICS.reset()
+        METRICS._hooks.clear()
+
+    def test_disabled(self):
+        metrics = Metrics()
+        with metrics.timer("rest.titles", "decode"):
+            pass
+        metrics.count("rest.titles", "cache_hits")
+        self.assertEqual(metrics.snapshot(), {"counters": {}, "histograms": {}})
+        with self.assertRaises(TypeError):
+            metrics.add_hook("not callable")  # type: ignore
+
+    @responses.activate
+    def test_rest_phases(self):
+        responses.add(
+            responses.GET,
+            "https://rest.imdbapi.dev/v2/titles/tt0477051",
+            json={"id": "tt0477051", "primary_title": "Norbit"},
+        )
+        events = []
+        api = IMDbAPI()
+        api.instrument(hook=lambda endpoint, phase, seconds: events.append((endpoint, phase)))
+        api.getMovie("tt0477051")
+        api.getMovie("tt0477051")
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(
+            set(snapshot["histograms"]["rest.titles"]), {"headers", "transfer", "decode"}
+        )
+        self.assertEqual(snapshot["histograms"]["imdbapi"]["total"]["count"], 2)
+        self.assertEqual(snapshot["histograms"]["imdbapi"]["flatten"]["count"], 2)
+        self.assertEqual(
+            snapshot["counters"]["rest.titles"],
+            {"cache_misses": 1, "cache_hits": 1, "status_200": 1, "wire_bytes": 46, "decoded_bytes": 46},
+        )
+        self.assertIn(("rest.titles", "cache_hits"), events)
+
+        text = METRICS.to_prometheus()
+        self.assertIn("# TYPE simpleimdbdev_phase_seconds histogram", text)
+        self.assertIn(
+            'simpleimdbdev_phase_seconds_count{endpoint="imdbapi",phase="total"} 2', text
+        )
+        self.assertIn(
+            'simpleimdbdev_events_total{endpoint="rest.titles",event="cache_hits"} 1', text
+        )
+
+    def test_histogram_buckets(self):
+        metrics = Metrics()
+        metrics.enable()
+        for seconds in [0.0001, 0.002, 0.002, 30]:
+            metrics.observe("graphql.title", "validate", seconds)
+        histogram = metrics.snapshot()["histograms"]["graphql.title"]["validate"]
+        self.assertEqual(histogram["count"], 4)
+        self.assertEqual(histogram["buckets"][0.0005], 1)
+        self.assertEqual(histogram["buckets"][0.0025], 3)
+        self.assertEqual(histogram["buckets"][10.0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import responses, time, unittest
+from concurrent.futures import Future
+from SimpleIMDbDev import IMDbAPI, GraphQL
+from SimpleIMDbDev.cache import CACHE, NotFound
+
+BODY = '{"data": {"title": {"id": "tt0477051", "primary_title": "Norbit"}}}'
+
+
+class _Pool:
+    """Runs the submitted calls in this process, recording them. Shut down after `uses` calls, when given."""
+
+    def __init__(self, uses: int = -1):
+        self.calls = []
+        self.uses = uses
+
+    def submit(self, function, *args):
+        if len(self.calls) == self.uses:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        self.calls.append((function.__name__, args))
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class TestProcessPool(unittest.TestCase):
+    """Test cases for the bulk lookups building GraphQL objects in a process pool.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        self.settings = CACHE.ttl, CACHE.stale_while_revalidate
+
+    def tearDown(self):
+        CACHE.ttl, CACHE.stale_while_revalidate = self.settings
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            IMDbAPI("GraphQL").getMovies([], processes="2")  # type: ignore
+        with self.assertRaises(ValueError):
+            IMDbAPI("GraphQL").getPeople([], processes=-1)
+        with self.assertRaises(NotImplementedError):
+            IMDbAPI("Rest").getMovies([], processes=2)
+
+    @responses.activate
+    def test_matches_threads(self):
+        def reply(request):
+            query = request.body.decode()
+            if "tt0000404" in query:
+                return 200, {}, '{"errors": [{"message": "NOT_FOUND"}], "data": {"title": null}}'
+            id = "tt0477051" if "tt0477051" in query else "tt0120812"
+            body = (
+                '{"data": {"title": {"id": "%s", "primary_title": "Norbit", "genres": ["Comedy"],'
+                ' "rating": {"aggregate_rating": 4.2, "votes_count": 84384}}}}' % id
+            )
+            return 200, {}, body
+
+        responses.add_callback(responses.POST, GraphQL.API_ENDPOINT, callback=reply)
+        ids = ["tt0477051", "120812", "tt0000404", "bad"]
+        api = IMDbAPI("GraphQL")
+        pooled = dict(api.getMovies(ids, workers=2, processes=2))
+        self.assertEqual(len(responses.calls), 3)
+        self.assertIsInstance(pooled["tt0000404"], NotFound)
+        self.assertIsInstance(pooled["bad"], ValueError)
+        self.assertEqual(pooled["tt0477051"], api.getMovie("tt0477051"))
+
+        cached = dict(api.getMovies(ids[:3], workers=2, processes=1))
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(cached["120812"], pooled["120812"])
+        self.assertIsInstance(cached["tt0000404"], NotFound)
+
+    @responses.activate
+    def test_cached_text(self):
+        """A cache hit hands the pool the JSON text of the result, not a decoded dict."""
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=BODY)
+        pool = _Pool()
+        first = GraphQL._pooled(pool, "title", "tt0477051")
+        second = GraphQL._pooled(pool, "title", "tt0477051")
+        self.assertEqual(first, second)
+        self.assertEqual([name for name, _ in pool.calls], ["_decode_reply", "_build_text"])
+        self.assertIsInstance(pool.calls[1][1][1], str)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_refresh_after_shutdown(self):
+        """A background refresh queued by a pooled lookup decodes in this process once the pool is gone."""
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=BODY)
+        CACHE.ttl, CACHE.stale_while_revalidate = 0.01, 60
+        GraphQL._pooled(_Pool(), "title", "tt0477051")
+        time.sleep(0.02)
+        # The stale hit is built by the pool, which is then shut down, as `getMovies` does once done.
+        GraphQL._pooled(_Pool(uses=1), "title", "tt0477051")
+        CACHE.wait_for_refreshes()
+        stats = CACHE.stats()
+        self.assertEqual((stats["refreshes"], stats["refresh_errors"]), (1, 0))
+        self.assertEqual(len(responses.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
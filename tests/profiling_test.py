@@ -0,0 +1,67 @@
+import responses, tracemalloc, unittest
+from SimpleIMDbDev import GraphQL, IMDbAPI, transport
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.profiling import Profile
+
+
+class TestProfile(unittest.TestCase):
+    """Test cases for the profiling mode.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            IMDbAPI.profile("yes")  # type: ignore
+
+    @responses.activate
+    def test_graphql_stages(self):
+        responses.add(
+            responses.POST,
+            "https://graph.imdbapi.dev/v1",
+            json={"data": {"title": {
+                "id": "tt0477051", "type": "movie", "primary_title": "Norbit",
+                "genres": ["Comedy"], "credits": [
+                    {"name": {"id": "nm0000552", "display_name": "Eddie Murphy"}, "category": "actor"},
+                ],
+            }}},
+        )
+        request, check_kwargs = transport.request, GraphQL.check_kwargs
+        with IMDbAPI.profile() as profile:
+            IMDbAPI("GraphQL").getMovie("tt0477051")
+        self.assertIs(transport.request, request)
+        self.assertIs(GraphQL.check_kwargs, check_kwargs)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        stats = profile.stats
+        self.assertEqual(stats["SimpleIMDbDev.transport.request"]["calls"], 1)
+        self.assertGreater(stats["SimpleIMDbDev.GraphQL.get_attribute_main_query"]["calls"], 1)
+        self.assertGreater(stats["SimpleIMDbDev.GraphQL.check_kwargs"]["calls"], 1)
+        self.assertGreater(stats["SimpleIMDbDev.transport.request"]["wall"], 0)
+        self.assertLessEqual(stats["SimpleIMDbDev.transport.decode"]["wall"], profile.wall)
+        self.assertTrue(profile.top_allocations())
+        report = profile.report()
+        self.assertIn("SimpleIMDbDev.GraphQL.check_kwargs", report)
+        self.assertIn("Top allocations:", report)
+
+    def test_without_allocations(self):
+        with Profile(allocations=False) as profile:
+            GraphQL.get_attribute_main_query(GraphQL.IMDbGraphQL.Title.SCHEMA)
+        self.assertEqual(profile.stats["SimpleIMDbDev.GraphQL.get_attribute_main_query"]["memory"], 0)
+        self.assertEqual(profile.top_allocations(), [])
+        self.assertNotIn("Top allocations:", profile.report())
+
+    def test_not_nested(self):
+        with Profile(allocations=False):
+            with self.assertRaises(RuntimeError):
+                with Profile(allocations=False):
+                    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
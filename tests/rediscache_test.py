@@ -0,0 +1,105 @@
+import responses, time, unittest
+from SimpleIMDbDev import IMDbAPI, Rest
+from SimpleIMDbDev.cache import CACHE, CacheEntry, ResponseCache
+from SimpleIMDbDev.rediscache import RedisBackend, RedisError, StandInServer, _command
+
+
+class TestRedisBackend(unittest.TestCase):
+    """Test cases for the Redis protocol cache tier, against the in-memory stand-in server.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        self.server = StandInServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.backend = RedisBackend(port=self.server.port)
+        self.addCleanup(self.backend.close)
+        CACHE.clear()
+        CACHE.backend = self.backend
+
+    def tearDown(self):
+        CACHE.backend = None
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            RedisBackend(port="6379")  # type: ignore
+        with self.assertRaises(TypeError):
+            RedisBackend(timeout="1")  # type: ignore
+        with self.assertRaises(ValueError):
+            RedisBackend(max_connections=0)
+
+    def test_get_set(self):
+        self.assertIsNone(self.backend.get("key"))
+        self.backend.set("key", "value", 0)
+        self.backend.set("other", "välue", 60)
+        self.assertEqual(self.backend.get("key"), "value")
+        self.assertEqual(self.backend.get_many(["key", "missing", "other"]), ["value", None, "välue"])
+        self.assertEqual(self.backend.get_many([]), [])
+        self.backend.set("expired", "value", 0.001)
+        time.sleep(0.01)
+        self.assertEqual(self.backend.get_many(["expired"] * 2), [None, None])
+
+    def test_clear_keeps_other_prefixes(self):
+        other = RedisBackend(port=self.server.port, prefix="other:")
+        self.addCleanup(other.close)
+        self.backend.set("key", "value", 0)
+        other.set("key", "value", 0)
+        self.backend.clear()
+        self.assertIsNone(self.backend.get("key"))
+        self.assertEqual(other.get("key"), "value")
+
+    def test_error_reply(self):
+        with self.assertRaises(RedisError):
+            self.backend._checked(self.backend._execute([_command("NOSUCHCOMMAND")])[0])
+        # The connection stays usable after an error reply.
+        self.assertEqual(self.backend._execute([_command("PING")]), ["PONG"])
+
+    def test_get_many_is_pipelined(self):
+        keys = [f"key{n}" for n in range(600)]
+        for key in keys[::2]:
+            self.backend.set(key, key, 0)
+        commands = self.server.commands
+        records = self.backend.get_many(keys)
+        self.assertEqual(records[:4], ["key0", None, "key2", None])
+        self.assertEqual(self.server.commands - commands, 3)
+
+    @responses.activate
+    def test_two_tiers(self):
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/titles/tt0477051",
+            json={"id": "tt0477051", "primary_title": "Norbit"},
+        )
+        self.assertEqual(Rest.getMovie("tt0477051")["primary_title"], "Norbit")
+        # Another process, with an empty in-process tier, is served by the shared one.
+        other = ResponseCache(backend=self.backend)
+        value = other.get_or_load(Rest._key("title", "tt0477051"), lambda entry: self.fail("Not shared."))
+        self.assertEqual(value["primary_title"], "Norbit")
+        self.assertEqual(other.stats()["shared_hits"], 1)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_bulk_prefetch(self):
+        for id in ["tt0477051", "tt0120812"]:
+            responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/{id}", json={"id": id})
+        api = IMDbAPI("Rest")
+        dict(api.getMovies(["tt0477051", "tt0120812"]))
+        CACHE.clear()
+        results = dict(api.getMovies(["tt0477051", "120812", "bad"], workers=2))
+        self.assertEqual(results["120812"], {"id": "tt0120812"})
+        self.assertIsInstance(results["bad"], ValueError)
+        self.assertEqual(CACHE.stats()["prefetched"], 2)
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_unreachable_backend(self):
+        self.server.stop()
+        cache = ResponseCache(backend=RedisBackend(port=self.server.port, timeout=0.5))
+        self.assertEqual(cache.get_or_load("key", lambda entry: CacheEntry({"id": "tt0477051"})), {"id": "tt0477051"})
+        self.assertEqual(cache.prefetch(["other"]), 0)
+        self.assertEqual(cache.stats()["backend_errors"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
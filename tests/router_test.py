@@ -0,0 +1,162 @@
+import responses, unittest
+from requests.exceptions import HTTPError
+from SimpleIMDbDev import GraphQL, IMDbAPI, Rest, router
+from SimpleIMDbDev.cache import CACHE, NotFound
+from SimpleIMDbDev.router import ROUTER, Router, normalize
+
+REST_TITLE = {
+    "id": "tt0477051",
+    "type": "movie",
+    "primary_title": "Norbit",
+    "primary_image": {"url": "https://m.media-amazon.com/norbit.jpg", "width": 300, "height": 444},
+    "rating": {"aggregate_rating": 4.2, "votes_count": 84384},
+    "start_year": 2007,
+}
+GRAPHQL_TITLE = (
+    '{"data": {"title": {"id": "tt0477051", "type": "movie", "primary_title": "Norbit", "start_year": 2007,'
+    ' "rating": {"aggregate_rating": 4.2, "votes_count": 84384},'
+    ' "posters": [{"url": "https://m.media-amazon.com/norbit.jpg", "width": 300, "height": 444}]}}}'
+)
+
+
+class TestRouter(unittest.TestCase):
+    """Test cases for the `auto` parser routing between the APIs.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        ROUTER.reset()
+
+    def tearDown(self):
+        CACHE.clear()
+        ROUTER.reset()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(ValueError):
+            IMDbAPI("graph")
+        with self.assertRaises(TypeError):
+            IMDbAPI("auto").getMovie("tt0477051", fields="rating")
+        with self.assertRaises(NotImplementedError):
+            IMDbAPI("Rest").getMovie("tt0477051", fields=["rating"])
+
+    def test_normalize(self):
+        person = normalize(
+            "name",
+            "GraphQL",
+            {"id": "nm0000552", "alternate_names": ["Fred Braughton"], "birth_year": 1961, "avatars": []},
+        )
+        self.assertEqual(list(person), router.NAME_FIELDS)
+        self.assertEqual(person["alternative_names"], ["Fred Braughton"])
+        self.assertEqual(person["birth_date"], {"year": 1961})
+        self.assertIsNone(person["primary_image"])
+        self.assertIsNone(person["biography"])
+
+    def test_route(self):
+        test_router = Router()
+        self.assertEqual(test_router.route("title"), ["Rest", "GraphQL"])
+        self.assertEqual(test_router.route("title", "credits"), ["Rest"])
+        self.assertEqual(test_router.route("name", fields=["biography"]), ["Rest"])
+        test_router.record("Rest", 0.5, False)
+        test_router.record("GraphQL", 0.1, False)
+        self.assertEqual(test_router.route("title"), ["GraphQL", "Rest"])
+        for _ in range(router.FAILURES):
+            test_router.record("GraphQL", 0.1, True)
+        self.assertTrue(test_router.stats()["GraphQL"]["degraded"])
+        self.assertEqual(test_router.route("title"), ["Rest", "GraphQL"])
+        test_router.record("GraphQL", 0.1, False)
+        self.assertFalse(test_router.stats()["GraphQL"]["degraded"])
+
+    @responses.activate
+    def test_same_shape(self):
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", json=REST_TITLE)
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=GRAPHQL_TITLE)
+        api = IMDbAPI("auto")
+        from_rest = api.getMovie("tt0477051")
+        ROUTER.record("Rest", 10, False)
+        from_graphql = api.getMovie("tt0477051")
+        self.assertEqual([call.request.method for call in responses.calls], ["GET", "POST"])
+        self.assertEqual(from_rest, from_graphql)
+        self.assertEqual(list(from_rest), router.TITLE_FIELDS)
+        self.assertEqual(api.getMovie("tt0477051", fields=["rating"]), {"rating": REST_TITLE["rating"]})
+
+    @responses.activate
+    def test_failover(self):
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", status=503)
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=GRAPHQL_TITLE)
+        api = IMDbAPI("auto")
+        self.assertEqual(api.getMovie("tt0477051")["primary_title"], "Norbit")
+        stats = api.routerStats()
+        self.assertEqual(stats["Rest"]["failures"], 1)
+        self.assertEqual(stats["GraphQL"]["calls"], 1)
+        # Subselections have nowhere to fall over to.
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051/credits", status=503)
+        with self.assertRaises(HTTPError):
+            api.getMovie("tt0477051", "credits")
+
+    @responses.activate
+    def test_graphql_error_failover(self):
+        """GraphQL errors other than a missing ID fall over to Rest."""
+        responses.add(
+            responses.POST,
+            GraphQL.API_ENDPOINT,
+            json={"errors": [{"message": "Internal server error"}], "data": {"title": None}},
+        )
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", json=REST_TITLE)
+        # Rest is degraded, so GraphQL is tried first.
+        for _ in range(router.FAILURES):
+            ROUTER.record("Rest", 0.1, True)
+        self.assertEqual(IMDbAPI("auto").getMovie("tt0477051")["primary_title"], "Norbit")
+        self.assertEqual(ROUTER.stats()["GraphQL"]["failures"], 1)
+
+    @responses.activate
+    def test_not_found_is_not_retried(self):
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0000404", status=404, json={"message": "Not found"})
+        with self.assertRaises(NotFound):
+            IMDbAPI("auto").getMovie("tt0000404")
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(ROUTER.stats()["Rest"]["failures"], 0)
+
+    @responses.activate
+    def test_update(self):
+        credits = {"credits": [{"name": {"id": "nm0000552"}, "category": "ACTOR"}]}
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051/credits", json=credits)
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", status=503)
+        responses.add(responses.POST, GraphQL.API_ENDPOINT, body=GRAPHQL_TITLE)
+        api = IMDbAPI("auto")
+        movie = api.updateMovie({"id": "tt0477051"}, "credits")
+        self.assertEqual(movie["credits"], credits["credits"])
+        # Without a subselection the update is routed, and falls over like `getMovie`.
+        for _ in range(router.FAILURES):
+            ROUTER.record("GraphQL", 0.1, True)
+        movie = api.updateMovie(movie)
+        self.assertEqual(movie["primary_title"], "Norbit")
+        self.assertIn("credits", movie)
+        self.assertEqual(api.routerStats()["Rest"]["failures"], 1)
+        with self.assertRaises(ValueError):
+            api.updatePerson({"display_name": "Eddie Murphy"}, "known_for")
+        with self.assertRaises(NotImplementedError):
+            IMDbAPI("GraphQL").updateMovie({"id": "tt0477051"}, "credits")
+
+    @responses.activate
+    def test_cache_hits_not_sampled(self):
+        """Routing follows the upstream latency, not which API has the lookup cached."""
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", json=REST_TITLE)
+        Rest.getMovie("tt0477051")
+        ROUTER.record("Rest", 0.5, False)
+        ROUTER.record("GraphQL", 0.6, False)
+        # Rest has the movie cached, GraphQL does not: the hits leave the latency of Rest alone.
+        api = IMDbAPI("auto")
+        for _ in range(10):
+            self.assertEqual(api.getMovie("tt0477051")["primary_title"], "Norbit")
+        stats = ROUTER.stats()
+        self.assertEqual((stats["Rest"]["calls"], stats["Rest"]["latency"]), (1, 0.5))
+        self.assertEqual(len(responses.calls), 1)
+        # Once GraphQL answers faster upstream, it is preferred.
+        for _ in range(5):
+            ROUTER.record("GraphQL", 0.1, False)
+        self.assertEqual(ROUTER.route("title"), ["GraphQL", "Rest"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import asyncio, responses, threading, time, unittest
+from SimpleIMDbDev import IMDbAPI, Rest, transport
+from SimpleIMDbDev.cache import CACHE
+from SimpleIMDbDev.scheduler import Scheduler, priority
+
+
+def _queued(scheduler, name, count):
+    """Wait until `count` requests of a class are queued."""
+    deadline = time.monotonic() + 5
+    while scheduler.stats()[name]["queued"] < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def _start(scheduler, name, order):
+    def run():
+        with scheduler.slot(name):
+            order.append(name)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for the priority scheduler of upstream requests.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        transport.schedule(0)
+        CACHE.clear()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            Scheduler("8")  # type: ignore
+        with self.assertRaises(TypeError):
+            Scheduler(preemptible="bulk")  # type: ignore
+        with self.assertRaises(ValueError):
+            Scheduler(1, reserve=-1)
+        with self.assertRaises(ValueError):
+            Scheduler(weights={"a": 1}, preemptible=("b",))
+        with self.assertRaises(TypeError):
+            IMDbAPI("Rest", priority=1)  # type: ignore
+        with self.assertRaises(ValueError):
+            Scheduler().acquire("unknown")
+
+    def test_weighted_fair_queuing(self):
+        scheduler = Scheduler(1, weights={"a": 3, "b": 1}, preemptible=(), reserve=0)
+        order = []
+        scheduler.acquire("a")
+        threads = []
+        for index in range(6):
+            threads.append(_start(scheduler, "a", order))
+            _queued(scheduler, "a", index + 1)
+        for index in range(2):
+            threads.append(_start(scheduler, "b", order))
+            _queued(scheduler, "b", index + 1)
+        scheduler.release("a")
+        for thread in threads:
+            thread.join()
+        # Three of a for each b while both are waiting.
+        self.assertEqual(order[:4].count("b"), 1)
+        self.assertEqual(order[4:].count("b"), 1)
+        stats = scheduler.stats()
+        self.assertEqual(stats["a"]["requests"], 7)
+        self.assertEqual(stats["a"]["max_queued"], 6)
+        self.assertGreater(stats["b"]["max_wait_seconds"], 0)
+
+    def test_preemptible(self):
+        scheduler = Scheduler(2, reserve=1)
+        order = []
+        scheduler.acquire("bulk")
+        # The reserved slot is left to the other classes.
+        waiting = _start(scheduler, "bulk", order)
+        _queued(scheduler, "bulk", 1)
+        scheduler.acquire("interactive")
+        self.assertEqual(scheduler.stats()["bulk"]["queued"], 1)
+        # Bulk is held back while interactive requests wait.
+        other = _start(scheduler, "interactive", order)
+        _queued(scheduler, "interactive", 1)
+        scheduler.release("bulk")
+        other.join()
+        scheduler.release("interactive")
+        waiting.join()
+        self.assertEqual(order, ["interactive", "bulk"])
+        self.assertGreaterEqual(scheduler.stats()["bulk"]["preempted"], 1)
+
+    def test_rate(self):
+        scheduler = Scheduler(4, rate=50)
+        start = time.monotonic()
+        for _ in range(5):
+            with scheduler.slot("default"):
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.07)
+
+    def test_async(self):
+        scheduler = Scheduler(1)
+
+        async def run():
+            async with scheduler.aslot("interactive"):
+                task = asyncio.create_task(scheduler.aacquire("bulk"))
+                await asyncio.sleep(0.01)
+                self.assertFalse(task.done())
+            await task
+            scheduler.release("bulk")
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.stats()["bulk"]["requests"], 1)
+
+    @responses.activate
+    def test_api(self):
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", json={"id": "tt0477051"})
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0119094", json={"id": "tt0119094"})
+        self.assertEqual(IMDbAPI("Rest").schedulerStats(), {})
+        transport.schedule(concurrency=2)
+        IMDbAPI("Rest", priority="interactive").getMovie("tt0477051")
+        with priority("bulk"):
+            list(IMDbAPI("Rest").getMovies(["tt0119094"]))
+        stats = IMDbAPI("Rest").schedulerStats()
+        self.assertEqual(stats["interactive"]["requests"], 1)
+        self.assertEqual(stats["bulk"]["requests"], 1)
+        self.assertEqual(stats["default"]["requests"], 0)
+        with self.assertRaises(ValueError):
+            IMDbAPI("Rest", priority="unknown").getMovie("tt0000001")
+
+    @responses.activate
+    def test_stream(self):
+        """A stream gives back its slot and breaker probe once the headers arrive."""
+        credits = {"credits": [{"name": {"id": "nm0000552"}}, {"name": {"id": "nm0000115"}}]}
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051/credits", json=credits)
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0119094", json={"id": "tt0119094"})
+        transport.schedule(concurrency=1)
+        transport.breakers(failures=1, cooldown=60)
+        try:
+            records = IMDbAPI("Rest").streamMovie("tt0477051", "credits")
+            self.assertEqual(next(records)["name"]["id"], "nm0000552")
+            self.assertEqual(IMDbAPI("Rest").schedulerStats()["default"]["active"], 0)
+            # The only slot is free for another request while the stream is open.
+            IMDbAPI("Rest").getMovie("tt0119094")
+            self.assertEqual(len(list(records)), 1)
+            self.assertEqual(IMDbAPI("Rest").circuitStats()["rest.titles"]["state"], "closed")
+        finally:
+            transport.breakers(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
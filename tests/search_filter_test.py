@@ -0,0 +1,121 @@
+import random, responses, unittest
+from unittest import mock
+from SimpleIMDbDev import Rest
+from SimpleIMDbDev.cache import CACHE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def title(id, start_year=None, votes=None, rating=None):
+    result = {"id": id, "start_year": start_year}
+    if votes is not None:
+        result["rating"] = {"votes_count": votes, "aggregate_rating": rating}
+    return result
+
+
+class TestFilterSearchResults(unittest.TestCase):
+    """Test cases for the batch search filter and ranking."""
+
+    candidates = [
+        [title("a", 2005, 10, 5.0), title("b", 2007, 100, 4.0), title("c"), title("d", 2007, 500, 7.0)],
+        [title("e", 1990), title("f", 2020, 3, 9.0)],
+        [],
+    ]
+
+    def ids(self, results):
+        return [[t["id"] for t in query] for query in results]
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            Rest.filterSearchResults([{}], [0])  # type: ignore
+        with self.assertRaises(TypeError):
+            Rest.filterSearchResults([[]], ["2007"])  # type: ignore
+        with self.assertRaises(ValueError):
+            Rest.filterSearchResults([[], []], [0])
+        with self.assertRaises(ValueError):
+            Rest.filterSearchResults([[]], [-1])
+
+    def test_filter_and_rank(self):
+        results = Rest.filterSearchResults(self.candidates, [2007, 0, 2000], 1)
+        self.assertEqual(self.ids(results), [["d", "b"], ["f", "e"], []])
+        results = Rest.filterSearchResults(self.candidates, [2007, 0, 2000], 1, rank=False)
+        self.assertEqual(self.ids(results), [["b", "d"], ["e", "f"], []])
+        results = Rest.filterSearchResults(self.candidates, [2007, 2020, 0], -1)
+        self.assertEqual(self.ids(results), [["d", "b", "c", "a"], ["f", "e"], []])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_columns_match_dicts(self):
+        generator = random.Random(7)
+        candidates = [
+            [
+                title(f"{q}-{i}", generator.choice([None, *range(1990, 2010)]),
+                      generator.choice([None, 0, 10, 100, 100]), generator.choice([None, 5.5, 8.0]))
+                for i in range(generator.randrange(0, 40))
+            ]
+            for q in range(50)
+        ]
+        years = [generator.choice([0, 1995, 2000, 2005]) for _ in candidates]
+        titles = [t for query in candidates for t in query]
+        query_index = numpy.repeat(numpy.arange(len(candidates)), [len(query) for query in candidates])
+        start_year = [numpy.nan if t["start_year"] is None else t["start_year"] for t in titles]
+        votes = [(t.get("rating") or {}).get("votes_count", numpy.nan) for t in titles]
+        rating = [(t.get("rating") or {}).get("aggregate_rating") or numpy.nan for t in titles]
+        for difference in [-1, 0, 3]:
+            for rank in [True, False]:
+                expected = [t["id"] for query in Rest.filterSearchResults(candidates, years, difference, rank) for t in query]
+                order = Rest.rankSearchColumns(query_index, start_year, votes, rating, years, difference, rank)
+                self.assertEqual([titles[i]["id"] for i in order], expected)
+        with self.assertRaises(ValueError):
+            Rest.rankSearchColumns([0, 0], [2000], [1], [1], [0])
+
+    def test_without_numpy(self):
+        """The Python loop keeps the same rules as the dict filter, with None or NaN for missing values."""
+        generator = random.Random(11)
+        candidates = [
+            [
+                title(f"{q}-{i}", generator.choice([None, *range(1990, 2010)]),
+                      generator.choice([None, 0, 10, 100]), generator.choice([None, 5.5, 8.0]))
+                for i in range(generator.randrange(0, 30))
+            ]
+            for q in range(40)
+        ]
+        years = [generator.choice([0, 1995, 2000, 2005]) for _ in candidates]
+        titles = [t for query in candidates for t in query]
+        query_index = [q for q, query in enumerate(candidates) for _ in query]
+        start_year = [t["start_year"] for t in titles]
+        votes = [(t.get("rating") or {}).get("votes_count") for t in titles]
+        rating = [(t.get("rating") or {}).get("aggregate_rating") for t in titles]
+        with mock.patch.object(Rest, "numpy", None):
+            for difference in [-1, 0, 3]:
+                for rank in [True, False]:
+                    results = Rest.filterSearchResults(candidates, years, difference, rank)
+                    order = Rest.rankSearchColumns(query_index, start_year, votes, rating, years, difference, rank)
+                    expected = [t["id"] for query in results for t in query]
+                    self.assertEqual([titles[i]["id"] for i in order], expected)
+            order = Rest.rankSearchColumns([0, 0, 1], [2001, None, float("nan")], [1, 2, 3], [1, 1, 1], [0, 2000])
+        self.assertEqual(order, [1, 0])
+
+    @responses.activate
+    def test_search_cached(self):
+        """Search replies are kept in the response cache, each call gets its own list."""
+        CACHE.clear()
+        self.addCleanup(CACHE.clear)
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/search/titles",
+            json={"titles": [title("tt0477051", 2007, 10, 4.2), title("tt0000001", 1990)]},
+        )
+        first = Rest.searchMovie("Norbit", 2007)
+        first.clear()
+        second = Rest.searchMovie("Norbit", 2007)
+        self.assertEqual([t["id"] for t in second], ["tt0477051"])
+        self.assertEqual(len(responses.calls), 1)
+        self.assertIn("query=Norbit+%282007%29", responses.calls[0].request.url)
+
+
+if __name__ == "__main__":
+    unittest.main()
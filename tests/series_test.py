@@ -0,0 +1,122 @@
+import responses, unittest
+from responses import matchers
+from requests.exceptions import HTTPError
+from SimpleIMDbDev import IMDbAPI, Rest, transport
+from SimpleIMDbDev.cache import CACHE, NotFound
+from SimpleIMDbDev.scheduler import priority
+
+SERIES = f"{Rest.BASE_URL}/v2/titles/tt0903747"
+
+
+def _episode(season: str, number: int) -> dict:
+    return {"id": f"tt{9000000 + int(season) * 100 + number}", "season": season, "episode_number": number}
+
+
+class TestSeries(unittest.TestCase):
+    """Test cases for the series traversal.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+
+    def tearDown(self):
+        CACHE.clear()
+
+    def _listings(self):
+        responses.add(
+            responses.GET,
+            f"{SERIES}/seasons",
+            json={"seasons": [{"season": "1", "episode_count": 3}, {"season": "2", "episode_count": 1}]},
+        )
+        responses.add(
+            responses.GET,
+            f"{SERIES}/episodes",
+            match=[matchers.query_param_matcher({"season": "1"})],
+            json={"episodes": [_episode("1", 1), _episode("1", 2)], "next_page_token": "page2"},
+        )
+        responses.add(
+            responses.GET,
+            f"{SERIES}/episodes",
+            match=[matchers.query_param_matcher({"season": "1", "page_token": "page2"})],
+            json={"episodes": [_episode("1", 3)], "next_page_token": ""},
+        )
+        responses.add(
+            responses.GET,
+            f"{SERIES}/episodes",
+            match=[matchers.query_param_matcher({"season": "2"})],
+            json={"episodes": [_episode("2", 1)]},
+        )
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(NotImplementedError):
+            IMDbAPI("GraphQL").getSeries("tt0903747")
+        with self.assertRaises(TypeError):
+            IMDbAPI("Rest").getSeries("tt0903747", details="yes")  # type: ignore
+        with self.assertRaises(ValueError):
+            IMDbAPI("Rest").getSeries("tt0903747", workers=0)
+        with self.assertRaises(ValueError):
+            IMDbAPI("Rest").getSeries("bad")
+        with self.assertRaises(TypeError):
+            Rest.getEpisodes("tt0903747", 1)  # type: ignore
+
+    @responses.activate
+    def test_listing(self):
+        self._listings()
+        seasons = list(IMDbAPI("Rest").getSeries("903747", details=False))
+        self.assertEqual([season for season, _ in seasons], ["1", "2"])
+        self.assertEqual([id for id, _ in seasons[0][1]], ["tt9000101", "tt9000102", "tt9000103"])
+        self.assertEqual(seasons[1][1][0][1]["episode_number"], 1)
+
+    @responses.activate
+    def test_details(self):
+        self._listings()
+        for season, count in [("1", 3), ("2", 1)]:
+            for number in range(1, count + 1):
+                episode = _episode(season, number)
+                status = 404 if episode["id"] == "tt9000102" else 200
+                responses.add(
+                    responses.GET,
+                    f"{Rest.BASE_URL}/v2/titles/{episode['id']}",
+                    status=status,
+                    json={"id": episode["id"], "type": "tvEpisode"},
+                )
+        api = IMDbAPI("Rest")
+        seasons = dict(api.getSeries("tt0903747", workers=2))
+        first, missing, third = seasons["1"]
+        self.assertEqual(first[1], {"id": "tt9000101", "type": "tvEpisode", "season": "1", "episode_number": 1})
+        self.assertIsInstance(missing[1], NotFound)
+        self.assertEqual(third[0], "tt9000103")
+        calls = len(responses.calls)
+        self.assertEqual(calls, 4 + 4)
+        # Listings and episodes are cached.
+        list(api.getSeries("tt0903747"))
+        self.assertEqual(len(responses.calls), calls)
+
+    @responses.activate
+    def test_priority(self):
+        """The listings on the pool are sent as the caller's priority class."""
+        self._listings()
+        transport.schedule(concurrency=2)
+        try:
+            with priority("bulk"):
+                list(IMDbAPI("Rest").getSeries("tt0903747", details=False))
+            stats = IMDbAPI("Rest").schedulerStats()
+        finally:
+            transport.schedule(0)
+        self.assertEqual(stats["bulk"]["requests"], 4)
+        self.assertEqual(stats["default"]["requests"], 0)
+
+    @responses.activate
+    def test_errors(self):
+        responses.add(responses.GET, f"{SERIES}/seasons", status=404, json={"message": "Not found"})
+        with self.assertRaises(NotFound):
+            list(IMDbAPI("Rest").getSeries("tt0903747"))
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0000001/seasons", json={"seasons": [{"season": "1"}]})
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0000001/episodes", status=500)
+        with self.assertRaises(HTTPError):
+            list(IMDbAPI("Rest").getSeries("tt0000001"))
+
+
+if __name__ == "__main__":
+    unittest.main()
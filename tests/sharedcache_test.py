@@ -0,0 +1,107 @@
+import multiprocessing, os, tempfile, unittest
+from SimpleIMDbDev.cache import CacheEntry, NotFound, ResponseCache
+
+try:
+    from SimpleIMDbDev.sharedcache import SharedMemoryBackend
+except ImportError:
+    SharedMemoryBackend = None
+
+
+def _load_in_child(path, queue):
+    """Look up a key in a new process, the loader must not run as the parent stored it."""
+    cache = ResponseCache(ttl=60, backend=SharedMemoryBackend(path, buckets=64, arena_size=4096))
+
+    def loader(entry):
+        raise AssertionError("The entry was not shared.")
+
+    queue.put((cache.get_or_load("title/tt0477051", loader), cache.stats()["shared_hits"]))
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "Requires fcntl and fork.")
+class TestSharedMemoryBackend(unittest.TestCase):
+    """Test cases for the cache tier shared between processes."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache")
+        self.backend = SharedMemoryBackend(self.path, buckets=64, arena_size=4096)
+        self.addCleanup(self.backend.close)
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            SharedMemoryBackend("")
+        with self.assertRaises(TypeError):
+            SharedMemoryBackend(self.path, buckets="64")  # type: ignore
+        with self.assertRaises(ValueError):
+            SharedMemoryBackend(self.path, arena_size=0)
+        with self.assertRaises(TypeError):
+            ResponseCache(backend={})  # type: ignore
+
+    def test_get_set(self):
+        self.assertIsNone(self.backend.get("key"))
+        self.backend.set("key", "value", 0)
+        self.backend.set("other", "other value", 0)
+        self.backend.set("key", "new value", 0)
+        self.assertEqual(self.backend.get("key"), "new value")
+        self.assertEqual(self.backend.get_many(["other", "missing"]), ["other value", None])
+        self.backend.set("expired", "value", -1)
+        self.assertIsNone(self.backend.get("expired"))
+        self.backend.clear()
+        self.assertIsNone(self.backend.get("key"))
+
+    def test_shared_between_opens(self):
+        self.backend.set("key", "value", 0)
+        # The size of an existing file is kept.
+        other = SharedMemoryBackend(self.path, buckets=8, arena_size=8)
+        self.addCleanup(other.close)
+        self.assertEqual(other.buckets, 64)
+        self.assertEqual(other.get("key"), "value")
+
+    def test_full_arena_resets(self):
+        for n in range(100):
+            self.backend.set(f"key{n}", "x" * 100, 0)
+        self.assertEqual(self.backend.get("key99"), "x" * 100)
+        self.assertIsNone(self.backend.get("key0"))
+
+    def test_response_cache_across_processes(self):
+        cache = ResponseCache(ttl=60, backend=self.backend)
+        cache.get_or_load("title/tt0477051", lambda entry: CacheEntry({"id": "tt0477051"}, etag='"v1"'))
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(target=_load_in_child, args=(self.path, queue))
+        process.start()
+        value, shared_hits = queue.get(timeout=10)
+        process.join()
+        self.assertEqual(value, {"id": "tt0477051"})
+        self.assertEqual(shared_hits, 1)
+
+    def test_expired_shared_entry_revalidates(self):
+        ResponseCache(ttl=60, backend=self.backend).get_or_load(
+            "key", lambda entry: CacheEntry({"id": "tt0477051"}, etag='"v1"')
+        )
+        cache = ResponseCache(ttl=1e-9, backend=self.backend)
+        seen = []
+
+        def loader(entry):
+            seen.append(entry.etag)
+            return entry
+
+        self.assertEqual(cache.get_or_load("key", loader), {"id": "tt0477051"})
+        self.assertEqual(seen, ['"v1"'])
+        self.assertEqual(cache.stats()["revalidations"], 1)
+
+    def test_negative_entries_stay_local(self):
+        cache = ResponseCache(ttl=60, backend=self.backend)
+
+        def loader(entry):
+            raise NotFound("Not found")
+
+        with self.assertRaises(NotFound):
+            cache.get_or_load("missing", loader)
+        self.assertIsNone(self.backend.get("missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
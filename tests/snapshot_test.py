@@ -0,0 +1,92 @@
+import os, responses, tempfile, unittest
+from unittest import mock
+from SimpleIMDbDev import IMDbAPI
+from SimpleIMDbDev.cache import CACHE, CacheEntry, ResponseCache
+from SimpleIMDbDev.cli import main
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for cache snapshots.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "snapshot.jsonl")
+
+    def tearDown(self):
+        CACHE.clear()
+        self.directory.cleanup()
+
+    def test_invalid_types(self):
+        with self.assertRaises(TypeError):
+            IMDbAPI().warm(1)  # type: ignore
+        with self.assertRaises(TypeError):
+            IMDbAPI().export(None)  # type: ignore
+
+    def test_round_trip(self):
+        source = ResponseCache()
+        source.set("a", CacheEntry({"id": "tt0477051", "plot": 'He said, "value": no'}, etag='"1"'))
+        source.set("b", CacheEntry({"id": "nm0000115"}))
+        self.assertEqual(source.export(self.path), 2)
+
+        target = ResponseCache()
+        self.assertEqual(target.warm(self.path), 2)
+        self.assertEqual(len(target), 2)
+
+        def loader(entry):
+            self.fail("warm entries must not be fetched")
+
+        self.assertEqual(target.get_or_load("a", loader)["plot"], 'He said, "value": no')
+        self.assertEqual(target.get_or_load("b", loader), {"id": "nm0000115"})
+        self.assertEqual(target.stats()["hits"], 2)
+
+    def test_lazy_validation(self):
+        """Bad values are only found when used, they are then dropped as a miss."""
+        with open(self.path, "w") as file:
+            file.write('{"key": "bad", "stored": 0, "etag": "", "last_modified": "", "value": [1}\n')
+            file.write('{"value": {"id": "tt0477051"}, "key": "compact"}\n')
+        cache = ResponseCache()
+        self.assertEqual(cache.warm(self.path), 2)
+        self.assertEqual(cache.get_or_load("bad", lambda entry: CacheEntry({"id": "x"})), {"id": "x"})
+        self.assertEqual(cache.get_or_load("compact", lambda entry: None), {"id": "tt0477051"})
+        self.assertEqual(cache.stats()["invalid"], 1)
+
+        with open(self.path, "w") as file:
+            file.write("not json\n")
+        with self.assertRaises(ValueError):
+            cache.warm(self.path)
+
+    def test_expired_entries_revalidate(self):
+        """Old snapshot entries keep their validators."""
+        source = ResponseCache()
+        with mock.patch("SimpleIMDbDev.cache.time.time", return_value=1000):
+            source.set("a", CacheEntry({"id": "tt0477051"}, etag='"1"'))
+        source.export(self.path)
+        target = ResponseCache(ttl=60)
+        target.warm(self.path)
+        with open(self.path) as file:
+            self.assertIn('"etag": "\\"1\\""', file.read())
+        seen = []
+        self.assertEqual(target.get_or_load("a", lambda entry: seen.append(entry.etag) or entry), {"id": "tt0477051"})
+        self.assertEqual(seen, ['"1"'])
+
+    @responses.activate
+    def test_cli(self):
+        responses.add(
+            responses.GET,
+            "https://rest.imdbapi.dev/v2/titles/tt0477051",
+            json={"id": "tt0477051", "primary_title": "Norbit"},
+        )
+        self.assertEqual(main(["cache", "export", self.path, "--movie", "tt0477051"]), 0)
+        CACHE.clear()
+        merged = os.path.join(self.directory.name, "merged.jsonl")
+        self.assertEqual(main(["cache", "warm", self.path, "--export", merged]), 0)
+        self.assertEqual(IMDbAPI().getMovie("tt0477051")["primary_title"], "Norbit")
+        self.assertEqual(len(responses.calls), 1)
+        with open(merged) as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import gzip, responses, unittest, zlib
+from requests.exceptions import ContentDecodingError
+from SimpleIMDbDev import IMDbAPI, Rest, transport
+from SimpleIMDbDev.cache import CACHE
+
+TITLE = b'{"id": "tt0477051", "primary_title": "Norbit", "akas": [' + b'{"text": "Norbit"}, ' * 200 + b'{}]}'
+
+
+class TestTransport(unittest.TestCase):
+    """Test cases for the compressed transfer.
+    Fake the responses to avoid API call issues if a server is down."""
+
+    def setUp(self):
+        CACHE.clear()
+        transport.reset_traffic()
+
+    def tearDown(self):
+        CACHE.clear()
+        transport.compress()
+        transport.reset_traffic()
+
+    def test_invalid_types(self):
+        """Test for incorrect types."""
+        with self.assertRaises(TypeError):
+            transport.compress("gzip")  # type: ignore
+        with self.assertRaises(TypeError):
+            transport.compress([1])  # type: ignore
+        with self.assertRaises(ValueError):
+            transport.compress(["lzma"])
+
+    def test_negotiation(self):
+        self.assertEqual(transport.SESSION.headers["Accept-Encoding"], ", ".join(transport.DECODERS))
+        transport.compress(["gzip"])
+        self.assertEqual(transport.SESSION.headers["Accept-Encoding"], "gzip")
+        transport.compress([])
+        self.assertEqual(transport.SESSION.headers["Accept-Encoding"], "identity")
+
+    @responses.activate
+    def test_gzip(self):
+        body = gzip.compress(TITLE)
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/titles/tt0477051",
+            body=body,
+            headers={"Content-Encoding": "gzip"},
+            content_type="application/json",
+        )
+        self.assertEqual(IMDbAPI("Rest").getMovie("tt0477051")["primary_title"], "Norbit")
+        stats = IMDbAPI().trafficStats()["rest.titles"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["gzip_requests"], 1)
+        self.assertEqual(stats["wire_bytes"], len(body))
+        self.assertEqual(stats["decoded_bytes"], len(TITLE))
+        self.assertLess(stats["wire_bytes"], stats["decoded_bytes"])
+
+    @responses.activate
+    def test_identity_and_deflate(self):
+        responses.add(responses.GET, f"{Rest.BASE_URL}/v2/titles/tt0477051", body=TITLE)
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/names/nm0000552",
+            body=zlib.compress(b'{"id": "nm0000552", "display_name": "Eddie Murphy"}'),
+            headers={"Content-Encoding": "deflate"},
+        )
+        Rest.getMovie("tt0477051")
+        self.assertEqual(Rest.getPerson("nm0000552")["id"], "nm0000552")
+        stats = transport.traffic()
+        self.assertEqual(stats["rest.titles"]["wire_bytes"], stats["rest.titles"]["decoded_bytes"])
+        self.assertEqual(stats["rest.titles"]["identity_requests"], 1)
+        self.assertEqual(stats["rest.names"]["deflate_requests"], 1)
+
+    @responses.activate
+    def test_corrupt_body(self):
+        responses.add(
+            responses.GET,
+            f"{Rest.BASE_URL}/v2/titles/tt0477051",
+            body=b"not gzip",
+            headers={"Content-Encoding": "gzip"},
+        )
+        with self.assertRaises(ContentDecodingError):
+            Rest.getMovie("tt0477051")
+
+
+if __name__ == "__main__":
+    unittest.main()